@@ -0,0 +1,30 @@
+# Запуск из корня репозитория: python -m Benchmarks.AdaptiveWindowsBenchmark
+import os
+import tempfile
+from contextlib import redirect_stdout
+import pandas as pd
+from Benchmarks.HHServer import HHServer, GetRandomVacancies, GetEmptyCache
+from distributorVacancies import DistributorVacancies
+from harvestPolicy import TokenBucket
+
+
+def Harvest(vacancies, date, deltaTimeRange, adaptive):
+    with HHServer(vacancies) as server, open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        DistributorVacancies(8, server.url, TokenBucket(10 ** 4, 10 ** 4), responseCache=GetEmptyCache()).GetVacanciesCSV(date, deltaTimeRange,
+                                                                                           adaptive=adaptive)
+    with open("DistributorVacancies.csv", encoding="utf-8") as file:
+        return sum(1 for line in file) - 1, server.requestsCount
+
+
+if __name__ == "__main__":
+    os.chdir(tempfile.mkdtemp())
+    date = pd.Timestamp("2022-12-02")
+    days = {"Загруженный день": GetRandomVacancies(date.to_pydatetime(), 2000, 1) +
+            GetRandomVacancies(date.to_pydatetime(), 8000, 2, hours=(9, 18)),
+            "Тихий день": GetRandomVacancies(date.to_pydatetime(), 1500, 3)}
+    for dayTitle, vacancies in days.items():
+        print(f'{dayTitle}: {len(vacancies)} вакансий')
+        for title, deltaTimeRange, adaptive in [("4 равных окна", 4, False), ("24 равных окна", 24, False),
+                                                ("Адаптивное деление окон", 4, True)]:
+            rowsCount, requestsCount = Harvest(vacancies, date, deltaTimeRange, adaptive)
+            print(f'  {title}: получено вакансий {rowsCount}, запросов {requestsCount}')
@@ -0,0 +1,46 @@
+# Запуск из корня репозитория: python -m Benchmarks.CbrFetchBenchmark [задержка ответа в секундах]
+import csv
+import os
+import sys
+import tempfile
+import time
+from Benchmarks.CbrServer import CbrServer, GetRandomRates
+from currenciesParser import CurrenciesParser
+from ratesStore import RatesStore
+from responseCache import ResponseCache
+
+
+def CreateConversionTable(fileName, fetchThreadsCount, url, storeName, cacheName):
+    start = time.perf_counter()
+    conversionTable = CurrenciesParser(fileName, fetchThreadsCount=fetchThreadsCount, cbrUrl=url,
+                                       ratesStore=RatesStore(storeName),
+                                       responseCache=ResponseCache(cacheName)).conversionTable
+    return conversionTable, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    delay = float(sys.argv[1]) if len(sys.argv) > 1 else 0.05
+    os.chdir(tempfile.mkdtemp())
+    months = [f'{year}-{month:02d}' for year in range(2003, 2023) for month in range(1, 13)]
+    with open("vacancies.csv", "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["name", "salary_from", "salary_to", "salary_currency", "area_name", "published_at"])
+        for i in range(12000):
+            writer.writerow(["Программист", 1000, 2000, ["RUR", "USD"][i % 2], "Москва",
+                             f'{months[i % len(months)]}-15T10:00:00+0300'])
+    with CbrServer(GetRandomRates(months), delay) as server:
+        sequential, sequentialSeconds = CreateConversionTable("vacancies.csv", 1, server.url, "sequential.db",
+                                                              "sequentialResponses.db")
+        concurrent, concurrentSeconds = CreateConversionTable("vacancies.csv", 8, server.url, "concurrent.db",
+                                                              "concurrentResponses.db")
+        requestsCount = server.requestsCount
+        stored, storedSeconds = CreateConversionTable("vacancies.csv", 8, server.url, "concurrent.db",
+                                                      "concurrentResponses.db")
+        cached, cachedSeconds = CreateConversionTable("vacancies.csv", 8, server.url, "cached.db",
+                                                      "concurrentResponses.db")
+    isEqual = sequential.equals(concurrent) and concurrent.equals(stored) and stored.equals(cached)
+    print(f'Месяцев: {len(months)}, задержка ответа: {delay} с, таблицы совпадают: {isEqual}')
+    print(f'Последовательно: {sequentialSeconds:.2f} с, 8 потоков: {concurrentSeconds:.2f} с, '
+          f'повторный запуск из хранилища курсов: {storedSeconds:.2f} с, '
+          f'с пустым хранилищем курсов из кэша ответов: {cachedSeconds:.2f} с '
+          f'(запросов к серверу: {server.requestsCount - requestsCount})')
@@ -0,0 +1,76 @@
+import hashlib
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+nominals = {"USD": 1, "EUR": 1, "KZT": 100, "UAH": 10, "BYR": 1000}
+
+
+def GetDailyXml(date, rates):
+    valutes = "".join(f'<Valute ID="R{i:05d}"><NumCode>{i:03d}</NumCode><CharCode>{charCode}</CharCode>'
+                      f'<Nominal>{nominal}</Nominal><Name>{charCode}</Name>'
+                      f'<Value>{str(value).replace(".", ",")}</Value></Valute>'
+                      for i, (charCode, (nominal, value)) in enumerate(rates.items()))
+    xml = f'<?xml version="1.0" encoding="windows-1251"?><ValCurs Date="{date.replace("/", ".")}" ' \
+          f'name="Foreign Currency Market">{valutes}</ValCurs>'
+    return xml.encode("windows-1251")
+
+
+def GetRandomRates(months, seed=0):
+    rand = random.Random(seed)
+    return {f'01/{month[5:7]}/{month[0:4]}': {charCode: (nominal, round(rand.uniform(1, 100), 4))
+                                             for charCode, nominal in nominals.items()} for month in months}
+
+
+class CbrServer:
+    """
+    Локальная замена сервера ЦБ РФ: отдает XML_daily.asp с заранее записанными курсами
+    для запрошенной даты (date_req) и может задерживать каждый ответ, имитируя сетевую задержку.
+    Отдает ETag и отвечает 304 на условный запрос (If-None-Match) с тем же ETag
+    """
+
+    def __init__(self, ratesByDate, delay=0):
+        self.ratesByDate = ratesByDate
+        self.delay = delay
+        self.requestsCount = 0
+        self.notModifiedCount = 0
+
+    def __enter__(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                time.sleep(server.delay)
+                server.requestsCount += 1
+                date = parse_qs(urlparse(self.path).query)["date_req"][0][0:10]
+                body = GetDailyXml(date, server.ratesByDate.get(date, {}))
+                etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+                if self.headers.get("If-None-Match") == etag:
+                    server.notModifiedCount += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Type", "application/xml; charset=windows-1251")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpServer = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f'http://127.0.0.1:{self.httpServer.server_port}/scripts/XML_daily.asp'
+        threading.Thread(target=self.httpServer.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpServer.shutdown()
+        self.httpServer.server_close()
@@ -0,0 +1,39 @@
+# Запуск из корня репозитория: python -m Benchmarks.ColumnarSplitBenchmark [количество строк]
+import os
+import sys
+import tempfile
+import time
+from Benchmarks.SyntheticData import WriteConvertedCSV
+from DynamicsCalculator import Calculator
+from Splitter import Splitter
+
+
+def ReadDynamics(splitter):
+    calculator = Calculator("Программист", "Москва")
+    start = time.perf_counter()
+    result = [calculator.GetDynamicsByYear(splitter.GetFileName(year), year) for year in sorted(splitter.years)]
+    return result, time.perf_counter() - start
+
+
+def GetSize(splitter):
+    return sum(os.path.getsize(splitter.GetFileName(year)) for year in splitter.years) / 2 ** 20
+
+
+if __name__ == "__main__":
+    rowsCount = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    fileName = os.path.join(tempfile.mkdtemp(), "converted.csv")
+    WriteConvertedCSV(fileName, rowsCount)
+    print(f'Строк: {rowsCount}, размер файла: {os.path.getsize(fileName) / 2 ** 20:.0f} МБ')
+    expected = None
+    for outputFormat in ["csv", "parquet", "feather"]:
+        start = time.perf_counter()
+        try:
+            splitter = Splitter(fileName, tempfile.mkdtemp(), "DataByYear", outputFormat=outputFormat)
+        except ImportError as error:
+            print(f'{outputFormat}: пропущен ({error})')
+            continue
+        splitSeconds = time.perf_counter() - start
+        result, readSeconds = ReadDynamics(splitter)
+        expected = expected or result
+        print(f'{outputFormat}: разбиение {splitSeconds:.2f} с, размер {GetSize(splitter):.0f} МБ, '
+              f'чтение динамики по годам {readSeconds:.2f} с, результаты совпадают: {result == expected}')
@@ -0,0 +1,35 @@
+# Запуск из корня репозитория: python -m Benchmarks.ConvertToRubBenchmark [количество строк]
+import csv
+import os
+import sys
+import tempfile
+import time
+from Benchmarks.CbrServer import CbrServer, GetRandomRates
+from currenciesParser import CurrenciesParser
+
+
+def ConvertToRub(fileName, url, useDataBase):
+    parser = CurrenciesParser(fileName, useDataBase=useDataBase, cbrUrl=url)
+    start = time.perf_counter()
+    parser.ConvertToRub("df")
+    seconds = time.perf_counter() - start
+    with open("ConvertedVacancies.csv", "rb") as file:
+        return file.read(), seconds
+
+
+if __name__ == "__main__":
+    rowsCount = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    os.chdir(tempfile.mkdtemp())
+    months = [f'{year}-{month:02d}' for year in range(2003, 2023) for month in range(1, 13)]
+    with open("vacancies.csv", "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["name", "salary_from", "salary_to", "salary_currency", "area_name", "published_at"])
+        for i in range(rowsCount):
+            writer.writerow(["Программист", 1000 + i % 997 if i % 7 else "", 2000 + i % 991,
+                             ["RUR", "USD", "EUR", "KZT"][i % 4], "Москва",
+                             f'{months[i % len(months)]}-15T10:00:00+0300'])
+    with CbrServer(GetRandomRates(months)) as server:
+        dataBase, dataBaseSeconds = ConvertToRub("vacancies.csv", server.url, True)
+        vectorized, vectorizedSeconds = ConvertToRub("vacancies.csv", server.url, False)
+    print(f'Строк: {rowsCount}, ConvertedVacancies.csv совпадает побайтно: {dataBase == vectorized}')
+    print(f'Построчно через SQLite: {dataBaseSeconds:.2f} с, векторно: {vectorizedSeconds:.2f} с')
@@ -0,0 +1,40 @@
+# Запуск из корня репозитория: python -m Benchmarks.DatasetCacheBenchmark [количество строк]
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from Benchmarks.SyntheticData import WriteStatisticsCSV, WriteTableCSV
+from TableTask import DataSet
+from VacanciesStatistics import StreamingDataSet
+
+
+def ReadTable(fileName, useCache):
+    inputData = SimpleNamespace(fileName=fileName, filterParameter="", sortParameter="",
+                                isReverseSort=False, Initialize=lambda vacancies: None, topCount=None)
+    start = time.perf_counter()
+    vacancies = DataSet(inputData, useCache=useCache).vacanciesObjects
+    return [vacancy.description for vacancy in vacancies], time.perf_counter() - start
+
+
+def ReadStatistics(fileName, useCache):
+    start = time.perf_counter()
+    dataSet = StreamingDataSet(fileName, "Программист", useCache=useCache)
+    return list(dataSet.salariesByArea.items()), time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rowsCount = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    os.environ["VACANCIES_CACHE_DIR"] = tempfile.mkdtemp()
+    tableFileName = os.path.join(tempfile.mkdtemp(), "table.csv")
+    statisticsFileName = os.path.join(tempfile.mkdtemp(), "statistics.csv")
+    WriteTableCSV(tableFileName, rowsCount)
+    WriteStatisticsCSV(statisticsFileName, rowsCount * 10)
+    for title, read, fileName in [("TableTask", ReadTable, tableFileName),
+                                  ("StreamingDataSet", ReadStatistics, statisticsFileName)]:
+        plain, plainSeconds = read(fileName, False)
+        miss, missSeconds = read(fileName, True)
+        hit, hitSeconds = read(fileName, True)
+        print(f'{title}: результаты совпадают: {plain == miss == hit}')
+        print(f'  Без кэша: {plainSeconds:.2f} с, промах (с сохранением): {missSeconds:.2f} с, '
+              f'попадание: {hitSeconds:.2f} с')
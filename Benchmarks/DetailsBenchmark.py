@@ -0,0 +1,37 @@
+# Запуск из корня репозитория: python -m Benchmarks.DetailsBenchmark [задержка ответа в секундах] [потоки]
+import io
+import os
+import csv
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+import pandas as pd
+from Benchmarks.HHServer import HHServer, GetRandomVacancies
+from distributorVacancies import DistributorVacancies
+from harvestPolicy import TokenBucket
+from responseCache import ResponseCache
+
+
+def Harvest(url, date, concurrency, responseCache):
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        DistributorVacancies(concurrency, url, TokenBucket(10 ** 4, 10 ** 4),
+                             responseCache=responseCache).GetVacanciesCSV(date, 4, withDetails=True)
+    with open("DistributorVacancies.csv", encoding="utf-8") as file:
+        return file.read(), time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    delay = float(sys.argv[1]) if len(sys.argv) > 1 else 0.02
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    os.chdir(tempfile.mkdtemp())
+    date = pd.Timestamp("2022-12-02")
+    with HHServer(GetRandomVacancies(date.to_pydatetime(), 1000), delay) as server:
+        sequential, sequentialSeconds = Harvest(server.url, date, 1, ResponseCache("sequential.db"))
+        concurrent, concurrentSeconds = Harvest(server.url, date, concurrency, ResponseCache("concurrent.db"))
+        cached, cachedSeconds = Harvest(server.url, date, concurrency, ResponseCache("concurrent.db"))
+    print(f'Вакансий с подробностями: {len(list(csv.reader(io.StringIO(sequential)))) - 1}, задержка ответа: {delay} с, '
+          f'результаты совпадают: {sequential == concurrent == cached}')
+    print(f'Последовательно: {sequentialSeconds:.2f} с, {concurrency} потоков: {concurrentSeconds:.2f} с, '
+          f'повторно из кэша ответов: {cachedSeconds:.2f} с')
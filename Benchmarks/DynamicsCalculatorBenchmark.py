@@ -0,0 +1,45 @@
+# Запуск из корня репозитория: python -m Benchmarks.DynamicsCalculatorBenchmark [количество строк]
+import os
+import sys
+import tempfile
+import time
+import pandas as pd
+from Benchmarks.SyntheticData import WriteConvertedCSV
+from DynamicsCalculator import Calculator
+from Splitter import Splitter
+
+queries = [("Программист", "Москва"), ("Аналитик", "Москва"), ("Программист", "Казань")]
+
+
+def GetDynamicsTwoReads(vacancyName, areaName, fileName, year):
+    generalDf = pd.read_csv(fileName)
+    generalDf = generalDf[generalDf["area_name"] == areaName]
+    dfByParameters = pd.read_csv(fileName)
+    dfByParameters = dfByParameters[dfByParameters["area_name"] == areaName]
+    dfByParameters = dfByParameters[dfByParameters["name"].str.contains(vacancyName)]
+    return (year, int(generalDf["salary"].mean()) if len(generalDf) > 0 else 0, len(generalDf),
+            int(dfByParameters["salary"].mean()) if len(dfByParameters) > 0 else 0, len(dfByParameters))
+
+
+def GetDynamicsOneRead(vacancyName, areaName, fileName, year):
+    return Calculator(vacancyName, areaName).GetDynamicsByYear(fileName, year)
+
+
+def RunQueries(getDynamics, splitter):
+    start = time.perf_counter()
+    results = [[getDynamics(vacancyName, areaName, splitter.GetFileName(year), year) for year in splitter.years]
+               for vacancyName, areaName in queries]
+    return results, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rowsCount = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    fileName = os.path.join(tempfile.mkdtemp(), "converted.csv")
+    WriteConvertedCSV(fileName, rowsCount)
+    splitter = Splitter(fileName, tempfile.mkdtemp(), "DataByYear")
+    twoReads, twoReadsSeconds = RunQueries(GetDynamicsTwoReads, splitter)
+    onceRead, onceReadSeconds = RunQueries(GetDynamicsOneRead, splitter)
+    print(f'Строк: {rowsCount}, запросов (профессия, регион): {len(queries)}, '
+          f'результаты совпадают: {twoReads == onceRead}')
+    print(f'Два чтения каждого года на запрос: {twoReadsSeconds:.2f} с, '
+          f'одно чтение года с кэшем разделов: {onceReadSeconds:.2f} с')
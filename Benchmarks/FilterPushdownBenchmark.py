@@ -0,0 +1,46 @@
+# Запуск из корня репозитория: python -m Benchmarks.FilterPushdownBenchmark [количество строк]
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from Benchmarks.SyntheticData import WriteTableCSV
+from TableTask import DataSet
+
+filterFuncsBefore = {"Компания": lambda expectedEmployer, vacancy: expectedEmployer == vacancy.employerName,
+                     "Название региона": lambda expectedArea, vacancy: expectedArea == vacancy.areaName}
+
+
+def SortThenFilter(fileName, filterParameter, sortParameter):
+    inputData = SimpleNamespace(fileName=fileName, filterParameter="", sortParameter=sortParameter,
+                                isReverseSort=False, Initialize=lambda vacancies: None, topCount=None)
+    vacancies = DataSet(inputData).vacanciesObjects
+    return [vacancy for vacancy in vacancies if filterFuncsBefore[filterParameter[0]](filterParameter[1], vacancy)]
+
+
+def FilterThenSort(fileName, filterParameter, sortParameter):
+    inputData = SimpleNamespace(fileName=fileName, filterParameter=filterParameter, sortParameter=sortParameter,
+                                isReverseSort=False, Initialize=lambda vacancies: None, topCount=None)
+    return DataSet(inputData).vacanciesObjects
+
+
+def Describe(vacancies):
+    return [(vacancy.name, vacancy.employerName, vacancy.salary.Format(), vacancy.publishedAt) for vacancy in vacancies]
+
+
+def Seconds(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rowsCount = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    fileName = os.path.join(tempfile.mkdtemp(), "vacancies.csv")
+    WriteTableCSV(fileName, rowsCount)
+    for filterParameter in [["Компания", "Компания 5"], ["Название региона", "Москва"]]:
+        before, beforeSeconds = Seconds(SortThenFilter, fileName, filterParameter, "Оклад")
+        after, afterSeconds = Seconds(FilterThenSort, fileName, filterParameter, "Оклад")
+        same = Describe(before) == Describe(after)
+        print(f'Фильтр "{": ".join(filterParameter)}" ({len(after)} из {rowsCount} строк): '
+              f'{beforeSeconds:.2f} с -> {afterSeconds:.2f} с, совпадает: {same}')
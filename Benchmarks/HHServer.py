@@ -0,0 +1,132 @@
+import json
+import math
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import deque
+from datetime import timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from Benchmarks.SyntheticData import names, areas, currencies, skills, experiences, employers, paragraph
+from responseCache import ResponseCache
+
+
+def GetRandomVacancies(date, count, seed=0, hours=(0, 24)):
+    rand = random.Random(seed)
+    vacancies = []
+    for i in range(count):
+        publishedAt = date + timedelta(seconds=rand.randrange(hours[0] * 60 * 60, hours[1] * 60 * 60))
+        salaryFrom = rand.choice([None, rand.randrange(10000, 200000, 500)])
+        salary = rand.choice([None, {"from": salaryFrom, "to": rand.choice([None, (salaryFrom or 10000) + 50000]),
+                                     "currency": rand.choice(currencies), "gross": rand.choice([True, False])}])
+        vacancies.append({"id": str(seed * 10 ** 7 + i), "name": rand.choice(names), "salary": salary,
+                          "area": {"name": rand.choice(areas)},
+                          "published_at": publishedAt.strftime("%Y-%m-%dT%H:%M:%S+0300")})
+    vacancies.sort(key=lambda vacancy: (vacancy["published_at"], vacancy["id"]), reverse=True)
+    return vacancies
+
+
+def GetEmptyCache():
+    return ResponseCache(os.path.join(tempfile.mkdtemp(), "ResponseCache.db"))
+
+
+def GetVacancyDetails(vacancy):
+    rand = random.Random(vacancy["id"])
+    return dict(vacancy, description="".join(paragraph.format(rand.randint(1, 6)) for i in range(5)),
+                key_skills=[{"name": skill} for skill in rand.sample(skills, rand.randint(0, 5))],
+                experience={"id": rand.choice(experiences)}, premium=rand.choice([True, False]),
+                employer={"name": rand.choice(employers)})
+
+
+class HHServer:
+    """
+    Локальная замена API hh.ru: отдает /vacancies с фильтром по date_from и date_to (как у hh.ru,
+    не больше 2000 вакансий на запрос) и постраничным выводом, при необходимости с задержкой каждого ответа.
+    Может ограничивать частоту запросов (429 с Retry-After) и отвечать 503 на каждый failEvery-й запрос.
+    По /vacancies/{id} отдает подробное описание вакансии (404 для неизвестного id)
+    """
+    maxFound = 2000
+
+    def __init__(self, vacancies, delay=0, maxRequestsPerSecond=None, failEvery=None, retryAfter=1):
+        self.vacancies = vacancies
+        self.delay = delay
+        self.maxRequestsPerSecond = maxRequestsPerSecond
+        self.failEvery = failEvery
+        self.retryAfter = retryAfter
+        self.requestsCount = 0
+        self.rejectedCount = 0
+        self.acceptedTimes = deque()
+        self.vacanciesById = {}
+        self.lock = threading.Lock()
+
+    def GetStatus(self):
+        with self.lock:
+            self.requestsCount += 1
+            if self.failEvery and self.requestsCount % self.failEvery == 0:
+                self.rejectedCount += 1
+                return 503
+            now = time.monotonic()
+            while self.acceptedTimes and now - self.acceptedTimes[0] >= 1:
+                self.acceptedTimes.popleft()
+            if self.maxRequestsPerSecond and len(self.acceptedTimes) >= self.maxRequestsPerSecond:
+                self.rejectedCount += 1
+                return 429
+            self.acceptedTimes.append(now)
+            return 200
+
+    def Search(self, query):
+        dateFrom, dateTo = query["date_from"][0], query["date_to"][0]
+        found = [vacancy for vacancy in self.vacancies if dateFrom <= vacancy["published_at"][0:19] < dateTo]
+        perPage = int(query.get("per_page", ["20"])[0])
+        page = int(query.get("page", ["0"])[0])
+        pages = math.ceil(min(len(found), self.maxFound) / perPage)
+        items = found[page * perPage:(page + 1) * perPage] if page < pages else []
+        return {"items": items, "found": len(found), "pages": pages, "per_page": perPage, "page": page}
+
+    def FindVacancy(self, vacancyId):
+        with self.lock:
+            if len(self.vacanciesById) != len(self.vacancies):
+                self.vacanciesById = {vacancy["id"]: vacancy for vacancy in self.vacancies}
+        return self.vacanciesById.get(vacancyId)
+
+    def __enter__(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                time.sleep(server.delay)
+                status = server.GetStatus()
+                path = urlparse(self.path)
+                if status == 200 and path.path.startswith("/vacancies/"):
+                    vacancy = server.FindVacancy(path.path[len("/vacancies/"):])
+                    status = 200 if vacancy else 404
+                    body = json.dumps(GetVacancyDetails(vacancy) if vacancy else {"errors": [{"type": "not_found"}]})
+                    body = body.encode()
+                elif status == 200:
+                    body = json.dumps(server.Search(parse_qs(path.query))).encode()
+                else:
+                    body = json.dumps({"errors": [{"type": "captcha_required" if status == 429 else "server"}]})
+                    body = body.encode()
+                self.send_response(status)
+                if status == 429:
+                    self.send_header("Retry-After", str(server.retryAfter))
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpServer = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f'http://127.0.0.1:{self.httpServer.server_port}'
+        threading.Thread(target=self.httpServer.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpServer.shutdown()
+        self.httpServer.server_close()
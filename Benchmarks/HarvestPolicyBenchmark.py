@@ -0,0 +1,52 @@
+# Запуск из корня репозитория: python -m Benchmarks.HarvestPolicyBenchmark [лимит сервера в запросах/с]
+import io
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+import pandas as pd
+from Benchmarks.HHServer import HHServer, GetRandomVacancies, GetEmptyCache
+from distributorVacancies import DistributorVacancies
+from harvestPolicy import TokenBucket, RetryPolicy
+
+
+class NoLimit(TokenBucket):
+    def Acquire(self):
+        return 0
+
+    def Decrease(self):
+        pass
+
+
+class TightRetry(RetryPolicy):
+    def GetDelay(self, attempt, response=None):
+        return 0
+
+
+def Harvest(vacancies, maxRequestsPerSecond, rateLimiter, retryPolicy):
+    with HHServer(vacancies, 0.02, maxRequestsPerSecond) as server:
+        start = time.perf_counter()
+        output = io.StringIO()
+        with redirect_stdout(output):
+            DistributorVacancies(8, server.url, rateLimiter, retryPolicy, GetEmptyCache()).GetVacanciesCSV(date, 4)
+        seconds = time.perf_counter() - start
+    with open("DistributorVacancies.csv", encoding="utf-8") as file:
+        return file.read(), seconds, server, output.getvalue().splitlines()[-1]
+
+
+if __name__ == "__main__":
+    maxRequestsPerSecond = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    os.chdir(tempfile.mkdtemp())
+    date = pd.Timestamp("2022-12-02")
+    vacancies = GetRandomVacancies(date.to_pydatetime(), 7000)
+    policies = {"Повторы без паузы, без лимита (как раньше)": (NoLimit(), TightRetry(1000)),
+                "Экспоненциальная пауза и адаптивный лимит": (TokenBucket(), RetryPolicy())}
+    results = []
+    for title, (rateLimiter, retryPolicy) in policies.items():
+        result, seconds, server, report = Harvest(vacancies, maxRequestsPerSecond, rateLimiter, retryPolicy)
+        results.append(result)
+        print(f'{title}: {seconds:.2f} с, запросов к серверу: {server.requestsCount}, '
+              f'отклонено (429): {server.rejectedCount}')
+        print(f'  {report}')
+    print(f'Лимит сервера: {maxRequestsPerSecond} запросов/с, результаты совпадают: {results[0] == results[1]}')
@@ -0,0 +1,30 @@
+# Запуск из корня репозитория: python -m Benchmarks.HarvesterBenchmark [задержка ответа в секундах] [потоки]
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+import pandas as pd
+from Benchmarks.HHServer import HHServer, GetRandomVacancies, GetEmptyCache
+from distributorVacancies import DistributorVacancies
+
+
+def Harvest(url, date, concurrency):
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        DistributorVacancies(concurrency, url, responseCache=GetEmptyCache()).GetVacanciesCSV(date, 4)
+    with open("DistributorVacancies.csv", encoding="utf-8") as file:
+        return file.read(), time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    delay = float(sys.argv[1]) if len(sys.argv) > 1 else 0.05
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    os.chdir(tempfile.mkdtemp())
+    date = pd.Timestamp("2022-12-02")
+    with HHServer(GetRandomVacancies(date.to_pydatetime(), 6000), delay) as server:
+        sequential, sequentialSeconds = Harvest(server.url, date, 1)
+        concurrent, concurrentSeconds = Harvest(server.url, date, concurrency)
+    print(f'Вакансий: {sequential.count(chr(10)) - 1}, задержка ответа: {delay} с, '
+          f'результаты совпадают: {sequential == concurrent}')
+    print(f'Последовательно: {sequentialSeconds:.2f} с, {concurrency} потоков: {concurrentSeconds:.2f} с')
@@ -0,0 +1,46 @@
+# Запуск из корня репозитория: python -m Benchmarks.InMemoryDynamicsBenchmark [количество строк]
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+import pandas as pd
+from Benchmarks.SyntheticData import WriteConvertedCSV
+from DynamicsCalculator import Calculator
+from Splitter import Splitter
+
+vacancyName, areaName = "Программист", "Москва"
+
+
+def GetDynamicsWithSplitter(df, directory):
+    fileName = os.path.join(directory, "ConvertedVacancies.csv")
+    df.to_csv(fileName, index=False)
+    splitter = Splitter(fileName, os.path.join(directory, "CsvFilesByYear"), "DataByYear")
+    calculator = Calculator(vacancyName, areaName)
+    with ThreadPoolExecutor(os.cpu_count() * 3) as executor:
+        results = executor.map(calculator.GetDynamicsByYear,
+                               [splitter.GetFileName(year) for year in splitter.years], splitter.years)
+    return (*calculator.HandleResults(results), *calculator.GetDynamicsByCity(fileName))
+
+
+def GetDynamicsInMemory(df, directory):
+    return Calculator(vacancyName, areaName).GetDynamicsFromDataFrame(df)
+
+
+if __name__ == "__main__":
+    rowsCount = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    fileName = os.path.join(tempfile.mkdtemp(), "converted.csv")
+    WriteConvertedCSV(fileName, rowsCount)
+    df = pd.read_csv(fileName)
+    results = {}
+    for title, getDynamics in [("Запись файла, Splitter и чтение разделов", GetDynamicsWithSplitter),
+                               ("Группировка DataFrame в памяти", GetDynamicsInMemory)]:
+        Calculator.partitions.clear()
+        start = time.perf_counter()
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            results[title] = getDynamics(df, tempfile.mkdtemp())
+        print(f'{title}: {time.perf_counter() - start:.2f} с')
+    withSplitter, inMemory = results.values()
+    isSame = all(list(expected.items()) == list(actual.items()) for expected, actual in zip(withSplitter, inMemory))
+    print(f'Строк: {rowsCount}, результаты совпадают: {isSame}')
@@ -0,0 +1,17 @@
+import time
+import tracemalloc
+
+
+def Measure(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    func(*args, **kwargs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak / 2 ** 20
+
+
+def PrintMeasure(title, seconds, megabytes):
+    print(f'{title}: {seconds:.2f} с, пик памяти {megabytes:.1f} МБ')
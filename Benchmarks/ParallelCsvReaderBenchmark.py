@@ -0,0 +1,28 @@
+# Запуск из корня репозитория: python -m Benchmarks.ParallelCsvReaderBenchmark [количество строк] [процессы]
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from Benchmarks.SyntheticData import WriteTableCSV
+from TableTask import DataSet
+
+
+def ReadTable(fileName, processesCount):
+    inputData = SimpleNamespace(fileName=fileName, filterParameter="", sortParameter="",
+                                isReverseSort=False, Initialize=lambda vacancies: None, topCount=None)
+    start = time.perf_counter()
+    vacancies = DataSet(inputData, processesCount, useCache=False).vacanciesObjects
+    return [(vacancy.name, vacancy.description, vacancy.publishedAt) for vacancy in vacancies], \
+        time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rowsCount = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    processesCount = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    fileName = os.path.join(tempfile.mkdtemp(), "vacancies.csv")
+    WriteTableCSV(fileName, rowsCount)
+    sequential, sequentialSeconds = ReadTable(fileName, 0)
+    parallel, parallelSeconds = ReadTable(fileName, processesCount)
+    print(f'Строк: {rowsCount}, процессов: {processesCount}, результаты совпадают: {sequential == parallel}')
+    print(f'Последовательно: {sequentialSeconds:.2f} с, по кускам в пуле процессов: {parallelSeconds:.2f} с')
@@ -0,0 +1,45 @@
+# Запуск из корня репозитория: python -m Benchmarks.RowCleanerBenchmark [количество строк] [количество процессов]
+import csv
+import os
+import re
+import sys
+import tempfile
+from Benchmarks.SyntheticData import WriteTableCSV
+from Benchmarks.Measure import Measure, PrintMeasure
+from RowCleaner import RowCleaner
+
+
+def CleanRowBefore(row):
+    cleaner = re.compile('<.*?>')
+    clearedRow = re.sub(cleaner, '', row)
+    clearedRow = "; ".join(clearedRow.split('\n'))
+    clearedRow = "".join(clearedRow.split('\r'))
+    clearedRow = " ".join(clearedRow.split())
+    return clearedRow
+
+
+def CleanFileBefore(fileName):
+    with open(fileName, encoding='utf-8-sig', newline='') as file:
+        fileReader = csv.DictReader(file)
+        return [{name: CleanRowBefore(row[name]) for name in fileReader.fieldnames} for row in fileReader]
+
+
+def CleanFile(fileName, processesCount):
+    with open(fileName, encoding='utf-8-sig', newline='') as file:
+        fileReader = csv.DictReader(file)
+        return list(RowCleaner(processesCount).CleanRows(fileReader, fileReader.fieldnames))
+
+
+if __name__ == "__main__":
+    rowsCount = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    processesCount = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    fileName = os.path.join(tempfile.mkdtemp(), "vacancies.csv")
+    WriteTableCSV(fileName, rowsCount)
+    print(f'Строк: {rowsCount}, размер файла: {os.path.getsize(fileName) / 2 ** 20:.1f} МБ')
+    beforeRows, beforeSeconds, beforePeak = Measure(CleanFileBefore, fileName)
+    rows, seconds, peak = Measure(CleanFile, fileName, 0)
+    poolRows, poolSeconds, poolPeak = Measure(CleanFile, fileName, processesCount)
+    print(f'Результаты совпадают: {beforeRows == rows == poolRows}')
+    PrintMeasure("re.sub('<.*?>') и split/join", beforeSeconds, beforePeak)
+    PrintMeasure("RowCleaner", seconds, peak)
+    PrintMeasure(f'RowCleaner, пул из {processesCount} процессов', poolSeconds, poolPeak)
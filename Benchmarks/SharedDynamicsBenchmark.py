@@ -0,0 +1,66 @@
+# Запуск из корня репозитория: python -m Benchmarks.SharedDynamicsBenchmark [количество строк] [процессы через запятую, например 1,2,4,8]
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from Benchmarks.SyntheticData import WriteConvertedCSV
+from DynamicsCalculator import Calculator
+from SharedDynamicsEngine import SharedDynamicsEngine
+from Splitter import Splitter
+
+vacancyName, areaName = "Программист", "Москва"
+
+
+def WithoutMultiprocessing(fileName, processesCount):
+    splitter = Splitter(fileName, tempfile.mkdtemp(), "DataByYear")
+    calculator = Calculator(vacancyName, areaName)
+    return calculator.HandleResults([calculator.GetDynamicsByYear(splitter.GetFileName(year), year)
+                                     for year in splitter.years])
+
+
+def WithThreads(fileName, processesCount):
+    splitter = Splitter(fileName, tempfile.mkdtemp(), "DataByYear")
+    calculator = Calculator(vacancyName, areaName)
+    with ThreadPoolExecutor(processesCount * 3) as executor:
+        results = executor.map(calculator.GetDynamicsByYear, [splitter.GetFileName(year) for year in splitter.years],
+                               splitter.years)
+    return calculator.HandleResults(results)
+
+
+def WithPool(fileName, processesCount):
+    splitter = Splitter(fileName, tempfile.mkdtemp(), "DataByYear")
+    calculator = Calculator(vacancyName, areaName)
+    with multiprocessing.Pool(processesCount * 3) as pool:
+        results = pool.starmap(calculator.GetDynamicsByYear,
+                               [(splitter.GetFileName(year), year) for year in splitter.years])
+    return calculator.HandleResults(results)
+
+
+def WithSharedMemory(fileName, processesCount):
+    with SharedDynamicsEngine(fileName, processesCount) as engine:
+        return engine.GetDynamics(vacancyName, areaName)
+
+
+if __name__ == "__main__":
+    rowsCount = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    processesCounts = [int(count) for count in sys.argv[2].split(",")] if len(sys.argv) > 2 else [os.cpu_count()]
+    fileName = os.path.join(tempfile.mkdtemp(), "converted.csv")
+    WriteConvertedCSV(fileName, rowsCount)
+    print(f'Строк: {rowsCount}, ядер: {os.cpu_count()}')
+    expected = None
+    runs = [("Без многопроцессорности", WithoutMultiprocessing, processesCounts[:1])]
+    runs += [(title, run, processesCounts) for title, run in [("Потоки", WithThreads),
+                                                             ("multiprocessing.Pool", WithPool),
+                                                             ("Общая память", WithSharedMemory)]]
+    for title, run, counts in runs:
+        for processesCount in counts:
+            Calculator.partitions.clear()
+            start = time.perf_counter()
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                result = run(fileName, processesCount)
+            expected = expected or result
+            print(f'{title}, процессов {processesCount}: {time.perf_counter() - start:.2f} с, '
+                  f'результаты совпадают: {result == expected}')
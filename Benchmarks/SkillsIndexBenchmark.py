@@ -0,0 +1,30 @@
+# Запуск из корня репозитория: python -m Benchmarks.SkillsIndexBenchmark [количество строк]
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from Benchmarks.SyntheticData import WriteTableCSV
+from TableTask import DataSet
+
+
+def FilterBySkills(fileName, expectedSkills, useSkillsIndex):
+    inputData = SimpleNamespace(fileName=fileName, filterParameter=["Навыки", expectedSkills], sortParameter="",
+                                isReverseSort=False, Initialize=lambda vacancies: None, topCount=None)
+    start = time.perf_counter()
+    vacancies = DataSet(inputData, useSkillsIndex=useSkillsIndex).vacanciesObjects
+    return [vacancy.keySkills for vacancy in vacancies], time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rowsCount = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    fileName = os.path.join(tempfile.mkdtemp(), "vacancies.csv")
+    WriteTableCSV(fileName, rowsCount)
+    expectedSkills = "Python, Docker, Django"
+    scan, scanSeconds = FilterBySkills(fileName, expectedSkills, False)
+    build, buildSeconds = FilterBySkills(fileName, expectedSkills, True)
+    indexed, indexedSeconds = FilterBySkills(fileName, expectedSkills, True)
+    print(f'Строк: {rowsCount}, найдено: {len(scan)}, результаты совпадают: {scan == build == indexed}')
+    print(f'Полный просмотр файла: {scanSeconds:.2f} с')
+    print(f'Первый запрос (построение индекса): {buildSeconds:.2f} с')
+    print(f'Повторный запрос по индексу: {indexedSeconds:.3f} с')
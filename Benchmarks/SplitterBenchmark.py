@@ -0,0 +1,37 @@
+# Запуск из корня репозитория: python -m Benchmarks.SplitterBenchmark [количество строк]
+import os
+import sys
+import tempfile
+import pandas as pd
+from Benchmarks.Measure import Measure, PrintMeasure
+from Benchmarks.SyntheticData import WriteStatisticsCSV
+from Splitter import Splitter
+
+
+def SplitWholeFile(fileName, outputPath, outputName):
+    df = pd.read_csv(fileName)
+    df["years"] = df["published_at"].apply(lambda date: int(date[0:4]))
+    for year, data in df.groupby("years"):
+        data.iloc[:, :6].to_csv(os.path.join(outputPath, f'{outputName}{year}.csv'), index=False)
+    return df["years"].unique()
+
+
+def ReadOutput(outputPath, years):
+    outputs = []
+    for year in sorted(years):
+        with open(os.path.join(outputPath, f'DataByYear{year}.csv'), encoding="utf-8") as file:
+            outputs.append(file.read())
+    return outputs
+
+
+if __name__ == "__main__":
+    rowsCount = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    fileName = os.path.join(tempfile.mkdtemp(), "vacancies.csv")
+    WriteStatisticsCSV(fileName, rowsCount)
+    wholePath, chunkedPath = tempfile.mkdtemp(), tempfile.mkdtemp()
+    years, wholeSeconds, wholeMegabytes = Measure(SplitWholeFile, fileName, wholePath, "DataByYear")
+    splitter, chunkedSeconds, chunkedMegabytes = Measure(Splitter, fileName, chunkedPath, "DataByYear")
+    print(f'Строк: {rowsCount}, размер файла: {os.path.getsize(fileName) / 2 ** 20:.0f} МБ, '
+          f'файлы совпадают: {ReadOutput(wholePath, years) == ReadOutput(chunkedPath, splitter.years)}')
+    PrintMeasure("Весь файл в памяти", wholeSeconds, wholeMegabytes)
+    PrintMeasure("По кускам", chunkedSeconds, chunkedMegabytes)
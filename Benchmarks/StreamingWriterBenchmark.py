@@ -0,0 +1,28 @@
+# Запуск из корня репозитория: python -m Benchmarks.StreamingWriterBenchmark [вакансий в день]
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from datetime import timedelta
+import pandas as pd
+from Benchmarks.HHServer import HHServer, GetRandomVacancies, GetEmptyCache
+from Benchmarks.Measure import Measure, PrintMeasure
+from distributorVacancies import DistributorVacancies
+from harvestPolicy import TokenBucket
+
+
+def Harvest(url, date, daysCount):
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        DistributorVacancies(8, url, TokenBucket(10 ** 4, 10 ** 4), responseCache=GetEmptyCache()).GetVacanciesCSV(date, 4, daysCount)
+
+
+if __name__ == "__main__":
+    vacanciesPerDay = int(sys.argv[1]) if len(sys.argv) > 1 else 6000
+    os.chdir(tempfile.mkdtemp())
+    date = pd.Timestamp("2022-12-02")
+    vacancies = [vacancy for day in range(8)
+                 for vacancy in GetRandomVacancies(date.to_pydatetime() + timedelta(days=day), vacanciesPerDay, day)]
+    with HHServer(vacancies) as server:
+        for daysCount in [1, 2, 4, 8]:
+            result, seconds, megabytes = Measure(Harvest, server.url, date, daysCount)
+            PrintMeasure(f'Дней: {daysCount}, вакансий: {daysCount * vacanciesPerDay}', seconds, megabytes)
@@ -0,0 +1,64 @@
+import csv
+import random
+
+names = ["Программист Python", "Аналитик", "Программист 1С", "Системный администратор", "Тестировщик",
+         "Менеджер проектов", "Frontend разработчик", "DevOps инженер", "Технический писатель", "Дизайнер"]
+areas = ["Москва", "Санкт-Петербург", "Екатеринбург", "Новосибирск", "Казань", "Нижний Новгород", "Самара",
+         "Краснодар", "Пермь", "Уфа", "Омск", "Томск", "Воронеж", "Минск", "Алматы"]
+currencies = ["RUR"] * 20 + ["USD", "EUR", "KZT", "UAH", "BYR"]
+skills = ["Python", "SQL", "Git", "Linux", "Docker", "Django", "1С", "Java", "C#", "JavaScript", "Английский язык"]
+experiences = ["noExperience", "between1And3", "between3And6", "moreThan6"]
+employers = ["Компания {}".format(i) for i in range(200)]
+paragraph = ("<p><strong>Обязанности:</strong></p> <ul> <li>разработка и сопровождение сервисов;</li> "
+             "<li>участие в код-ревью и планировании;</li> <li>написание тестов</li> </ul>\r\n"
+             "<p>Требования:<br />- опыт работы от {} лет<br />- знание SQL</p>\n")
+
+
+def GetPublishedAt(rand):
+    return "{}-{:02d}-{:02d}T{:02d}:{:02d}:{:02d}+0300".format(rand.randint(2007, 2022), rand.randint(1, 12),
+                                                             rand.randint(1, 28), rand.randint(0, 23),
+                                                             rand.randint(0, 59), rand.randint(0, 59))
+
+
+def GetSalary(rand):
+    salaryFrom = rand.randrange(10000, 200000, 500)
+    return float(salaryFrom), float(salaryFrom + rand.randrange(0, 100000, 500)), rand.choice(currencies)
+
+
+def WriteStatisticsCSV(fileName, rowsCount, seed=0):
+    rand = random.Random(seed)
+    with open(fileName, "w", encoding="utf-8-sig", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["name", "salary_from", "salary_to", "salary_currency", "area_name", "published_at"])
+        for i in range(rowsCount):
+            salaryFrom, salaryTo, currency = GetSalary(rand)
+            row = [rand.choice(names), salaryFrom, salaryTo, currency, rand.choice(areas), GetPublishedAt(rand)]
+            if rand.random() < 0.05:
+                row[rand.randrange(1, 4)] = ""
+            writer.writerow(row)
+
+
+def WriteTableCSV(fileName, rowsCount, paragraphsCount=20, seed=0):
+    rand = random.Random(seed)
+    with open(fileName, "w", encoding="utf-8-sig", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["name", "description", "key_skills", "experience_id", "premium", "employer_name",
+                         "salary_from", "salary_to", "salary_gross", "salary_currency", "area_name", "published_at"])
+        for i in range(rowsCount):
+            salaryFrom, salaryTo, currency = GetSalary(rand)
+            description = "".join(paragraph.format(rand.randint(1, 6)) for j in range(paragraphsCount))
+            writer.writerow([rand.choice(names), description, "\n".join(rand.sample(skills, rand.randint(1, 5))),
+                             rand.choice(experiences), rand.choice(["True", "False"]), rand.choice(employers),
+                             salaryFrom, salaryTo, rand.choice(["True", "False"]), currency, rand.choice(areas),
+                             GetPublishedAt(rand)])
+
+
+def WriteConvertedCSV(fileName, rowsCount, seed=0):
+    rand = random.Random(seed)
+    with open(fileName, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["name", "salary", "area_name", "published_at"])
+        for i in range(rowsCount):
+            salaryFrom, salaryTo, currency = GetSalary(rand)
+            writer.writerow([rand.choice(names), (salaryFrom + salaryTo) / 2, rand.choice(areas),
+                             GetPublishedAt(rand)[0:19]])
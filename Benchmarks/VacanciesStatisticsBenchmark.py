@@ -0,0 +1,24 @@
+# Запуск из корня репозитория: python -m Benchmarks.VacanciesStatisticsBenchmark [количество строк]
+import os
+import sys
+import tempfile
+from Benchmarks.SyntheticData import WriteStatisticsCSV
+from Benchmarks.Measure import Measure, PrintMeasure
+from PdfTask import DataSet, InputConnect
+from VacanciesStatistics import StreamingDataSet
+
+
+def GetListData(dataSetClass, fileName, vacancyName):
+    dataSet = dataSetClass(fileName, vacancyName)
+    return [list(response(dataSet).items()) for response in InputConnect._responses.values()]
+
+
+if __name__ == "__main__":
+    rowsCount = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+    fileName = os.path.join(tempfile.mkdtemp(), "vacancies.csv")
+    WriteStatisticsCSV(fileName, rowsCount)
+    objectsData, objectsSeconds, objectsPeak = Measure(GetListData, DataSet, fileName, "Программист")
+    streamData, streamSeconds, streamPeak = Measure(GetListData, StreamingDataSet, fileName, "Программист")
+    print(f'Строк: {rowsCount}, результаты совпадают: {objectsData == streamData}')
+    PrintMeasure("Объектная модель (DataSet)", objectsSeconds, objectsPeak)
+    PrintMeasure("Потоковый агрегатор (StreamingDataSet)", streamSeconds, streamPeak)
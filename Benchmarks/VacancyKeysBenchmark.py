@@ -0,0 +1,63 @@
+# Запуск из корня репозитория: python -m Benchmarks.VacancyKeysBenchmark [количество строк]
+import random
+import sys
+import time
+from datetime import datetime
+from Benchmarks.SyntheticData import GetPublishedAt, GetSalary, skills
+from TableTask import DataSet, Vacancy, Salary
+
+sortFuncsBefore = {"Оклад": lambda vacancy: vacancy.salary.ChangeCurrency(
+    (int(float(vacancy.salary.salaryFrom)) + int(float(vacancy.salary.salaryTo))) / 2),
+                   "Дата публикации вакансии": lambda vacancy: datetime.strptime(vacancy.publishedAt,
+                                                                                 '%Y-%m-%dT%H:%M:%S%z')}
+filterFuncsBefore = {"Оклад": lambda expectedSalary, vacancy: int(float(vacancy.salary.salaryTo)) >= int(
+    float(expectedSalary)) >= int(float(vacancy.salary.salaryFrom)),
+                     "Навыки": lambda expectedSkills, vacancy: set(expectedSkills.split(", ")) <= set(
+                         vacancy.keySkills.split("\n")),
+                     "Дата публикации вакансии": lambda expectedDate, vacancy: expectedDate == datetime.strptime(
+                         vacancy.publishedAt, '%Y-%m-%dT%H:%M:%S%z').strftime('%d.%m.%Y')}
+filterValues = {"Оклад": "100000", "Навыки": "Python, SQL", "Дата публикации вакансии": "05.03.2015"}
+
+
+def CreateVacancies(rowsCount, seed=0):
+    rand = random.Random(seed)
+    vacancies = []
+    for i in range(rowsCount):
+        salaryFrom, salaryTo, currency = GetSalary(rand)
+        vacancies.append(Vacancy("Вакансия", "", "\n".join(rand.sample(skills, rand.randint(1, 5))), "noExperience",
+                                 "False", "Компания", Salary(str(salaryFrom), str(salaryTo), currency, "True"),
+                                 "Москва", GetPublishedAt(rand)))
+    return vacancies
+
+
+def GetRows(vacancies):
+    return [{"key_skills": "; ".join(vacancy.keySkills.split("\n")), "salary_from": vacancy.salary.salaryFrom,
+             "salary_to": vacancy.salary.salaryTo, "published_at": vacancy.publishedAt} for vacancy in vacancies]
+
+
+def FilterRows(name, value, vacancies, rows):
+    expectedValue = DataSet._expectedParsers.get(name, lambda value: value)(value)
+    filterFunc = DataSet._filterFuncs[name]
+    return [vacancy for vacancy, row in zip(vacancies, rows) if filterFunc(expectedValue, row)]
+
+
+def Seconds(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rowsCount = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    vacancies, seconds = Seconds(lambda: CreateVacancies(rowsCount))
+    print(f'Строк: {rowsCount}, генерация вакансий: {seconds:.2f} с')
+    for name, sortFunc in sortFuncsBefore.items():
+        before, beforeSeconds = Seconds(lambda: sorted(vacancies, key=sortFunc))
+        after, afterSeconds = Seconds(lambda: sorted(vacancies, key=DataSet._sortFuncs[name]))
+        print(f'Сортировка "{name}": {beforeSeconds:.2f} с -> {afterSeconds:.2f} с, совпадает: {before == after}')
+    rows = GetRows(vacancies)
+    for name, filterFunc in filterFuncsBefore.items():
+        value = filterValues[name]
+        before, beforeSeconds = Seconds(lambda: [vacancy for vacancy in vacancies if filterFunc(value, vacancy)])
+        after, afterSeconds = Seconds(lambda: FilterRows(name, value, vacancies, rows))
+        print(f'Фильтрация "{name}": {beforeSeconds:.2f} с -> {afterSeconds:.2f} с, совпадает: {before == after}')
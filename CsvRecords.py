@@ -0,0 +1,109 @@
+import csv
+
+
+class CsvRecords:
+    """
+    Чтение записей CSV-файла с байтовыми смещениями их начала.
+    Файл читается в двоичном режиме и режется на строки по \\r, \\n и \\r\\n так же, как при открытии
+    с newline='', поэтому csv.reader получает те же строки, что и csv.DictReader, а смещение записи
+    с многострочным полем в кавычках указывает на ее первую строку
+
+    Attributes:
+        fileName (str): Название файла
+        blockSize (int): Размер блока последовательного чтения в байтах
+        recordBlockSize (int): Размер блока чтения отдельной записи по смещению в байтах
+    """
+
+    def __init__(self, fileName, blockSize=1 << 20, recordBlockSize=1 << 14):
+        """
+        Инициализирует объект CsvRecords
+
+        Args:
+            fileName (str): Название файла
+            blockSize (int): Размер блока последовательного чтения в байтах
+            recordBlockSize (int): Размер блока чтения отдельной записи по смещению в байтах
+        """
+        self.fileName = fileName
+        self.blockSize = blockSize
+        self.recordBlockSize = recordBlockSize
+
+    def ReadRecords(self, start=0, end=None):
+        """
+        Возвращает записи файла (включая заголовок, если start = 0) вместе со смещениями их начала.
+        Пустые строки пропускаются, как в csv.DictReader
+
+        Args:
+            start (int): Смещение начала записи, с которой начинается чтение
+            end (int): Смещение, начиная с которого записи уже не читаются (None - до конца файла)
+
+        Returns:
+            generator: Пары (смещение записи, список полей записи)
+        """
+        with open(self.fileName, "rb") as file:
+            file.seek(start)
+            position = [start]
+            reader = csv.reader(self.__DecodeLines(self.__ReadLines(file, self.blockSize), position, start == 0))
+            while end is None or position[0] < end:
+                offset = position[0]
+                record = next(reader, None)
+                if record is None:
+                    return
+                if record:
+                    yield offset, record
+
+    def ReadRecordsAt(self, offsets):
+        """
+        Возвращает записи, начинающиеся с заданных смещений
+
+        Args:
+            offsets: Смещения начала записей
+
+        Returns:
+            generator: Списки полей записей
+        """
+        with open(self.fileName, "rb") as file:
+            for offset in offsets:
+                file.seek(offset)
+                lines = self.__ReadLines(file, self.recordBlockSize)
+                yield next(csv.reader(self.__DecodeLines(lines, [offset], offset == 0)))
+
+    @staticmethod
+    def __ReadLines(file, blockSize):
+        """
+        Читает файл блоками и режет его на строки по \\r, \\n и \\r\\n с сохранением окончаний строк
+
+        Args:
+            file: Файл, открытый в двоичном режиме
+            blockSize (int): Размер блока чтения в байтах
+
+        Returns:
+            generator: Строки файла в байтах
+        """
+        rest = b""
+        for block in iter(lambda: file.read(blockSize), b""):
+            lines = (rest + block).splitlines(keepends=True)
+            rest = lines.pop()
+            yield from lines
+        if rest:
+            yield rest
+
+    @staticmethod
+    def __DecodeLines(lines, position, isFileStart):
+        """
+        Декодирует строки из UTF-8 и сдвигает текущую позицию на длину каждой прочитанной строки
+
+        Args:
+            lines: Строки файла в байтах
+            position (list[int]): Текущая позиция в файле (изменяемая)
+            isFileStart (bool): Начинается ли чтение с начала файла (тогда убирается BOM)
+
+        Returns:
+            generator: Строки файла
+        """
+        for line in lines:
+            position[0] += len(line)
+            if isFileStart:
+                isFileStart = False
+                yield line.decode("utf-8-sig")
+            else:
+                yield line.decode("utf-8")
@@ -0,0 +1,228 @@
+import os
+import sys
+import json
+import hashlib
+from array import array
+from itertools import accumulate
+
+
+class DatasetCache:
+    """
+    Дисковый кэш разобранных и очищенных строк CSV-файлов.
+    Запись кэша - строка заголовка в JSON (отпечаток CSV-файла: путь, размер, время изменения и хеш
+    содержимого, - и размеры таблицы), сырые байты массива смещений концов значений и все значения подряд
+    в UTF-8. При загрузке из записи не может выполниться код (в отличие от pickle), поэтому каталог кэша
+    может быть общим. Запись возвращается только при полном совпадении отпечатка,
+    хеш содержимого считается, только если запись есть или сохраняется.
+    Общий размер кэша ограничен: при превышении удаляются давно не использованные записи (LRU по времени
+    изменения файла записи, которое обновляется при каждом попадании)
+
+    Attributes:
+        version (int): Версия формата записей кэша
+        cacheDir (str): Каталог кэша (переменная окружения VACANCIES_CACHE_DIR или ~/.cache/vacancies)
+        maxBytes (int): Максимальный общий размер записей кэша в байтах
+            (переменная окружения VACANCIES_CACHE_MAX_BYTES, по умолчанию 512 МБ)
+    """
+    version = 2
+
+    def __init__(self, cacheDir=None, maxBytes=None):
+        """
+        Инициализирует объект DatasetCache
+
+        Args:
+            cacheDir (str): Каталог кэша (None - из окружения или по умолчанию)
+            maxBytes (int): Максимальный общий размер записей кэша в байтах (None - из окружения или по умолчанию)
+        """
+        self.cacheDir = cacheDir or os.environ.get("VACANCIES_CACHE_DIR") or \
+            os.path.join(os.path.expanduser("~"), ".cache", "vacancies")
+        self.maxBytes = maxBytes or int(os.environ.get("VACANCIES_CACHE_MAX_BYTES", 512 << 20))
+        self.__fingerprints = {}
+
+    def IsCacheable(self, fileName):
+        """
+        Проверяет, стоит ли кэшировать CSV-файл: файлы больше maxBytes не кэшируются,
+        чтобы не собирать все их строки в памяти и не писать запись, которая все равно не поместится в кэш
+
+        Args:
+            fileName (str): Название CSV-файла
+
+        Returns:
+            bool: Помещается ли файл в кэш
+        """
+        return os.path.getsize(fileName) <= self.maxBytes
+
+    def Load(self, fileName, kind):
+        """
+        Возвращает закэшированные строки CSV-файла, если файл не изменился с момента их сохранения
+
+        Args:
+            fileName (str): Название CSV-файла
+            kind (str): Вид данных (разные потребители кэшируют разные данные одного файла)
+
+        Returns:
+            (list[list[str]], object): Строки и дополнительные данные или None, если записи нет,
+                она устарела, повреждена или файл слишком большой для кэша
+        """
+        if not self.IsCacheable(fileName):
+            return None
+        entryName = self.__GetEntryName(fileName, kind)
+        if not os.path.exists(entryName):
+            self.__GetFingerprint(fileName, withContentHash=False)
+            return None
+        fingerprint = self.__GetFingerprint(fileName)
+        try:
+            with open(entryName, "rb") as file:
+                header = json.loads(file.readline())
+                if header["fingerprint"] != fingerprint:
+                    return None
+                rowsCount, columnsCount = header["rowsCount"], header["columnsCount"]
+                ends = array('Q')
+                ends.frombytes(file.read(ends.itemsize * rowsCount * columnsCount))
+                text = file.read().decode("utf-8")
+            if len(ends) != rowsCount * columnsCount or (ends and ends[-1] != len(text)):
+                return None
+            os.utime(entryName)
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        values = [text[start:end] for start, end in zip((0, *ends), ends)]
+        rows = [values[i:i + columnsCount] for i in range(0, len(values), columnsCount)]
+        return rows, header["info"]
+
+    def Store(self, fileName, kind, rows, info=None):
+        """
+        Сохраняет строки CSV-файла в кэш и удаляет давно не использованные записи, если кэш переполнен.
+        Отпечаток берется тот, что был вычислен при последнем Load, то есть до разбора файла
+        (если тогда хеш содержимого не считался, он считается сейчас, а файл, изменившийся после Load,
+        не сохраняется). Если каталог кэша недоступен для записи или файл слишком большой для кэша,
+        данные не сохраняются
+
+        Args:
+            fileName (str): Название CSV-файла
+            kind (str): Вид данных
+            rows (list[list[str]]): Строки - списки строковых значений одинаковой длины
+            info: Дополнительные данные, которые можно сохранить в JSON
+        """
+        if not self.IsCacheable(fileName):
+            return
+        entryName = self.__GetEntryName(fileName, kind)
+        fingerprint = self.__fingerprints.get(os.path.abspath(fileName)) or self.__GetFingerprint(fileName)
+        if fingerprint[-1] is None:
+            loadedFingerprint, fingerprint = fingerprint, self.__GetFingerprint(fileName)
+            if fingerprint[:-1] != loadedFingerprint[:-1]:
+                return
+        tempName = f'{entryName}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self.cacheDir, exist_ok=True)
+            values = [value for row in rows for value in row]
+            header = {"fingerprint": fingerprint, "rowsCount": len(rows), "columnsCount": len(rows[0]) if rows else 0,
+                      "info": info}
+            with open(tempName, "wb") as file:
+                file.write(json.dumps(header).encode() + b"\n")
+                file.write(array('Q', accumulate(map(len, values))).tobytes())
+                file.write("".join(values).encode("utf-8"))
+            if os.path.getsize(tempName) > self.maxBytes:
+                os.remove(tempName)
+                return
+            os.replace(tempName, entryName)
+            self.__Evict(entryName)
+        except OSError:
+            if os.path.exists(tempName):
+                os.remove(tempName)
+
+    def Invalidate(self, fileName=None):
+        """
+        Удаляет записи кэша заданного CSV-файла (всех видов данных) или все записи кэша
+
+        Args:
+            fileName (str): Название CSV-файла (None - очистить весь кэш)
+        """
+        prefix = "" if fileName is None else self.__GetPathHash(fileName)
+        for entryName in self.__GetEntries():
+            if os.path.basename(entryName).startswith(prefix):
+                os.remove(entryName)
+
+    def __GetEntryName(self, fileName, kind):
+        """
+        Возвращает название файла записи кэша: хеш пути к CSV-файлу и хеш вида данных
+
+        Args:
+            fileName (str): Название CSV-файла
+            kind (str): Вид данных
+
+        Returns:
+            str: Название файла записи кэша
+        """
+        kindHash = hashlib.sha1(kind.encode()).hexdigest()[:16]
+        return os.path.join(self.cacheDir, f'{self.__GetPathHash(fileName)}-{kindHash}.cache')
+
+    @staticmethod
+    def __GetPathHash(fileName):
+        """
+        Возвращает хеш абсолютного пути к CSV-файлу
+
+        Args:
+            fileName (str): Название CSV-файла
+
+        Returns:
+            str: Хеш пути
+        """
+        return hashlib.sha1(os.path.abspath(fileName).encode()).hexdigest()[:24]
+
+    def __GetFingerprint(self, fileName, withContentHash=True):
+        """
+        Возвращает отпечаток CSV-файла и запоминает его для последующего Store
+
+        Args:
+            fileName (str): Название CSV-файла
+            withContentHash (bool): Считать ли хеш содержимого (False - вместо хеша None)
+
+        Returns:
+            list: Версия формата, путь, размер, время изменения и хеш содержимого файла
+        """
+        path = os.path.abspath(fileName)
+        fileStat = os.stat(path)
+        contentHash = None
+        if withContentHash:
+            contentHash = hashlib.blake2b()
+            with open(path, "rb") as file:
+                for block in iter(lambda: file.read(1 << 20), b""):
+                    contentHash.update(block)
+            contentHash = contentHash.hexdigest()
+        fingerprint = [self.version, path, fileStat.st_size, fileStat.st_mtime_ns, contentHash]
+        self.__fingerprints[path] = fingerprint
+        return fingerprint
+
+    def __GetEntries(self):
+        """
+        Возвращает файлы записей кэша
+
+        Returns:
+            list[str]: Названия файлов записей кэша
+        """
+        if not os.path.isdir(self.cacheDir):
+            return []
+        return [os.path.join(self.cacheDir, name) for name in os.listdir(self.cacheDir) if name.endswith(".cache")]
+
+    def __Evict(self, keptEntryName):
+        """
+        Удаляет давно не использованные записи, пока общий размер кэша больше maxBytes
+
+        Args:
+            keptEntryName (str): Только что сохраненная запись, которая не удаляется
+        """
+        entries = sorted((os.stat(entryName).st_mtime_ns, os.path.getsize(entryName), entryName)
+                         for entryName in self.__GetEntries())
+        totalBytes = sum(size for mtime, size, entryName in entries)
+        for mtime, size, entryName in entries:
+            if totalBytes <= self.maxBytes:
+                break
+            if entryName != keptEntryName:
+                os.remove(entryName)
+                totalBytes -= size
+
+
+if __name__ == "__main__":
+    # python DatasetCache.py [файл ...] - удалить записи кэша заданных CSV-файлов или весь кэш
+    cache = DatasetCache()
+    for name in sys.argv[1:] or [None]:
+        cache.Invalidate(name)
@@ -1,29 +1,63 @@
+import os
+import threading
 import pandas as pd
+from collections import OrderedDict
 
 
 class Calculator:
+    columns = ["name", "area_name", "salary"]
+    partitionsMaxBytes = int(os.environ.get("PARTITIONS_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+    partitions = OrderedDict()
+    partitionsLock = threading.Lock()
+
     def __init__(self, vacancyName, areaName):
         self.vacancyName = vacancyName
         self.areaName = areaName
 
     def GetDynamicsByYear(self, fileName, year):
         # fileName, year = data
-        generalDf = self.GetDataByYear(fileName, areaName=self.areaName)
-        dfByParameters = self.GetDataByYear(fileName, self.vacancyName, self.areaName)
+        df = self.LoadPartition(fileName)
+        generalDf = df[df["area_name"] == self.areaName]
+        dfByParameters = generalDf[generalDf["name"].str.contains(self.vacancyName)]
         res = (year, self.GetSalariesData(generalDf), self.GetDataCount(generalDf),
                self.GetSalariesData(dfByParameters), self.GetDataCount(dfByParameters))
         # print(multiprocessing.current_process().name, fileName, res)
         # , areaName = self.areaName
         return res
 
+    def ReadData(self, fileName):
+        extension = os.path.splitext(fileName)[1]
+        if extension == ".parquet":
+            return pd.read_parquet(fileName, columns=self.columns)
+        if extension == ".feather":
+            return pd.read_feather(fileName, columns=self.columns)
+        return pd.read_csv(fileName, usecols=self.columns)
+
+    def LoadPartition(self, fileName):
+        fileStat = os.stat(fileName)
+        key = (os.path.abspath(fileName), fileStat.st_size, fileStat.st_mtime_ns)
+        with self.partitionsLock:
+            if key in self.partitions:
+                self.partitions.move_to_end(key)
+                return self.partitions[key][0]
+        df = self.ReadData(fileName)
+        size = int(df.memory_usage(deep=True).sum())
+        if size > self.partitionsMaxBytes:
+            return df
+        with self.partitionsLock:
+            self.partitions[key] = (df, size)
+            totalBytes = sum(size for df, size in self.partitions.values())
+            while totalBytes > self.partitionsMaxBytes:
+                totalBytes -= self.partitions.popitem(last=False)[1][1]
+        return df
+
     def GetDataByYear(self, fileName, vacancyName=None, areaName=None):
-        df = pd.read_csv(fileName)
+        partition = df = self.LoadPartition(fileName)
         if areaName is not None:
             df = df[df["area_name"] == areaName]
         if vacancyName is not None:
             df = df[df["name"].str.contains(vacancyName)]
-        x = len(df)
-        return df
+        return df.copy() if df is partition else df
 
     def GetSalariesData(self, df):
         # df["salary"] = df[['salary_from', 'salary_to']].mean(axis=1)
@@ -33,12 +67,33 @@ class Calculator:
         return len(df)
 
     def GetDynamicsByCity(self, fileName):
-        df = pd.read_csv(fileName)
+        df = self.ReadData(fileName)
         df['count'] = df.groupby('area_name')['area_name'].transform('count')
         vacanciesCount = len(df)
         tempDf = df[df['count'] / vacanciesCount >= 0.01]
         return self.GetCitySalariesData(tempDf), self.GetCityRatioData(tempDf, vacanciesCount)
 
+    def GetDynamicsFromDataFrame(self, df):
+        years = df["published_at"].str[0:4].astype(int)
+        isArea = df["area_name"] == self.areaName
+        areaDf = df.loc[isArea, ["name", "salary"]]
+        isVacancy = areaDf["name"].str.contains(self.vacancyName)
+        areaDf = areaDf.assign(years=years[isArea], vacancySalary=areaDf["salary"].where(isVacancy),
+                               isVacancy=isVacancy.astype(int))
+        yearsDf = areaDf.groupby("years").agg(generalSalary=("salary", "mean"), generalCount=("salary", "size"),
+                                              vacancySalary=("vacancySalary", "mean"),
+                                              vacancyCount=("isVacancy", "sum"))
+        yearsDf = yearsDf.reindex(pd.unique(years)).fillna(0)
+        results = [(year, int(generalSalary), int(generalCount), int(vacancySalary), int(vacancyCount))
+                   for year, generalSalary, generalCount, vacancySalary, vacancyCount in yearsDf.itertuples()]
+        citiesDf = df.groupby("area_name")["salary"].agg(["mean", "size"])
+        vacanciesCount = len(df)
+        citiesDf = citiesDf[citiesDf["size"] / vacanciesCount >= 0.01]
+        citiesSalaryData = citiesDf["mean"].sort_values(ascending=False).head(10).apply(lambda x: int(x)).to_dict()
+        citiesRatioData = (citiesDf["size"] / vacanciesCount).sort_values(ascending=False).head(10)
+        citiesRatioData = citiesRatioData.apply(lambda x: round(x, 4)).to_dict()
+        return (*self.HandleResults(results), citiesSalaryData, citiesRatioData)
+
     def GetCitySalariesData(self, df):
         tempDf = df.copy()
         # tempDf["salary"] = tempDf[['salary_from', 'salary_to']].mean(axis=1)
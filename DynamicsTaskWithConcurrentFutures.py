@@ -6,10 +6,11 @@ import os
 if __name__ == "__main__":
     fileName = input("Введите название файла: ")
     vacancyName = input("Введите название профессии: ")
+    areaName = input("Введите название региона: ")
     splitter = Splitter(fileName, "CsvFilesByYear", "DataByYear")
-    dynamicsCalculator = Calculator(vacancyName)
+    dynamicsCalculator = Calculator(vacancyName, areaName)
     with ThreadPoolExecutor(os.cpu_count()*3) as ex:
-        res = ex.map(dynamicsCalculator.GetDynamicsByYear, [f'CsvFilesByYear\\DataByYear{year}.csv' for year in splitter.years], splitter.years)
+        res = ex.map(dynamicsCalculator.GetDynamicsByYear, [splitter.GetFileName(year) for year in splitter.years], splitter.years)
     dynamicsCalculator.HandleResults(res)
     CitiesSalaryData, CitiesRatioData = dynamicsCalculator.GetDynamicsByCity(fileName)
     print("Уровень зарплат по городам (в порядке убывания):", CitiesSalaryData)
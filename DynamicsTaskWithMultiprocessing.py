@@ -5,10 +5,11 @@ from DynamicsCalculator import Calculator
 if __name__ == "__main__":
     fileName = input("Введите название файла: ")
     vacancyName = input("Введите название профессии: ")
+    areaName = input("Введите название региона: ")
     splitter = Splitter(fileName, "CsvFilesByYear", "DataByYear")
-    dynamicsCalculator = Calculator(vacancyName)
+    dynamicsCalculator = Calculator(vacancyName, areaName)
     with multiprocessing.Pool(multiprocessing.cpu_count() * 3) as p:
-        p.starmap_async(dynamicsCalculator.GetDynamicsByYear, [(f'CsvFilesByYear\\DataByYear{year}.csv', year) for year in splitter.years], callback=dynamicsCalculator.HandleResults)
+        p.starmap_async(dynamicsCalculator.GetDynamicsByYear, [(splitter.GetFileName(year), year) for year in splitter.years], callback=dynamicsCalculator.HandleResults)
         p.close()
         p.join()
     CitiesSalaryData, CitiesRatioData = dynamicsCalculator.GetDynamicsByCity(fileName)
@@ -0,0 +1,12 @@
+from SharedDynamicsEngine import SharedDynamicsEngine
+from DynamicsCalculator import Calculator
+
+if __name__ == "__main__":
+    fileName = input("Введите название файла: ")
+    vacancyName = input("Введите название профессии: ")
+    areaName = input("Введите название региона: ")
+    with SharedDynamicsEngine(fileName) as engine:
+        engine.GetDynamics(vacancyName, areaName)
+    CitiesSalaryData, CitiesRatioData = Calculator(vacancyName, areaName).GetDynamicsByCity(fileName)
+    print("Уровень зарплат по городам (в порядке убывания):", CitiesSalaryData)
+    print("Доля вакансий по городам (в порядке убывания):", CitiesRatioData)
\ No newline at end of file
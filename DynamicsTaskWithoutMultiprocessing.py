@@ -5,9 +5,10 @@ from DynamicsCalculator import Calculator
 if __name__ == "__main__":
     fileName = input("Введите название файла: ")
     vacancyName = input("Введите название профессии: ")
+    areaName = input("Введите название региона: ")
     splitter = Splitter(fileName, "CsvFilesByYear", "DataByYear")
-    dynamicsCalculator = Calculator(vacancyName)
-    files = [(f'CsvFilesByYear\\DataByYear{year}.csv', year) for year in splitter.years]
+    dynamicsCalculator = Calculator(vacancyName, areaName)
+    files = [(splitter.GetFileName(year), year) for year in splitter.years]
     res = []
     for name, year in files:
         res.append(dynamicsCalculator.GetDynamicsByYear(name, year))
@@ -0,0 +1,176 @@
+import io
+import csv
+import mmap
+import os
+from itertools import repeat
+from contextlib import ExitStack
+from concurrent.futures import ProcessPoolExecutor
+from CsvRecords import CsvRecords
+
+
+class ChunkBoundaryError(ValueError):
+    """
+    Граница куска CSV-файла оказалась внутри поля в кавычках
+    """
+
+
+class ParallelCsvReader:
+    """
+    Параллельное чтение CSV-файла: файл отображается в память (mmap), делится на куски по границам записей,
+    и куски обрабатываются в пуле процессов, а результаты возвращаются в исходном порядке.
+    Граница куска ставится только после перевода строки, перед которым четное количество кавычек
+    от начала файла, то есть вне поля в кавычках, поэтому многострочные описания не разрезаются.
+    Четность верна для файлов, записанных csv.writer, но ломается на кавычке внутри поля без кавычек
+    (csv.reader читает ее как обычный символ). Поэтому каждая граница проверяется модулем csv при чтении
+    предыдущего куска (ReadChunk), и если она оказалась внутри поля в кавычках, остаток файла,
+    начиная с последней подтвержденной границы, обрабатывается одним куском
+
+    Attributes:
+        fileName (str): Название файла
+        processesCount (int): Количество процессов
+        chunkSize (int): Примерный размер куска в байтах (None - по 4 куска на процесс, но не меньше 1 МБ)
+    """
+
+    def __init__(self, fileName, processesCount, chunkSize=None):
+        """
+        Инициализирует объект ParallelCsvReader
+
+        Args:
+            fileName (str): Название файла
+            processesCount (int): Количество процессов
+            chunkSize (int): Примерный размер куска в байтах (None - по 4 куска на процесс, но не меньше 1 МБ)
+        """
+        self.fileName = fileName
+        self.processesCount = processesCount
+        self.chunkSize = chunkSize
+
+    def Map(self, func, *args):
+        """
+        Применяет функцию к каждому куску файла после заголовка. Если кусок один или процесс один,
+        пул процессов не создается. Если функция для куска выбросила ChunkBoundaryError (граница после
+        куска не подтвердилась), результаты следующих кусков отбрасываются, а функция применяется
+        к остатку файла от начала этого куска
+
+        Args:
+            func (function): Функция func(fileName, start, end, *args) уровня модуля или класса,
+                читающая кусок через ReadChunk до конца
+            *args: Дополнительные аргументы функции
+
+        Returns:
+            generator: Результаты функции для кусков в порядке их следования в файле
+        """
+        boundaries = self.SplitChunks(self.__GetDataStart())
+        starts, ends = boundaries[:-1], boundaries[1:]
+        with ExitStack() as stack:
+            if self.processesCount <= 1 or len(starts) <= 1:
+                executor, mapFunc = None, map
+            else:
+                executor = stack.enter_context(ProcessPoolExecutor(self.processesCount))
+                mapFunc = executor.map
+            results = mapFunc(func, repeat(self.fileName), starts, ends, *(repeat(arg) for arg in args))
+            for start in starts:
+                try:
+                    result = next(results)
+                except ChunkBoundaryError:
+                    if executor is not None:
+                        executor.shutdown(cancel_futures=True)
+                    yield func(self.fileName, start, boundaries[-1], *args)
+                    return
+                yield result
+
+    def SplitChunks(self, start):
+        """
+        Делит файл, начиная со смещения start, на куски по границам записей
+
+        Args:
+            start (int): Смещение начала первой записи
+
+        Returns:
+            list[int]: Границы кусков (первая - start, последняя - размер файла)
+        """
+        size = os.path.getsize(self.fileName)
+        if start >= size:
+            return [start]
+        chunkSize = self.chunkSize or max(size // (max(self.processesCount, 1) * 4), 1 << 20)
+        boundaries = [start]
+        with open(self.fileName, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            quotesCount, position = data[:start].count(b'"'), start
+            for target in range(start + chunkSize, size, chunkSize):
+                if target <= position:
+                    continue
+                quotesCount += data[position:target].count(b'"')
+                position = self.__FindRecordEnd(data, target, quotesCount)
+                if position is None:
+                    break
+                quotesCount += data[target:position].count(b'"')
+                if position < size:
+                    boundaries.append(position)
+        boundaries.append(size)
+        return boundaries
+
+    @staticmethod
+    def ReadChunk(fileName, start, end):
+        """
+        Читает записи куска файла так же, как csv.DictReader по файлу, открытому с newline='' (пустые строки
+        пропускаются). Если кусок не последний, после него читается лишняя пустая строка: вне поля в кавычках
+        она дает пустую запись, а внутри поля в кавычках дописывается к полю. Так проверяется, что конец
+        куска - граница записи
+
+        Args:
+            fileName (str): Название файла
+            start (int): Смещение начала куска
+            end (int): Смещение конца куска
+
+        Returns:
+            generator: Записи куска в виде списков полей
+
+        Raises:
+            ChunkBoundaryError: Конец куска оказался внутри поля в кавычках (после чтения последней записи)
+        """
+        with open(fileName, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            text = data[start:end].decode("utf-8-sig" if start == 0 else "utf-8")
+            isLastChunk = end >= len(data)
+        lastRecord = []
+        for record in csv.reader(io.StringIO(text if isLastChunk else text + "\n", newline="")):
+            if lastRecord:
+                yield lastRecord
+            lastRecord = record
+        if lastRecord and not isLastChunk:
+            raise ChunkBoundaryError(f'Граница куска {end} попала внутрь поля в кавычках')
+        if lastRecord:
+            yield lastRecord
+
+    @staticmethod
+    def __FindRecordEnd(data, position, quotesCount):
+        """
+        Ищет ближайший после position перевод строки вне поля в кавычках
+
+        Args:
+            data (mmap.mmap): Содержимое файла
+            position (int): Смещение, с которого начинается поиск
+            quotesCount (int): Количество кавычек от начала файла до position
+
+        Returns:
+            int: Смещение после найденного перевода строки (None - такого перевода строки нет)
+        """
+        while True:
+            newline = data.find(b"\n", position)
+            if newline == -1:
+                return None
+            quotesCount += data[position:newline].count(b'"')
+            position = newline + 1
+            if quotesCount % 2 == 0:
+                return position
+
+    def __GetDataStart(self):
+        """
+        Возвращает смещение первой записи после заголовка
+
+        Returns:
+            int: Смещение первой записи после заголовка (размер файла, если записей нет)
+        """
+        records = CsvRecords(self.fileName).ReadRecords()
+        next(records, None)
+        dataStart = next(records, (os.path.getsize(self.fileName), None))[0]
+        records.close()
+        return dataStart
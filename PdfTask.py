@@ -7,6 +7,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 from openpyxl.styles import Font, NamedStyle, Side, Border
 from jinja2 import Environment, FileSystemLoader
+from VacanciesStatistics import StreamingDataSet
 
 
 
@@ -669,9 +670,12 @@ class Report:
         config = pdfkit.configuration(wkhtmltopdf=r"C:\Program Files\wkhtmltopdf\bin\wkhtmltopdf.exe")
         pdfkit.from_string(pdfTemplate, "report.pdf", configuration=config, options=options)
 
-inputData = InputConnect()
-dataSet = DataSet(inputData.fileName, inputData.vacancyName)
-inputData.PrintData(dataSet)
+if __name__ == "__main__":
+    inputData = InputConnect()
+    dataSet = StreamingDataSet(inputData.fileName, inputData.vacancyName,
+                                useCache="--cache" in sys.argv)
+    inputData.PrintData(dataSet)
+
+    reportData = Report(dataSet.vacancyNameParameter)
+    reportData.GeneratePDF(inputData.GetListData((dataSet)))
 
-reportData = Report(dataSet.vacancyNameParameter)
-reportData.GeneratePDF(inputData.GetListData((dataSet)))
@@ -0,0 +1,123 @@
+import re
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+
+
+class RowCleaner:
+    """
+    Движок очистки полей вакансий от HTML-тегов и лишних пробельных символов.
+    Регулярное выражение компилируется один раз, а поле без тегов и переносов строк не проходит через regex.
+    Выражение '<[^>\\n]*>' находит те же теги, что и '<.*?>', но работает без возвратов.
+
+    Attributes:
+        __tagsCleaner (re.Pattern): Регулярное выражение для поиска HTML-тегов
+        processesCount (int): Количество процессов для очистки колонки poolColumn (0 - без пула процессов)
+        poolColumn (str): Название колонки, которая очищается в пуле процессов
+        batchSize (int): Количество строк, отправляемых в пул процессов за один раз
+    """
+    __tagsCleaner = re.compile('<[^>\n]*>')
+
+    def __init__(self, processesCount=0, poolColumn="description", batchSize=10000):
+        """
+        Инициализирует объект RowCleaner
+
+        Args:
+            processesCount (int): Количество процессов для очистки колонки poolColumn (0 - без пула процессов)
+            poolColumn (str): Название колонки, которая очищается в пуле процессов
+            batchSize (int): Количество строк, отправляемых в пул процессов за один раз
+        """
+        self.processesCount = processesCount
+        self.poolColumn = poolColumn
+        self.batchSize = batchSize
+
+    @staticmethod
+    def CleanRow(row):
+        """
+        Очищает поле вакансии в CSV-файле от лишних символов
+
+        Args:
+            row (str): Поле вакансии
+
+        Returns:
+            (str): Очищенное поле вакансии
+
+        >>> RowCleaner.CleanRow("<p>Требования:<br />- Python\\r\\n- SQL</p>")
+        'Требования:- Python; - SQL'
+        >>> RowCleaner.CleanRow("  a <b\\n> c  ")
+        'a <b; > c'
+        """
+        if '<' in row:
+            row = RowCleaner.__tagsCleaner.sub('', row)
+        if '\n' in row:
+            row = row.replace('\n', '; ')
+        if '\r' in row:
+            row = row.replace('\r', '')
+        return " ".join(row.split())
+
+    def CleanRows(self, rows, columnNames, predicate=None, predicateColumns=()):
+        """
+        Очищает все поля строк CSV-файла. Если задан предикат, сначала очищаются только поля predicateColumns,
+        и строки, не прошедшие предикат, дальше не очищаются.
+        Если задано количество процессов, колонка poolColumn очищается пачками в пуле процессов
+        с сохранением порядка строк. Пул создается, только если первая пачка заполнена целиком:
+        для меньшего числа строк (например, найденных по индексу навыков) запуск процессов дороже очистки
+
+        Args:
+            rows: Строки файла в виде словарей
+            columnNames (list[str]): Список заголовков полей
+            predicate (function): Предикат над очищенными полями predicateColumns (None - без фильтрации)
+            predicateColumns (list[str]): Поля, необходимые предикату
+
+        Returns:
+            generator: Очищенные строки в виде словарей
+        """
+        rows = self.__FilterRows(rows, predicate, predicateColumns)
+        if not self.processesCount or self.poolColumn not in columnNames or self.poolColumn in predicateColumns:
+            for row, cleanedRow in rows:
+                yield self.__CleanRemaining(row, cleanedRow, columnNames)
+            return
+        batch = list(islice(rows, self.batchSize))
+        if len(batch) < self.batchSize:
+            for row, cleanedRow in batch:
+                yield self.__CleanRemaining(row, cleanedRow, columnNames)
+            return
+        with ProcessPoolExecutor(self.processesCount) as executor:
+            while batch:
+                chunkSize = max(1, len(batch) // (self.processesCount * 4))
+                poolValues = executor.map(RowCleaner.CleanRow, [row[self.poolColumn] for row, cleanedRow in batch],
+                                          chunksize=chunkSize)
+                for (row, cleanedRow), poolValue in zip(batch, poolValues):
+                    cleanedRow[self.poolColumn] = poolValue
+                    yield self.__CleanRemaining(row, cleanedRow, columnNames)
+                batch = list(islice(rows, self.batchSize))
+
+    def __FilterRows(self, rows, predicate, predicateColumns):
+        """
+        Очищает поля, необходимые предикату, и отбрасывает строки, не прошедшие предикат
+
+        Args:
+            rows: Строки файла в виде словарей
+            predicate (function): Предикат над очищенными полями predicateColumns (None - без фильтрации)
+            predicateColumns (list[str]): Поля, необходимые предикату
+
+        Returns:
+            generator: Пары (исходная строка, уже очищенные поля)
+        """
+        for row in rows:
+            cleanedRow = {name: self.CleanRow(row[name]) for name in predicateColumns}
+            if predicate is None or predicate(cleanedRow):
+                yield row, cleanedRow
+
+    def __CleanRemaining(self, row, cleanedRow, columnNames):
+        """
+        Очищает оставшиеся поля строки, сохраняя порядок заголовков
+
+        Args:
+            row (dict): Исходная строка
+            cleanedRow (dict): Уже очищенные поля
+            columnNames (list[str]): Список заголовков полей
+
+        Returns:
+            dict: Очищенная строка
+        """
+        return {name: cleanedRow[name] if name in cleanedRow else self.CleanRow(row[name]) for name in columnNames}
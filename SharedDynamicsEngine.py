@@ -0,0 +1,95 @@
+import os
+import multiprocessing
+import numpy as np
+import pandas as pd
+from multiprocessing.shared_memory import SharedMemory
+from DynamicsCalculator import Calculator
+
+workerArrays = {}
+
+
+def InitWorker(specs):
+    for column, (name, dtype, shape) in specs.items():
+        sharedMemory = SharedMemory(name)
+        workerArrays[column] = (sharedMemory, np.ndarray(shape, dtype, buffer=sharedMemory.buf))
+
+
+def ComputeYear(task):
+    year, start, end, areaCode, isVacancyName = task
+    arrays = {column: array[start:end] for column, (sharedMemory, array) in workerArrays.items()}
+    generalMask = arrays["areaCodes"] == areaCode
+    vacancyMask = generalMask & isVacancyName[arrays["nameCodes"]]
+    return (year, GetSalariesData(arrays["salaries"][generalMask]), int(generalMask.sum()),
+            GetSalariesData(arrays["salaries"][vacancyMask]), int(vacancyMask.sum()))
+
+
+def GetSalariesData(salaries):
+    if len(salaries) == 0:
+        return 0
+    isMissing = np.isnan(salaries)
+    return int(np.where(isMissing, 0, salaries).sum() / (len(salaries) - isMissing.sum()))
+
+
+class SharedDynamicsEngine:
+    def __init__(self, fileName, processesCount=None):
+        self.fileName = fileName
+        self.processesCount = processesCount or os.cpu_count() or 1
+        self.sharedMemories = []
+        self.pool = None
+
+    def __enter__(self):
+        df = pd.read_csv(self.fileName, usecols=["name", "area_name", "salary", "published_at"])
+        years = df["published_at"].str[0:4].astype(int).to_numpy()
+        self.years = pd.unique(years)
+        order = np.argsort(years, kind="stable")
+        sortedYears = years[order]
+        self.yearRanges = {year: (int(np.searchsorted(sortedYears, year)),
+                                  int(np.searchsorted(sortedYears, year, side="right"))) for year in self.years}
+        nameCodes, self.names = pd.factorize(df["name"])
+        areaCodes, self.areas = pd.factorize(df["area_name"])
+        columns = {"nameCodes": nameCodes[order].astype(np.int32), "areaCodes": areaCodes[order].astype(np.int32),
+                   "salaries": df["salary"].to_numpy(dtype=np.float64)[order]}
+        del df
+        if self.processesCount > 1:
+            try:
+                specs = {column: self.CreateSharedArray(array) for column, array in columns.items()}
+                self.pool = multiprocessing.Pool(self.processesCount, InitWorker, (specs,))
+            except BaseException:
+                self.ReleaseSharedArrays()
+                raise
+        else:
+            workerArrays.update({column: (None, array) for column, array in columns.items()})
+        return self
+
+    def __exit__(self, *args):
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+        workerArrays.clear()
+        self.ReleaseSharedArrays()
+
+    def ReleaseSharedArrays(self):
+        while self.sharedMemories:
+            sharedMemory = self.sharedMemories.pop()
+            sharedMemory.close()
+            sharedMemory.unlink()
+
+    def CreateSharedArray(self, array):
+        sharedMemory = SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, array.dtype, buffer=sharedMemory.buf)[:] = array
+        self.sharedMemories.append(sharedMemory)
+        return sharedMemory.name, array.dtype.str, array.shape
+
+    def IterDynamicsByYear(self, vacancyName, areaName):
+        areaCodes = np.flatnonzero(self.areas == areaName)
+        areaCode = areaCodes[0] if len(areaCodes) else len(self.areas)
+        isVacancyName = np.append(np.asarray(self.names.str.contains(vacancyName), dtype=bool), False)
+        tasks = [(year, *self.yearRanges[year], areaCode, isVacancyName) for year in self.years]
+        if self.pool is None:
+            return map(ComputeYear, tasks)
+        return self.pool.imap_unordered(ComputeYear, tasks)
+
+    def GetDynamics(self, vacancyName, areaName):
+        yearsOrder = {year: i for i, year in enumerate(self.years)}
+        results = sorted(self.IterDynamicsByYear(vacancyName, areaName), key=lambda result: yearsOrder[result[0]])
+        return Calculator(vacancyName, areaName).HandleResults(results)
@@ -0,0 +1,152 @@
+import os
+import json
+from array import array
+from CsvRecords import CsvRecords
+from RowCleaner import RowCleaner
+
+
+class SkillsIndex:
+    """
+    Инвертированный индекс навыков CSV-файла: для каждого навыка хранится список номеров корректных строк,
+    в которых он встречается, а для каждой корректной строки - байтовое смещение ее начала.
+    Индекс строится один раз, сохраняется рядом с CSV-файлом и перестраивается,
+    если у файла изменились размер или время изменения.
+    Файл индекса - строка заголовка в JSON и сырые байты массивов смещений и номеров строк,
+    поэтому при загрузке из него не может выполниться код (в отличие от pickle)
+
+    Attributes:
+        version (int): Версия формата индекса
+        fileName (str): Название CSV-файла
+        indexFileName (str): Название файла индекса
+        columnNames (list[str]): Список заголовков полей
+        validRowsCount (int): Количество корректных строк (все поля заполнены)
+        offsets (array): Смещения начала корректных строк
+        postings (dict): Номера корректных строк для каждого навыка
+    """
+    version = 2
+
+    def __init__(self, fileName):
+        """
+        Инициализирует объект SkillsIndex: загружает индекс с диска или строит его заново
+
+        Args:
+            fileName (str): Название CSV-файла
+        """
+        self.fileName = fileName
+        self.indexFileName = f'{fileName}.skills.idx'
+        if not self.__Load():
+            self.__Build()
+            self.__Save()
+
+    def Find(self, expectedSkills):
+        """
+        Возвращает номера корректных строк, в которых есть все заданные навыки (пересечение списков)
+
+        Args:
+            expectedSkills (set[str]): Навыки
+
+        Returns:
+            list[int]: Номера корректных строк по возрастанию
+        """
+        postings = sorted((self.postings.get(skill, ()) for skill in expectedSkills), key=len)
+        if not postings:
+            return list(range(self.validRowsCount))
+        rowIds = set(postings[0])
+        for posting in postings[1:]:
+            rowIds.intersection_update(posting)
+        return sorted(rowIds)
+
+    def ReadRows(self, rowIds):
+        """
+        Читает из CSV-файла только строки с заданными номерами
+
+        Args:
+            rowIds (list[int]): Номера корректных строк по возрастанию
+
+        Returns:
+            generator: Строки файла в виде словарей
+        """
+        records = CsvRecords(self.fileName).ReadRecordsAt(self.offsets[rowId] for rowId in rowIds)
+        for record in records:
+            yield dict(zip(self.columnNames, record))
+
+    def __Build(self):
+        """
+        Строит индекс за один проход по CSV-файлу
+        """
+        records = CsvRecords(self.fileName).ReadRecords()
+        self.columnNames = next(records, (0, []))[1]
+        columnsCount = len(self.columnNames)
+        skillsColumn = self.columnNames.index("key_skills")
+        self.offsets, self.postings = array('Q'), {}
+        for offset, record in records:
+            if len(record) == columnsCount and all(record):
+                rowId = len(self.offsets)
+                self.offsets.append(offset)
+                for skill in set(RowCleaner.CleanRow(record[skillsColumn]).split("; ")):
+                    self.postings.setdefault(skill, array('I')).append(rowId)
+        self.validRowsCount = len(self.offsets)
+
+    def __GetFingerprint(self):
+        """
+        Возвращает отпечаток CSV-файла, по которому проверяется актуальность индекса
+
+        Returns:
+            (int, int, int): Версия формата индекса, размер и время изменения файла
+        """
+        fileStat = os.stat(self.fileName)
+        return self.version, fileStat.st_size, fileStat.st_mtime_ns
+
+    def __Load(self):
+        """
+        Загружает индекс с диска, если он есть и построен для текущей версии CSV-файла
+
+        Returns:
+            bool: Загружен ли индекс
+        """
+        try:
+            with open(self.indexFileName, "rb") as file:
+                header = json.loads(file.readline())
+                fingerprint, self.columnNames = tuple(header["fingerprint"]), header["columnNames"]
+                self.offsets = self.__ReadArray(file, 'Q', header["validRowsCount"])
+                self.postings = {skill: self.__ReadArray(file, 'I', count) for skill, count in header["skills"]}
+        except (OSError, ValueError, TypeError, KeyError):
+            return False
+        self.validRowsCount = len(self.offsets)
+        return fingerprint == self.__GetFingerprint()
+
+    @staticmethod
+    def __ReadArray(file, typeCode, count):
+        """
+        Читает из файла индекса массив заданного типа и длины
+
+        Args:
+            file: Файл индекса
+            typeCode (str): Код типа элементов массива
+            count (int): Количество элементов
+
+        Returns:
+            array: Массив
+        """
+        values = array(typeCode)
+        data = file.read(values.itemsize * count)
+        if len(data) != values.itemsize * count:
+            raise ValueError("Файл индекса навыков поврежден")
+        values.frombytes(data)
+        return values
+
+    def __Save(self):
+        """
+        Сохраняет индекс рядом с CSV-файлом. Если каталог недоступен для записи, индекс остается только в памяти
+        """
+        header = {"fingerprint": self.__GetFingerprint(), "columnNames": self.columnNames,
+                  "validRowsCount": len(self.offsets),
+                  "skills": [[skill, len(posting)] for skill, posting in self.postings.items()]}
+        try:
+            with open(self.indexFileName, "wb") as file:
+                file.write(json.dumps(header, ensure_ascii=False).encode() + b"\n")
+                file.write(self.offsets.tobytes())
+                for posting in self.postings.values():
+                    file.write(posting.tobytes())
+        except OSError:
+            pass
@@ -1,17 +1,84 @@
+import os
 import pandas as pd
+from contextlib import ExitStack
 
 
 class Splitter:
-    def __init__(self, fileName, outputPath, outputName):
+    outputFormats = {"csv": ".csv", "parquet": ".parquet", "feather": ".feather"}
+
+    def __init__(self, fileName, outputPath, outputName, chunkSize=100000, outputFormat="csv", compression="zstd"):
+        if outputFormat not in self.outputFormats:
+            raise ValueError(f'Неизвестный формат вывода: {outputFormat}')
         self.fileName = fileName
         self.outputPath = outputPath
         self.outputName = outputName
+        self.chunkSize = chunkSize
+        self.outputFormat = outputFormat
+        self.compression = compression
         self.SplitFileByYear()
 
     def SplitFileByYear(self):
-        df = pd.read_csv(self.fileName)
-        df["years"] = df["published_at"].apply(lambda date: int(date[0:4]))
-        self.years = df["years"].unique()
-        dfGroupByYear = df.groupby("years")
-        for year, data in dfGroupByYear:
-            data.iloc[:, :6].to_csv(f'{self.outputPath}\\{self.outputName}{year}.csv', index=False)
+        os.makedirs(self.outputPath, exist_ok=True)
+        dtypes = self.GetColumnTypes()
+        years = {}
+        with ExitStack() as stack:
+            for chunk in pd.read_csv(self.fileName, dtype=dtypes, chunksize=self.chunkSize):
+                chunk["years"] = chunk["published_at"].str[0:4].astype(int)
+                for year, data in chunk.groupby("years", sort=False):
+                    data = data.iloc[:, :6]
+                    isNewYear = year not in years
+                    if isNewYear:
+                        years[year] = self.OpenWriter(stack, year, data)
+                    self.WriteData(years[year], data, isNewYear)
+        self.years = pd.Index(years).to_numpy()
+
+    def OpenWriter(self, stack, year, data):
+        if self.outputFormat == "csv":
+            return stack.enter_context(open(self.GetFileName(year), "w", encoding="utf-8", newline="")), None
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            raise ImportError(f'Для формата {self.outputFormat} нужен пакет pyarrow') from error
+        schema = pa.Schema.from_pandas(data, preserve_index=False)
+        if self.outputFormat == "parquet":
+            writer = pq.ParquetWriter(self.GetFileName(year), schema, compression=self.compression)
+        else:
+            sink = stack.enter_context(pa.OSFile(self.GetFileName(year), "wb"))
+            writer = pa.ipc.new_file(sink, schema, options=pa.ipc.IpcWriteOptions(compression=self.compression))
+        stack.callback(writer.close)
+        return writer, schema
+
+    def WriteData(self, output, data, isNewYear):
+        writer, schema = output
+        if self.outputFormat == "csv":
+            data.to_csv(writer, index=False, header=isNewYear)
+        else:
+            import pyarrow as pa
+            writer.write_table(pa.Table.from_pandas(data, schema=schema, preserve_index=False))
+
+    def GetColumnTypes(self):
+        kinds = {column: {self.GetKind(dtype)} for column, dtype in
+                 pd.read_csv(self.fileName, nrows=self.chunkSize).dtypes.items()}
+        typedColumns = [column for column, columnKinds in kinds.items() if columnKinds != {"O"}]
+        if typedColumns:
+            for chunk in pd.read_csv(self.fileName, usecols=typedColumns, chunksize=self.chunkSize):
+                for column, dtype in chunk.dtypes.items():
+                    kinds[column].add(self.GetKind(dtype))
+        dtypes = {}
+        for column, columnKinds in kinds.items():
+            if columnKinds == {"i"}:
+                dtypes[column] = "int64"
+            elif columnKinds <= {"i", "f"}:
+                dtypes[column] = "float64"
+            elif columnKinds == {"b"}:
+                dtypes[column] = "bool"
+            else:
+                dtypes[column] = str
+        return dtypes
+
+    def GetKind(self, dtype):
+        return dtype.kind if dtype.kind in "ifb" else "O"
+
+    def GetFileName(self, year):
+        return os.path.join(self.outputPath, f'{self.outputName}{year}{self.outputFormats[self.outputFormat]}')
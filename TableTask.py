@@ -2,9 +2,14 @@ import sys
 from datetime import datetime
 from prettytable import *
 import csv
-import re
 import os
+import json
+import heapq
 import doctest
+from RowCleaner import RowCleaner
+from SkillsIndex import SkillsIndex
+from DatasetCache import DatasetCache
+from ParallelCsvReader import ParallelCsvReader
 
 
 class InputConnect:
@@ -23,6 +28,7 @@ class InputConnect:
         isReverseSort (bool): Порядок сортировки
         outputRange (list[str]): Диапазон вывода
         outputColumns(list[str]): Колонки вывода
+        topCount (int): Количество первых вакансий, достаточное для вывода (None - нужны все вакансии)
 
     """
     __formatFuncs = {"name": lambda vacancy: vacancy.name,
@@ -33,9 +39,7 @@ class InputConnect:
                      "employer_name": lambda vacancy: vacancy.employerName,
                      "salary": lambda vacancy: vacancy.salary.Format(),
                      "area_name": lambda vacancy: vacancy.areaName,
-                     "published_at": lambda vacancy: datetime.strptime(vacancy.publishedAt,
-                                                                       '%Y-%m-%dT%H:%M:%S%z').strftime(
-                         '%d.%m.%Y')}
+                     "published_at": lambda vacancy: vacancy.publishedDay}
     __requests = {"Введите название файла: ": lambda fileName: fileName,
                   "Введите параметр фильтрации: ": lambda filterParameter: InputConnect._SetFilterParameter(
                       filterParameter),
@@ -75,28 +79,33 @@ class InputConnect:
         Args:
             vacancies (list[Vacancy]): Список всех вакансий
         """
+        fieldNames = [self.fieldNames[name] for name in self.correctFields]
+        self.start, self.end = self.__SetRange(vacancies, self.outputRange)
+        self.topCount = self.end if len(self.outputRange) == 2 and 0 <= self.start and 0 <= self.end < len(
+            vacancies) else None
+        self.outputColumns = list(set(fieldNames) & set(self.outputColumns)) + ["№"] if any(
+            self.outputColumns) else ["№"] + fieldNames
+
         self.table = PrettyTable(hrules=ALL, align='l')
-        self.table.field_names = [self.fieldNames[name] for name in self.correctFields]
+        self.table.field_names = ["№"] + fieldNames
         self.table.max_width = 20
 
-        self.start, self.end = self.__SetRange(vacancies, self.outputRange)
-        self.outputColumns = list(set(self.table.field_names) & set(self.outputColumns)) + ["№"] if any(
-            self.outputColumns) else self.table.field_names
-
     def PrintDataSet(self, dataSet):
         """
         Выводит на экран пользователю таблицу с данными,
-        если нет подходящих под параметры поиска вакансий, выводит "Ничего не найдено"
+        если нет подходящих под параметры поиска вакансий, выводит "Ничего не найдено".
+        Форматируются только вакансии из диапазона вывода, номера строк считаются по положению вакансии
+        в общем списке. Скрытые колонки тоже форматируются: от них зависит высота строк таблицы,
+        поэтому вывод совпадает с форматированием всего списка. Диапазон, начинающийся с 0,
+        выводит "Ничего не найдено" (раньше prettytable падал с ValueError)
 
         Args:
             dataSet (DataSet): Данные файла
         """
-        outputVacancies = [self.__Formatter(vacancy)
-                           for vacancy in dataSet.vacanciesObjects]
-        self.table.add_rows(outputVacancies)
-        self.table.add_autoindex("№")
-        outputTable = self.table.get_string(start=self.start, end=self.end, fields=self.outputColumns)
-        if self.start < len(dataSet.vacanciesObjects) > 0:
+        indexes = range(dataSet.vacanciesCount)[self.start:self.end]
+        self.table.add_rows([[index + 1] + self.__Formatter(dataSet.vacanciesObjects[index]) for index in indexes])
+        outputTable = self.table.get_string(fields=self.outputColumns)
+        if 0 <= self.start < dataSet.vacanciesCount > 0:
             print(outputTable)
         else:
             print("Ничего не найдено")
@@ -111,10 +120,10 @@ class InputConnect:
             vacancy (Vacancy): Вакансия
 
         Returns:
-            vacancy (Vacancy): Отформатированная вакансия
+            list[str]: Отформатированная вакансия
         """
         newVacancy = {nameFunc: self.__formatFuncs[nameFunc](vacancy) for nameFunc in self.correctFields}
-        newVacancy = self.__SetMaxChars(newVacancy).values()
+        newVacancy = list(self.__SetMaxChars(newVacancy).values())
         return newVacancy
 
     def __SetRange(self, vacancies, rangeRows):
@@ -256,42 +265,56 @@ class DataSet:
 
     Attributes:
         _sortFuncs (dict): Функции сортировки
-        _filterFuncs (dict): Функции фильтрации
+        _filterFuncs (dict): Функции фильтрации (по очищенным полям строки CSV-файла)
+        _filterColumns (dict): Поля CSV-файла, необходимые для каждой функции фильтрации
         _sortFuncs (dict): Функции сортировки
         _experience (dict): Словарь для перевода поля опыта с английского на русский
         _experienceSort (dict): Словарь для перевода поля опыта с английского на порядко сортировки
         _boolFields (dict): Словарь для перевода булиевых полей с английского на русский
         _reverseFieldNames (dict): Словарь для перевода полей с русского на английский
         fileName (str): Название файла
+        processesCount (int): Количество процессов для чтения и очистки файла по кускам (0 - без пула процессов)
+        rowCleaner (RowCleaner): Движок очистки полей вакансий
+        useSkillsIndex (bool): Использовать ли для фильтра "Навыки" инвертированный индекс навыков
+        useCache (bool): Брать ли очищенные строки файла из дискового кэша DatasetCache
+        vacanciesCount (int): Количество вакансий, подходящих под параметр фильтрации
     """
     _sortFuncs = {"Название": lambda vacancy: vacancy.name,
                   "Описание": lambda vacancy: vacancy.description,
-                  "Навыки": lambda vacancy: len(vacancy.keySkills.split("\n")),
+                  "Навыки": lambda vacancy: len(vacancy.skills),
                   "Опыт работы": lambda vacancy: DataSet._experienceSort[vacancy.experienceId],
                   "Премиум-вакансия": lambda vacancy: vacancy.premium,
                   "Компания": lambda vacancy: vacancy.employerName,
                   "Оклад": lambda vacancy: vacancy.salary.Sort(),
                   "Идентификатор валюты оклада": lambda vacancy: vacancy.salary.salaryCurrency,
                   "Название региона": lambda vacancy: vacancy.areaName,
-                  "Дата публикации вакансии": lambda vacancy: datetime.strptime(vacancy.publishedAt,
-                                                                                '%Y-%m-%dT%H:%M:%S%z')}
-    _filterFuncs = {"Название": lambda expectedName, vacancy: expectedName == vacancy.name,
-                    "Описание": lambda expectedDesc, vacancy: expectedDesc == vacancy.description,
-                    "Навыки": lambda expectedSkills, vacancy: set(expectedSkills.split(", ")) <= set(
-                        vacancy.keySkills.split("\n")),
-                    "Опыт работы": lambda expectedExp, vacancy: expectedExp == DataSet._experience[
-                        vacancy.experienceId],
-                    "Премиум-вакансия": lambda expectedPrem, vacancy: expectedPrem == DataSet._boolFields[
-                        vacancy.premium],
-                    "Компания": lambda expectedEmployer, vacancy: expectedEmployer == vacancy.employerName,
-                    "Оклад": lambda expectedSalary, vacancy: vacancy.salary.SumFilter(expectedSalary),
-                    "Идентификатор валюты оклада": lambda expectedCurrency, vacancy: vacancy.salary.CurrencyFilter(
-                        expectedCurrency),
-                    "Название региона": lambda expectedArea, vacancy: expectedArea == vacancy.areaName,
-                    "Дата публикации вакансии": lambda expectedDate, vacancy: expectedDate == datetime.strptime(
-                        vacancy.publishedAt,
-                        '%Y-%m-%dT%H:%M:%S%z').strftime(
-                        '%d.%m.%Y')}
+                  "Дата публикации вакансии": lambda vacancy: vacancy.publishedTimestamp}
+    _filterFuncs = {"Название": lambda expectedName, row: expectedName == row["name"],
+                    "Описание": lambda expectedDesc, row: expectedDesc == row["description"],
+                    "Навыки": lambda expectedSkills, row: expectedSkills <= set(row["key_skills"].split("; ")),
+                    "Опыт работы": lambda expectedExp, row: expectedExp == DataSet._experience[row["experience_id"]],
+                    "Премиум-вакансия": lambda expectedPrem, row: expectedPrem == DataSet._boolFields[row["premium"]],
+                    "Компания": lambda expectedEmployer, row: expectedEmployer == row["employer_name"],
+                    "Оклад": lambda expectedSalary, row: int(float(row["salary_to"])) >= expectedSalary >= int(
+                        float(row["salary_from"])),
+                    "Идентификатор валюты оклада": lambda expectedCurrency, row: expectedCurrency ==
+                                                                                 Salary._salaryCurrency[
+                                                                                     row["salary_currency"]],
+                    "Название региона": lambda expectedArea, row: expectedArea == row["area_name"],
+                    "Дата публикации вакансии": lambda expectedDate, row: expectedDate == Vacancy.FormatDay(
+                        row["published_at"])}
+    _filterColumns = {"Название": ["name"],
+                      "Описание": ["description"],
+                      "Навыки": ["key_skills"],
+                      "Опыт работы": ["experience_id"],
+                      "Премиум-вакансия": ["premium"],
+                      "Компания": ["employer_name"],
+                      "Оклад": ["salary_from", "salary_to"],
+                      "Идентификатор валюты оклада": ["salary_currency"],
+                      "Название региона": ["area_name"],
+                      "Дата публикации вакансии": ["published_at"]}
+    _expectedParsers = {"Навыки": lambda expectedSkills: set(expectedSkills.split(", ")),
+                        "Оклад": lambda expectedSalary: int(float(expectedSalary))}
     _experience = {"noExperience": "Нет опыта",
                    "between1And3": "От 1 года до 3 лет",
                    "between3And6": "От 3 до 6 лет",
@@ -307,13 +330,20 @@ class DataSet:
 
     _reverseFieldNames = {v: k for k, v in InputConnect.fieldNames.items()}
 
-    def __init__(self, inputData):
+    def __init__(self, inputData, processesCount=0, useSkillsIndex=True, useCache=False):
         """
         Инициализирует объект DataSet
         Args:
             inputData (InputConnect): данные введенные пользователем
+            processesCount (int): Количество процессов для чтения и очистки файла по кускам (0 - без пула процессов)
+            useSkillsIndex (bool): Использовать ли для фильтра "Навыки" инвертированный индекс навыков
+            useCache (bool): Брать ли очищенные строки файла из дискового кэша DatasetCache
         """
         self.fileName = inputData.fileName
+        self.processesCount = processesCount
+        self.rowCleaner = RowCleaner(processesCount)
+        self.useSkillsIndex = useSkillsIndex
+        self.useCache = useCache
         self.__UniversalParserCSV(inputData)
 
     def __UniversalParserCSV(self, inputData):
@@ -328,11 +358,12 @@ class DataSet:
         isReverseSort = inputData.isReverseSort
 
         fileReader, columnNames = self.__CsvReader(inputData.fileName)
-        self.vacanciesObjects = self.__CsvFilter(fileReader, columnNames)
+        self.vacanciesObjects = self.__CsvFilter(fileReader, columnNames, filterParameter)
 
+        self.vacanciesCount = len(self.vacanciesObjects)
         inputData.Initialize(self.vacanciesObjects)
-        self.vacanciesObjects = self.__SortVacancies(sortParameter, self.vacanciesObjects, isReverseSort)
-        self.vacanciesObjects = self.__FilterVacancies(filterParameter, self.vacanciesObjects)
+        self.vacanciesObjects = self.__SortVacancies(sortParameter, self.vacanciesObjects, isReverseSort,
+                                                     inputData.topCount)
 
     @staticmethod
     def CleanRowTest(row):
@@ -354,29 +385,7 @@ class DataSet:
         >>> DataSet.CleanRowTest("</strong> </p> <ul> <li>диагностика неисправностей</li> <li>")
         'диагностика неисправностей'
         """
-        cleaner = re.compile('<.*?>')
-        clearedRow = re.sub(cleaner, '', row)
-        clearedRow = "; ".join(clearedRow.split('\n'))
-        clearedRow = "".join(clearedRow.split('\r'))
-        clearedRow = " ".join(clearedRow.split())
-        return clearedRow
-
-    def __CleanRow(self, row):
-        """
-        Очищает поле вакансии в CSV-файле от лишних символов
-
-        Args:
-            row (str): Поле вакансии
-
-        Returns:
-            (str): Очищенное поле вакансии
-        """
-        cleaner = re.compile('<.*?>')
-        clearedRow = re.sub(cleaner, '', row)
-        clearedRow = "; ".join(clearedRow.split('\n'))
-        clearedRow = "".join(clearedRow.split('\r'))
-        clearedRow = " ".join(clearedRow.split())
-        return clearedRow
+        return RowCleaner.CleanRow(row)
 
     def __CsvReader(self, fileName):
         """
@@ -394,69 +403,198 @@ class DataSet:
         columnNames = fileReader.fieldnames
         return fileReader, columnNames
 
-    def __CsvFilter(self, fileReader, columnNames):
+    def __CsvFilter(self, fileReader, columnNames, filterParameter):
         """
-        Обрабатывает полученные на вход данные, возвращает список всех вакансий,
-        если нет корректных данных - выводит "Нет данных" и прерывает работу программы
+        Обрабатывает полученные на вход данные, возвращает список вакансий, подходящих под параметр фильтрации.
+        Фильтр проверяется до очистки остальных полей и создания объектов, поэтому отброшенные строки
+        не очищаются и не превращаются в вакансии.
+        Для фильтра "Навыки" строки читаются по индексу навыков, иначе при включенном кэше
+        (если файл помещается в кэш) строки, подходящие под параметр фильтрации, берутся из кэша.
+        Если нет корректных данных - выводит "Нет данных" и прерывает работу программы
 
         Args:
             fileReader: Все строки из файла в виде словарей
             columnNames: Список заголовков полей
+            filterParameter(list[str]): Параметр фильтрации
 
         Returns:
-            list[Vacancy]: Список всех вакансий
+            list[Vacancy]: Список вакансий
         """
         vacancies = []
-        columnsCount = len(columnNames)
+        predicate, predicateColumns = self.__CompileFilter(filterParameter)
+        if self.useSkillsIndex and filterParameter and filterParameter[0] == "Навыки" and "key_skills" in columnNames:
+            rows = self.rowCleaner.CleanRows(self.__IndexedRows(filterParameter[1]), columnNames, predicate,
+                                             predicateColumns)
+        elif self.useCache and DatasetCache().IsCacheable(self.fileName):
+            rows = self.__CachedRows(fileReader, columnNames, filterParameter)
+        else:
+            rows = self.__CleanedRows(fileReader, columnNames, filterParameter)
+        for tempRow in rows:
+            tempRow['salary_from'] = Salary(tempRow['salary_from'], tempRow.pop('salary_to'),
+                                            tempRow.pop("salary_currency"), tempRow.pop("salary_gross"))
+            tempRow['key_skills'] = "\n".join(tempRow['key_skills'].split("; "))
+            vacancies.append(Vacancy(*tempRow.values()))
+
+        if self.validRowsCount == 0:
+            print("Нет данных")
+            sys.exit()
+        return vacancies
+
+    def __CleanedRows(self, fileReader, columnNames, filterParameter):
+        """
+        Читает файл и возвращает очищенные строки, подходящие под параметр фильтрации.
+        Если задано количество процессов, файл читается и очищается по кускам в пуле процессов
+
+        Args:
+            fileReader: Все строки из файла в виде словарей
+            columnNames (list[str]): Список заголовков полей
+            filterParameter(list[str]): Параметр фильтрации
+
+        Returns:
+            generator: Очищенные строки в виде словарей
+        """
+        if self.processesCount:
+            return self.__ParallelRows(columnNames, filterParameter)
+        predicate, predicateColumns = self.__CompileFilter(filterParameter)
+        return self.rowCleaner.CleanRows(self.__ValidRows(fileReader, len(columnNames)), columnNames, predicate,
+                                         predicateColumns)
+
+    def __ParallelRows(self, columnNames, filterParameter):
+        """
+        Читает и очищает файл по кускам в пуле процессов и возвращает строки в исходном порядке
+
+        Args:
+            columnNames (list[str]): Список заголовков полей
+            filterParameter(list[str]): Параметр фильтрации
+
+        Returns:
+            generator: Очищенные строки в виде словарей
+        """
+        self.validRowsCount = 0
+        reader = ParallelCsvReader(self.fileName, self.processesCount)
+        for validRowsCount, rows in reader.Map(DataSet._CleanChunk, columnNames, filterParameter):
+            self.validRowsCount += validRowsCount
+            for values in rows:
+                yield dict(zip(columnNames, values))
+
+    @staticmethod
+    def _CleanChunk(fileName, start, end, columnNames, filterParameter):
+        """
+        Читает кусок файла, отбирает корректные строки, подходящие под параметр фильтрации, и очищает их.
+        Выполняется в процессе пула
+
+        Args:
+            fileName (str): Название файла
+            start (int): Смещение начала куска
+            end (int): Смещение конца куска
+            columnNames (list[str]): Список заголовков полей
+            filterParameter(list[str]): Параметр фильтрации
+
+        Returns:
+            (int, list[tuple]): Количество корректных строк куска и значения очищенных строк
+        """
+        predicate, predicateColumns = DataSet.__CompileFilter(filterParameter)
+        validRows = [dict(zip(columnNames, record)) for record in ParallelCsvReader.ReadChunk(fileName, start, end)
+                     if len(record) == len(columnNames) and all(record)]
+        rows = RowCleaner().CleanRows(validRows, columnNames, predicate, predicateColumns)
+        return len(validRows), [tuple(row.values()) for row in rows]
+
+    def __ValidRows(self, fileReader, columnsCount):
+        """
+        Возвращает только корректные строки файла (все поля заполнены) и считает их количество
+
+        Args:
+            fileReader: Все строки из файла в виде словарей
+            columnsCount (int): Количество заголовков полей
 
+        Returns:
+            generator: Корректные строки файла в виде словарей
+        """
+        self.validRowsCount = 0
         for row in fileReader:
             if all(row.values()) and columnsCount == len(row):
-                tempRow = {columnNames[i]: self.__CleanRow(row[columnNames[i]]) for i in range(columnsCount)}
-                tempRow['salary_from'] = Salary(tempRow['salary_from'], tempRow.pop('salary_to'),
-                                                tempRow.pop("salary_currency"), tempRow.pop("salary_gross"))
-                tempRow['key_skills'] = "\n".join(tempRow['key_skills'].split("; "))
-                vacancies.append(Vacancy(*tempRow.values()))
+                self.validRowsCount += 1
+                yield row
 
-        if len(vacancies) == 0:
-            print("Нет данных")
-            sys.exit()
-        return vacancies
+    def __CachedRows(self, fileReader, columnNames, filterParameter):
+        """
+        Возвращает очищенные строки, подходящие под параметр фильтрации, из дискового кэша.
+        Записи кэша отдельные для каждого параметра фильтрации, поэтому при промахе очищаются
+        только подходящие строки, как и без кэша, и сохраняются в кэш вместе с количеством корректных строк
+
+        Args:
+            fileReader: Все строки из файла в виде словарей
+            columnNames (list[str]): Список заголовков полей
+            filterParameter(list[str]): Параметр фильтрации
+
+        Returns:
+            generator: Очищенные строки в виде словарей
+        """
+        cache = DatasetCache()
+        kind = f'table:{json.dumps(filterParameter, ensure_ascii=False)}'
+        entry = cache.Load(self.fileName, kind)
+        if entry is None:
+            rows = [list(row.values()) for row in self.__CleanedRows(fileReader, columnNames, filterParameter)]
+            cache.Store(self.fileName, kind, rows, self.validRowsCount)
+        else:
+            rows, self.validRowsCount = entry
+        return (dict(zip(columnNames, values)) for values in rows)
+
+    def __IndexedRows(self, expectedSkills):
+        """
+        Возвращает только строки, в которых по индексу навыков есть все заданные навыки,
+        не читая остальные строки файла
+
+        Args:
+            expectedSkills (str): Навыки через ", "
+
+        Returns:
+            generator: Строки файла в виде словарей
+        """
+        skillsIndex = SkillsIndex(self.fileName)
+        self.validRowsCount = skillsIndex.validRowsCount
+        return skillsIndex.ReadRows(skillsIndex.Find(self._expectedParsers["Навыки"](expectedSkills)))
 
-    def __FilterVacancies(self, filterParameter, vacancies):
+    @classmethod
+    def __CompileFilter(cls, filterParameter):
         """
-        Фильтрует все вакансии по заданному параметру
+        Превращает параметр фильтрации в предикат над очищенными полями строки CSV-файла.
+        Ожидаемое значение разбирается один раз, а не для каждой строки
 
         Args:
             filterParameter(list[str]): Параметр фильтрации
-            vacancies (list[Vacancy]): Список вакансий
 
         Returns:
-            (list[Vacancy]): Список вакансий
+            (function, list[str]): Предикат (None - без фильтрации) и поля, которые ему нужны
         """
-        newVacancies = []
-        for vacancy in vacancies:
-            if not filterParameter:
-                newVacancies.append(vacancy)
-            else:
-                expectedParameter = filterParameter[0]
-                if self._filterFuncs[expectedParameter](filterParameter[1], vacancy):
-                    newVacancies.append(vacancy)
-        return newVacancies
+        if not filterParameter:
+            return None, []
+        expectedParameter, expectedValue = filterParameter
+        expectedValue = cls._expectedParsers.get(expectedParameter, lambda value: value)(expectedValue)
+        filterFunc = cls._filterFuncs[expectedParameter]
+        return lambda row: filterFunc(expectedValue, row), cls._filterColumns[expectedParameter]
 
-    def __SortVacancies(self, sortParameter, vacancies, isReverseSort):
+    def __SortVacancies(self, sortParameter, vacancies, isReverseSort, topCount=None):
         """
-        Сортирует все вакансии по заданным параметрам
+        Сортирует все вакансии по заданным параметрам.
+        Если для вывода нужны только первые topCount вакансий и их намного меньше общего количества,
+        вместо полной сортировки они выбираются через кучу (heapq сохраняет порядок равных элементов так же,
+        как sorted)
 
         Args:
             sortParameter(str): Параметр сортировки
             vacancies (list[Vacancy]): Список вакансий
             isReverseSort (bool): Порядок сортировки
+            topCount (int): Количество первых вакансий, достаточное для вывода (None - нужны все вакансии)
 
         Returns:
             (list[Vacancy]): Список вакансий
         """
         newVacancies = vacancies
-        if sortParameter:
+        if sortParameter and topCount is not None and topCount * 10 < len(vacancies):
+            selectTop = heapq.nlargest if isReverseSort else heapq.nsmallest
+            newVacancies = selectTop(topCount, vacancies, key=self._sortFuncs[sortParameter])
+        elif sortParameter:
             newVacancies.sort(key=self._sortFuncs[sortParameter], reverse=isReverseSort)
         return newVacancies
 
@@ -474,6 +612,11 @@ class Vacancy:
         salary (Salary): Представление запрлаты
         areaName (str): Название города
         publishedAt (str): Дата публикации
+        skills (tuple[str]): Список навыков
+        skillsSet (frozenset[str]): Множество навыков
+        publishedDate (datetime): Дата и время публикации
+        publishedTimestamp (float): Момент публикации в секундах (ключ сортировки по дате)
+        publishedDay (str): Дата публикации в формате ДД.ММ.ГГГГ
     """
 
     def __init__(self, name, description, keySkills, experienceId, premium, employerName, salary, areaName,
@@ -493,6 +636,48 @@ class Vacancy:
         """
         self.name, self.description, self.keySkills, self.experienceId, self.premium, self.employerName, self.salary, self.areaName, self.publishedAt \
             = name, description, keySkills, experienceId, premium, employerName, salary, areaName, publishedAt
+        self.skills = tuple(keySkills.split("\n"))
+        self.skillsSet = frozenset(self.skills)
+        self.publishedDate = self.ParseDate(publishedAt)
+        self.publishedTimestamp = self.publishedDate.timestamp()
+        self.publishedDay = self.FormatDay(publishedAt)
+
+    @staticmethod
+    def FormatDay(publishedAt):
+        """
+        Переводит дату публикации в формат ДД.ММ.ГГГГ без разбора строки в datetime
+
+        Args:
+            publishedAt (str): Дата публикации
+
+        Returns:
+            (str): Дата публикации в формате ДД.ММ.ГГГГ
+
+        >>> Vacancy.FormatDay("2022-07-05T18:19:30+0300")
+        '05.07.2022'
+        """
+        return f'{publishedAt[8:10]}.{publishedAt[5:7]}.{publishedAt[0:4]}'
+
+    @staticmethod
+    def ParseDate(publishedAt):
+        """
+        Переводит дату публикации из строки в datetime.
+        datetime.fromisoformat работает в десятки раз быстрее strptime, но понимает смещение "+0300"
+        только начиная с Python 3.11, поэтому для старых версий используется strptime
+
+        Args:
+            publishedAt (str): Дата публикации
+
+        Returns:
+            (datetime): Дата и время публикации
+
+        >>> Vacancy.ParseDate("2022-07-05T18:19:30+0300")
+        datetime.datetime(2022, 7, 5, 18, 19, 30, tzinfo=datetime.timezone(datetime.timedelta(seconds=10800)))
+        """
+        try:
+            return datetime.fromisoformat(publishedAt)
+        except ValueError:
+            return datetime.strptime(publishedAt, '%Y-%m-%dT%H:%M:%S%z')
 
 
 class Salary:
@@ -504,6 +689,9 @@ class Salary:
         salaryTo (int): Зарплата до
         salaryCurrency (str): Название валюты
         salaryGross (str): Параметр налогообложения
+        salaryFromValue (int): Зарплата от в виде числа
+        salaryToValue (int): Зарплата до в виде числа
+        averageRub (float): Средняя зарплата в рублях
         __formatFuncsSalary (dict): Словарь функция форматирования параметров зарплаты
         _salaryCurrency (dict): Словарь перевода валюты с английского на русский
         _salaryGross (dict): Словарь перевода параметра налогообложения с английского на русский
@@ -554,6 +742,8 @@ class Salary:
             salaryGross (str): Параметр налогообложения
         """
         self.salaryFrom, self.salaryTo, self.salaryCurrency, self.salaryGross = salaryFrom, salaryTo, salaryCurrency, salaryGross
+        self.salaryFromValue, self.salaryToValue = int(float(salaryFrom)), int(float(salaryTo))
+        self.averageRub = self.ChangeCurrency((self.salaryFromValue + self.salaryToValue) / 2)
 
     def Format(self):
         """
@@ -575,7 +765,7 @@ class Salary:
         """
 
         salary = ""
-        for name in self.__dict__.keys():
+        for name in self.__formatFuncsSalary.keys():
             salary += self.__formatFuncsSalary[name](self.__dict__[name])
         return salary
 
@@ -618,7 +808,7 @@ class Salary:
         Returns:
             (int): Среднее значение зарплаты
         """
-        return self.ChangeCurrency((int(float(self.salaryFrom)) + int(float(self.salaryTo))) / 2)
+        return self.averageRub
 
     def SumFilter(self, expectedSum):
         """
@@ -627,7 +817,7 @@ class Salary:
         Returns:
             (bool): Значение фильтрации
         """
-        return int(float(self.salaryTo)) >= int(float(expectedSum)) >= int(float(self.salaryFrom))
+        return self.salaryToValue >= int(float(expectedSum)) >= self.salaryFromValue
 
     def CurrencyFilter(self, expectedCurrency):
         """
@@ -639,6 +829,7 @@ class Salary:
         return expectedCurrency == self._salaryCurrency[self.salaryCurrency]
 
 
-inputData = InputConnect()
-dataSet = DataSet(inputData)
-inputData.PrintDataSet(dataSet)
+if __name__ == "__main__":
+    inputData = InputConnect()
+    dataSet = DataSet(inputData, useCache="--cache" in sys.argv)
+    inputData.PrintDataSet(dataSet)
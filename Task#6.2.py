@@ -1,151 +1,9 @@
 import sys
-import csv
-import os
 import openpyxl
 import numpy as np
 import matplotlib.pyplot as plt
-from datetime import datetime
 from openpyxl.styles import Font, NamedStyle, Side, Border
-
-
-class Vacancy:
-    def __init__(self, name, salary, areaName, publishedAt):
-        self.name, self.salary, self.areaName, self.publishedAt = name, salary, areaName, publishedAt
-
-
-class DataSet:
-    correctFields = ["name", "salary_from", "area_name", "published_at"]
-
-    def __init__(self, fileName, vacancyNameParameter):
-        self.fileName = fileName
-        self.vacancyNameParameter = vacancyNameParameter
-        self.__UniversalParserCSV(fileName)
-        self.vacanciesByYear = self.__VacancyFilterByYear()
-        self.vacancyByYear = self.__VacancyFilterByYear(self.vacancyNameParameter)
-        self.vacanciesByArea = self.__VacancyFilterByArea()
-
-    def __UniversalParserCSV(self, fileName):
-        fileReader, columnNames = self.__CsvReader(fileName)
-        self.vacanciesObjects = self.__CsvFilter(fileReader, columnNames)
-
-    def __CsvReader(self, fileName):
-        file = open(fileName, encoding='utf-8-sig', newline='')
-        if os.stat(fileName).st_size == 0:
-            print("Пустой файл")
-            sys.exit()
-        fileReader = csv.DictReader(file)
-        columnNames = fileReader.fieldnames
-        return fileReader, columnNames
-
-    def __CsvFilter(self, fileReader, columnNames):
-        vacancies = []
-        columnsCount = len(columnNames)
-        for row in fileReader:
-            if all(row.values()) and columnsCount == len(row):
-                tempRow = {name: row[name] for name in columnNames}
-                tempRow['salary_from'] = Salary(tempRow['salary_from'], tempRow.pop('salary_to'),
-                                                tempRow.pop("salary_currency"))
-                vacancies.append(Vacancy(*[tempRow[key] for key in self.correctFields]))
-        return vacancies
-
-    def DynamicsSalaries(self):
-        dinamicsSalaries = self.vacanciesByYear.copy()
-        for dataByYear in dinamicsSalaries.items():
-            averagesByYear = [vacancy.salary.GetAverage() for vacancy in dataByYear[1]]
-            dinamicsSalaries[dataByYear[0]] = int(sum(averagesByYear) / len(averagesByYear))
-        return dinamicsSalaries
-
-    def DynamicsCountVacancies(self):
-        vacancyCountByYear = self.vacanciesByYear.copy()
-        for dataByYear in vacancyCountByYear.items():
-            vacancyCountByYear[dataByYear[0]] = len(dataByYear[1])
-        return vacancyCountByYear
-
-    def DynamicsSalariesAtVacancy(self):
-        dinamicsSalaries = self.vacancyByYear.copy()
-        if not dinamicsSalaries:
-            return {key: 0 for key in self.currentKeys}
-        for dataByYear in dinamicsSalaries.items():
-            averagesByYear = [vacancy.salary.GetAverage() for vacancy in dataByYear[1]]
-            dinamicsSalaries[dataByYear[0]] = int(sum(averagesByYear) / len(averagesByYear))
-        return dinamicsSalaries
-
-    def DynamicsCountVacanciesAtVacancy(self):
-
-        vacancyCountByYear = self.vacancyByYear.copy()
-        if not vacancyCountByYear:
-            return {key: 0 for key in self.currentKeys}
-        for dataByYear in vacancyCountByYear.items():
-            vacancyCountByYear[dataByYear[0]] = len(dataByYear[1])
-        return vacancyCountByYear
-
-    def CitiesSalaryLevel(self):
-        vacanciesByArea = self.vacanciesByArea.copy()
-        for dataByArea in vacanciesByArea.items():
-            averagesByArea = [vacancy.salary.GetAverage() for vacancy in dataByArea[1]]
-            vacanciesByArea[dataByArea[0]] = int(sum(averagesByArea) / len(averagesByArea))
-        vacanciesByArea = list(
-            {k: v for k, v in sorted(vacanciesByArea.items(), key=lambda item: item[1], reverse=True)}.items())
-        vacanciesByArea = {items[0]: items[1] for items in vacanciesByArea}
-        return vacanciesByArea
-
-    def CitiesRatioVacancies(self):
-        vacanciesByArea = self.vacanciesByArea.copy()
-        for dataByArea in vacanciesByArea.items():
-            vacanciesByArea[dataByArea[0]] = round(len(dataByArea[1]) / len(self.vacanciesObjects), 4)
-        vacanciesByArea = list(
-            {k: v for k, v in sorted(vacanciesByArea.items(), key=lambda item: item[1], reverse=True)}.items())
-        vacanciesByArea = {items[0]: items[1] for items in vacanciesByArea}
-        return vacanciesByArea
-
-    def __VacancyFilterByYear(self, vacancyName=None):
-        dinamicsSalaries = {}
-        self.currentKeys = []
-        for vacancy in self.vacanciesObjects:
-            year = datetime.strptime(vacancy.publishedAt, '%Y-%m-%dT%H:%M:%S%z').year
-            self.currentKeys.append(year)
-            if vacancyName is None or vacancyName in vacancy.name:
-                dinamicsSalaries.setdefault(year, []).append(vacancy)
-        return dinamicsSalaries
-
-    def __VacancyFilterByArea(self):
-        vacanciesByArea = {}
-        for vacancy in self.vacanciesObjects:
-            vacanciesByArea.setdefault(vacancy.areaName, []).append(vacancy)
-        vacanciesByArea = self.__ClearByArea(vacanciesByArea)
-
-        return vacanciesByArea
-
-    def __ClearByArea(self, vacanciesByArea):
-        tempAreas = vacanciesByArea.copy()
-        for keyArea in vacanciesByArea.keys():
-            if len(vacanciesByArea[keyArea]) / len(self.vacanciesObjects) < 0.01:
-                tempAreas.pop(keyArea)
-        return tempAreas
-
-
-class Salary:
-    currencyToRub = {
-        "AZN": 35.68,
-        "BYR": 23.91,
-        "EUR": 59.90,
-        "GEL": 21.74,
-        "KGS": 0.76,
-        "KZT": 0.13,
-        "RUR": 1,
-        "UAH": 1.64,
-        "USD": 60.66,
-        "UZS": 0.0055,
-    }
-
-    def __init__(self, salaryFrom, salaryTo, salaryCurrency):
-        self.salaryFrom, self.salaryTo, self.salaryCurrency = salaryFrom, salaryTo, salaryCurrency
-
-    def ChangeCurrency(self, salary):
-        return salary * self.currencyToRub[self.salaryCurrency]
-
-    def GetAverage(self):
-        return self.ChangeCurrency((int(float(self.salaryFrom)) + int(float(self.salaryTo))) / 2)
+from VacanciesStatistics import StreamingDataSet
 
 
 class InputConnect:
@@ -310,7 +168,8 @@ class Report:
 
 
 inputData = InputConnect()
-dataSet = DataSet(inputData.fileName, inputData.vacancyName)
+dataSet = StreamingDataSet(inputData.fileName, inputData.vacancyName,
+                           useCache="--cache" in sys.argv)
 inputData.PrintData(dataSet)
 
 reportData = Report(dataSet.vacancyNameParameter)
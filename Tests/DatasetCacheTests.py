@@ -0,0 +1,44 @@
+import os
+import pickle
+import tempfile
+from unittest import TestCase, mock
+from DatasetCache import DatasetCache
+from Benchmarks.SyntheticData import WriteStatisticsCSV
+
+
+class DatasetCacheTests(TestCase):
+    def setUp(self):
+        self.fileName = os.path.join(tempfile.mkdtemp(), "vacancies.csv")
+        WriteStatisticsCSV(self.fileName, 2000)
+
+    def test_CacheInvalidation(self):
+        cache = DatasetCache(tempfile.mkdtemp(), maxBytes=1 << 20)
+        cache.Store(self.fileName, "rows", [["1", "Москва"], ["", "Казань"]], 2)
+        self.assertEqual(cache.Load(self.fileName, "rows"), ([["1", "Москва"], ["", "Казань"]], 2))
+        WriteStatisticsCSV(self.fileName, 100, seed=1)
+        self.assertIsNone(cache.Load(self.fileName, "rows"))
+        cache.Store(self.fileName, "rows", [["1"]])
+        cache.Invalidate(self.fileName)
+        self.assertIsNone(cache.Load(self.fileName, "rows"))
+
+    def test_CacheEviction(self):
+        WriteStatisticsCSV(self.fileName, 100, seed=1)
+        cache = DatasetCache(tempfile.mkdtemp(), maxBytes=150000)
+        cache.Store(self.fileName, "first", [["x" * 100000]])
+        cache.Store(self.fileName, "second", [["x" * 100000]])
+        self.assertIsNone(cache.Load(self.fileName, "first"))
+        self.assertIsNotNone(cache.Load(self.fileName, "second"))
+
+    def test_EntryNotUnpickled(self):
+        cacheDir = tempfile.mkdtemp()
+        cache = DatasetCache(cacheDir, maxBytes=1 << 20)
+        cache.Store(self.fileName, "rows", [["a", "b"], ["c", "d"]])
+        self.assertEqual(DatasetCache(cacheDir, maxBytes=1 << 20).Load(self.fileName, "rows"),
+                         ([["a", "b"], ["c", "d"]], None))
+        entryName = os.path.join(cacheDir, os.listdir(cacheDir)[0])
+        with open(entryName, "wb") as file:
+            pickle.dump([["a", "b"]], file)
+        with mock.patch("pickle.loads") as loads, mock.patch("pickle.load") as load:
+            self.assertIsNone(cache.Load(self.fileName, "rows"))
+        loads.assert_not_called()
+        load.assert_not_called()
@@ -0,0 +1,59 @@
+import os
+import pandas as pd
+import tempfile
+from unittest import TestCase, mock
+from Splitter import Splitter
+from DynamicsCalculator import Calculator
+from Benchmarks.SyntheticData import WriteConvertedCSV
+
+class DynamicsCalculatorTests(TestCase):
+    def setUp(self):
+        Calculator.partitions.clear()
+        directory = tempfile.mkdtemp()
+        fileName = os.path.join(directory, "converted.csv")
+        WriteConvertedCSV(fileName, 3000)
+        self.splitter = Splitter(fileName, os.path.join(directory, "CsvFilesByYear"), "DataByYear")
+
+    def test_PartitionReadOnceForSeveralQueries(self):
+        queries = [("Программист", "Москва"), ("Аналитик", "Москва"), ("Программист", "Казань")]
+        with mock.patch.object(Calculator, "ReadData", autospec=True, side_effect=Calculator.ReadData) as readData:
+            for vacancyName, areaName in queries:
+                calculator = Calculator(vacancyName, areaName)
+                for year in self.splitter.years:
+                    df = pd.read_csv(self.splitter.GetFileName(year))
+                    generalDf = df[df["area_name"] == areaName]
+                    vacancyDf = generalDf[generalDf["name"].str.contains(vacancyName)]
+                    expected = (year, int(generalDf["salary"].mean()) if len(generalDf) else 0, len(generalDf),
+                                int(vacancyDf["salary"].mean()) if len(vacancyDf) else 0, len(vacancyDf))
+                    self.assertEqual(calculator.GetDynamicsByYear(self.splitter.GetFileName(year), year), expected)
+        self.assertEqual(readData.call_count, len(self.splitter.years))
+
+    def test_PartitionsCacheBoundedByBytes(self):
+        calculator = Calculator("Программист", "Москва")
+        fileNames = [self.splitter.GetFileName(year) for year in self.splitter.years]
+        sizes = [int(calculator.ReadData(fileName).memory_usage(deep=True).sum()) for fileName in fileNames]
+        with mock.patch.object(Calculator, "partitionsMaxBytes", sizes[-1] + sizes[-2]):
+            for fileName in fileNames:
+                calculator.LoadPartition(fileName)
+            self.assertEqual([size for df, size in Calculator.partitions.values()], sizes[-2:])
+
+    def test_DataByYearDoesNotChangePartition(self):
+        calculator = Calculator("Программист", "Москва")
+        fileName = self.splitter.GetFileName(self.splitter.years[0])
+        expected = calculator.ReadData(fileName)
+        for vacancyName, areaName in [(None, None), ("Программист", None), (None, "Москва")]:
+            df = calculator.GetDataByYear(fileName, vacancyName, areaName)
+            df["salary"] = 0
+            df.drop(columns="name", inplace=True)
+        self.assertTrue(calculator.LoadPartition(fileName).equals(expected))
+
+    def test_InMemorySameAsSplitter(self):
+        df = pd.read_csv(self.splitter.fileName)
+        for vacancyName, areaName in [("Программист", "Москва"), ("Аналитик", "Казань"), ("Программист", "Нигде")]:
+            calculator = Calculator(vacancyName, areaName)
+            expected = (*calculator.HandleResults([calculator.GetDynamicsByYear(self.splitter.GetFileName(year), year)
+                                                   for year in self.splitter.years]),
+                        *calculator.GetDynamicsByCity(self.splitter.fileName))
+            for expectedData, data in zip(expected, calculator.GetDynamicsFromDataFrame(df)):
+                self.assertEqual(list(data.items()), list(expectedData.items()))
+
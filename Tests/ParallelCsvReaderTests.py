@@ -0,0 +1,38 @@
+import os
+import csv
+import tempfile
+from unittest import TestCase
+from TableTask import DataSet
+from RowCleaner import RowCleaner
+from ParallelCsvReader import ParallelCsvReader
+from Benchmarks.SyntheticData import WriteTableCSV
+
+
+class ParallelCsvReaderTests(TestCase):
+    def setUp(self):
+        self.fileName = os.path.join(tempfile.mkdtemp(), "vacancies.csv")
+        WriteTableCSV(self.fileName, 300, paragraphsCount=1)
+
+    def test_ParallelChunksSameAsCsv(self):
+        with open(self.fileName, encoding='utf-8-sig', newline='') as file:
+            records = list(csv.reader(file))
+        columnNames = records[0]
+        chunks = ParallelCsvReader(self.fileName, 2, chunkSize=4096).Map(DataSet._CleanChunk, columnNames, "")
+        rows = [values for validRowsCount, chunkRows in chunks for values in chunkRows]
+        self.assertEqual(rows, [tuple(map(RowCleaner.CleanRow, record)) for record in records[1:]])
+
+    def test_BareQuoteInUnquotedField(self):
+        with open(self.fileName, encoding='utf-8-sig', newline='') as file:
+            records = list(csv.reader(file))
+        columnNames = records[0]
+        with open(self.fileName, "a", encoding="utf-8", newline="") as file:
+            file.write(",".join(['Монитор 27"'] + ["x"] * (len(columnNames) - 1)) + "\r\n")
+            csv.writer(file).writerows(records[1:])
+        with open(self.fileName, encoding='utf-8-sig', newline='') as file:
+            records = list(csv.reader(file))
+        self.assertEqual(records[301][0], 'Монитор 27"')
+        for processesCount in [1, 2]:
+            chunks = ParallelCsvReader(self.fileName, processesCount, chunkSize=4096).Map(DataSet._CleanChunk,
+                                                                                        columnNames, "")
+            rows = [values for validRowsCount, chunkRows in chunks for values in chunkRows]
+            self.assertEqual(rows, [tuple(map(RowCleaner.CleanRow, record)) for record in records[1:]])
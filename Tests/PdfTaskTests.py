@@ -0,0 +1,7 @@
+from unittest import TestCase
+from PdfTask import Salary
+
+
+class SalaryTests(TestCase):
+    def test_GetAverage(self):
+        self.assertEqual(Salary(100, 100, "RUR").GetAverage(), 100.0)
@@ -0,0 +1,17 @@
+from unittest import TestCase, mock
+from RowCleaner import RowCleaner
+
+
+class RowCleanerTests(TestCase):
+    def test_CleanRowsInPool(self):
+        rows = [{"name": "<b>Python</b>", "description": f'<p>Описание {i}</p>\r\n<ul> <li>пункт</li> </ul>'}
+                for i in range(50)]
+        self.assertEqual(list(RowCleaner(2, batchSize=20).CleanRows(rows, ["name", "description"])),
+                         [{"name": "Python", "description": f'Описание {i}; пункт'} for i in range(50)])
+
+    def test_NoPoolForFewRows(self):
+        rows = [{"name": "<b>Python</b>", "description": f'<p>Описание {i}</p>'} for i in range(5)]
+        with mock.patch("RowCleaner.ProcessPoolExecutor") as executor:
+            self.assertEqual(list(RowCleaner(2, batchSize=20).CleanRows(rows, ["name", "description"])),
+                             [{"name": "Python", "description": f'Описание {i}'} for i in range(5)])
+        executor.assert_not_called()
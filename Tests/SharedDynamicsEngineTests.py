@@ -0,0 +1,33 @@
+import os
+import tempfile
+from multiprocessing.shared_memory import SharedMemory
+from unittest import TestCase, mock
+from SharedDynamicsEngine import SharedDynamicsEngine
+from Splitter import Splitter
+from DynamicsCalculator import Calculator
+from Benchmarks.SyntheticData import WriteConvertedCSV
+
+
+class SharedDynamicsEngineTests(TestCase):
+    def setUp(self):
+        Calculator.partitions.clear()
+        directory = tempfile.mkdtemp()
+        fileName = os.path.join(directory, "converted.csv")
+        WriteConvertedCSV(fileName, 3000)
+        self.splitter = Splitter(fileName, os.path.join(directory, "CsvFilesByYear"), "DataByYear")
+
+    def test_SharedMemoryEngineSameAsCalculator(self):
+        calculator = Calculator("Программист", "Москва")
+        expected = calculator.HandleResults([calculator.GetDynamicsByYear(self.splitter.GetFileName(year), year)
+                                             for year in self.splitter.years])
+        for processesCount in [1, 2]:
+            with SharedDynamicsEngine(self.splitter.fileName, processesCount) as engine:
+                self.assertEqual(engine.GetDynamics("Программист", "Москва"), expected)
+
+    def test_SharedMemoryReleasedWhenPoolFails(self):
+        engine = SharedDynamicsEngine(self.splitter.fileName, 2)
+        with mock.patch.object(SharedMemory, "unlink", autospec=True, side_effect=SharedMemory.unlink) as unlink, \
+                mock.patch("multiprocessing.Pool", side_effect=OSError), self.assertRaises(OSError):
+            engine.__enter__()
+        self.assertEqual(unlink.call_count, 3)
+        self.assertEqual(engine.sharedMemories, [])
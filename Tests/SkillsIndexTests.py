@@ -0,0 +1,30 @@
+import os
+import pickle
+import tempfile
+from unittest import TestCase, mock
+from RowCleaner import RowCleaner
+from SkillsIndex import SkillsIndex
+from Benchmarks.SyntheticData import WriteTableCSV
+
+
+class SkillsIndexTests(TestCase):
+    def setUp(self):
+        self.fileName = os.path.join(tempfile.mkdtemp(), "vacancies.csv")
+        WriteTableCSV(self.fileName, 300, paragraphsCount=1)
+
+    def test_SkillsIndexRebuild(self):
+        rowIds = SkillsIndex(self.fileName).Find({"Python", "SQL"})
+        rows = list(SkillsIndex(self.fileName).ReadRows(rowIds))
+        self.assertTrue(all({"Python", "SQL"} <= set(RowCleaner.CleanRow(row["key_skills"]).split("; "))
+                            for row in rows))
+        WriteTableCSV(self.fileName, 100, paragraphsCount=1, seed=1)
+        self.assertEqual(SkillsIndex(self.fileName).validRowsCount, 100)
+
+    def test_SkillsIndexNotUnpickled(self):
+        with open(f'{self.fileName}.skills.idx', "wb") as file:
+            pickle.dump(((1, 0, 0), [], [], {}), file)
+        with mock.patch("pickle.loads") as loads, mock.patch("pickle.load") as load:
+            self.assertEqual(len(SkillsIndex(self.fileName).Find({"Python", "SQL"})), 19)
+        loads.assert_not_called()
+        load.assert_not_called()
+        self.assertEqual(SkillsIndex(self.fileName).validRowsCount, 300)
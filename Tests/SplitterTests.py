@@ -0,0 +1,49 @@
+import os
+import pandas as pd
+import tempfile
+from importlib.util import find_spec
+from unittest import TestCase, mock, skipUnless
+from Splitter import Splitter
+from DynamicsCalculator import Calculator
+from Benchmarks.SyntheticData import WriteStatisticsCSV, WriteConvertedCSV
+
+class SplitterTests(TestCase):
+    def test_ChunkedSameAsWholeFile(self):
+        directory = tempfile.mkdtemp()
+        fileName = os.path.join(directory, "vacancies.csv")
+        WriteStatisticsCSV(fileName, 3000)
+        df = pd.read_csv(fileName)
+        df.loc[df.index % 7 == 0, "salary_to"] = None
+        df.to_csv(fileName, index=False)
+        splitter = Splitter(fileName, os.path.join(directory, "CsvFilesByYear"), "DataByYear", chunkSize=250)
+        df["years"] = df["published_at"].str[0:4].astype(int)
+        self.assertEqual(list(splitter.years), list(df["years"].unique()))
+        for year, data in df.groupby("years"):
+            with open(splitter.GetFileName(year), encoding="utf-8", newline="") as file:
+                self.assertEqual(file.read(), data.iloc[:, :6].to_csv(index=False))
+
+    @skipUnless(find_spec("pyarrow"), "нужен пакет pyarrow")
+    def test_ColumnarSameDynamicsAsCsv(self):
+        directory = tempfile.mkdtemp()
+        fileName = os.path.join(directory, "converted.csv")
+        WriteConvertedCSV(fileName, 5000)
+        calculator = Calculator("Программист", "Москва")
+        dynamics = []
+        for outputFormat in ["csv", "parquet", "feather"]:
+            splitter = Splitter(fileName, os.path.join(directory, outputFormat), "DataByYear", chunkSize=700,
+                                outputFormat=outputFormat)
+            dynamics.append([calculator.GetDynamicsByYear(splitter.GetFileName(year), year)
+                             for year in sorted(splitter.years)])
+        self.assertEqual(dynamics[0], dynamics[1])
+        self.assertEqual(dynamics[0], dynamics[2])
+
+    def test_ColumnarWithoutPyarrow(self):
+        directory = tempfile.mkdtemp()
+        fileName = os.path.join(directory, "converted.csv")
+        WriteConvertedCSV(fileName, 500)
+        with mock.patch.dict("sys.modules", {"pyarrow": None, "pyarrow.parquet": None}):
+            for outputFormat in ["parquet", "feather"]:
+                with self.assertRaisesRegex(ImportError, f'Для формата {outputFormat} нужен пакет pyarrow'):
+                    Splitter(fileName, os.path.join(directory, outputFormat), "DataByYear", outputFormat=outputFormat)
+        splitter = Splitter(fileName, os.path.join(directory, "csv"), "DataByYear")
+        self.assertTrue(os.path.exists(splitter.GetFileName(splitter.years[0])))
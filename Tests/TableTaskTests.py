@@ -0,0 +1,90 @@
+import io
+import os
+import tempfile
+from types import SimpleNamespace
+from contextlib import redirect_stdout
+from unittest import TestCase, mock
+from prettytable import PrettyTable, ALL
+from TableTask import InputConnect, DataSet, Salary
+from DatasetCache import DatasetCache
+from Benchmarks.SyntheticData import WriteTableCSV
+
+class InputConnectTests(TestCase):
+    def test_MaxChars(self):
+        self.assertEqual(InputConnect.SetMaxCharsTest({0: "asdas", 1: "213sdsd", 2: "", 3: "dljkrfghberifhgj bneiruhjgb niedujfhngk dfjngdkjfg ndjkfgndkjfg ndfjkgndkjfgndkjfngxkmcv dfdfgdfgb,xm skjfnsdfsdfs dgasdas dfgdfgdfgdf"}), {0: 'asdas', 1: '213sdsd', 2: '', 3: 'dljkrfghberifhgj bneiruhjgb niedujfhngk dfjngdkjfg ndjkfgndkjfg ndfjkgndkjfgndkjfngxkmcv dfdfgdfgb,x...'})
+
+
+class DataSetTests(TestCase):
+    def test_CleanRow(self):
+        self.assertEqual(DataSet.CleanRowTest("<p><strong>Основные функции:</strong></p> <ul> <li>мониторинг состояния промышленных кластеров СУБД SAP ASE (Sybase) Банка;</li> <li>участие в штатных процедурах решения ИТ-инцидентов;</li> <li>выполнение работ по сопровождению промышленных и тестовых кластеров СУБД SAP ASE (Sybase) и подготовка планов, инструкций инженерному составу;</li> <li>сбор и анализ диагностической информации, в случае потребности;</li>"), 'Основные функции: мониторинг состояния промышленных кластеров СУБД SAP ASE (Sybase) Банка; участие в штатных процедурах решения ИТ-инцидентов; выполнение работ по сопровождению промышленных и тестовых кластеров СУБД SAP ASE (Sybase) и подготовка планов, инструкций инженерному составу; сбор и анализ диагностической информации, в случае потребности;')
+
+class DataSetFilterTests(TestCase):
+    def setUp(self):
+        self.fileName = os.path.join(tempfile.mkdtemp(), "vacancies.csv")
+        WriteTableCSV(self.fileName, 300, paragraphsCount=1)
+
+    def GetVacancies(self, filterParameter, processesCount=0, topCount=None, useCache=False):
+        inputData = SimpleNamespace(fileName=self.fileName, filterParameter=filterParameter, sortParameter="Оклад",
+                                    isReverseSort=True, Initialize=lambda vacancies: None, topCount=topCount)
+        vacancies = DataSet(inputData, processesCount, useCache=useCache).vacanciesObjects
+        return [(vacancy.name, vacancy.description, vacancy.salary.Format()) for vacancy in vacancies]
+
+    def test_FilterBeforeSort(self):
+        vacancies = self.GetVacancies(["Название региона", "Москва"])
+        self.assertEqual(len(vacancies), 19)
+        self.assertEqual(vacancies, self.GetVacancies(["Название региона", "Москва"], 2))
+
+    def test_TopCountSort(self):
+        self.assertEqual(self.GetVacancies("", topCount=5), self.GetVacancies("")[:5])
+
+    def test_SkillsFilter(self):
+        self.assertEqual(len(self.GetVacancies(["Навыки", "Python, SQL"])), 19)
+
+    def test_CachedSameAsCsv(self):
+        cacheDir = tempfile.mkdtemp()
+        with mock.patch.dict(os.environ, {"VACANCIES_CACHE_DIR": cacheDir}):
+            for filterParameter in ["", ["Название региона", "Москва"]]:
+                self.assertEqual(self.GetVacancies(filterParameter, useCache=True), self.GetVacancies(filterParameter))
+            self.assertEqual(len(os.listdir(cacheDir)), 2)
+            with mock.patch("RowCleaner.RowCleaner.CleanRows") as cleanRows:
+                self.assertEqual(len(self.GetVacancies(["Название региона", "Москва"], useCache=True)), 19)
+            cleanRows.assert_not_called()
+            self.assertIsNotNone(DatasetCache().Load(self.fileName, 'table:["Название региона", "Москва"]'))
+
+    def test_PrintDataSetSameAsWholeTable(self):
+        inputData = SimpleNamespace(fileName=self.fileName, filterParameter="", sortParameter="Оклад",
+                                    isReverseSort=True, Initialize=lambda vacancies: None, topCount=None)
+        vacancies = DataSet(inputData, useCache=False).vacanciesObjects
+        for outputRange in [[], ["3", "10"], ["290", "400"]]:
+            for outputColumns in [[""], ["Название", "Навыки"], ["Оклад"]]:
+                inputConnect = InputConnect.__new__(InputConnect)
+                inputConnect.fileName, inputConnect.filterParameter = self.fileName, ""
+                inputConnect.sortParameter, inputConnect.isReverseSort = "Оклад", True
+                inputConnect.outputRange, inputConnect.outputColumns = outputRange, outputColumns
+                output = io.StringIO()
+                with redirect_stdout(output):
+                    inputConnect.PrintDataSet(DataSet(inputConnect, useCache=False))
+                table = PrettyTable(hrules=ALL, align='l', max_width=20)
+                table.field_names = [InputConnect.fieldNames[name] for name in InputConnect.correctFields]
+                table.add_rows([[InputConnect.SetMaxCharsTest({name: value})[name] for name, value in
+                                 zip(InputConnect.correctFields, self.FormatVacancy(vacancy))] for vacancy in vacancies])
+                table.add_autoindex("№")
+                start = int(outputRange[0]) - 1 if outputRange else 0
+                end = int(outputRange[1]) - 1 if len(outputRange) == 2 else len(vacancies)
+                fields = list(set(table.field_names) & set(outputColumns)) + ["№"] if any(outputColumns) else \
+                    table.field_names
+                self.assertEqual(output.getvalue(), table.get_string(start=start, end=end, fields=fields) + "\n")
+
+    @staticmethod
+    def FormatVacancy(vacancy):
+        return [vacancy.name, vacancy.description, vacancy.keySkills, DataSet._experience[vacancy.experienceId],
+                DataSet._boolFields[vacancy.premium], vacancy.employerName, vacancy.salary.Format(),
+                vacancy.areaName, vacancy.publishedDay]
+
+
+class SalaryTests(TestCase):
+    def test_Format(self):
+        self.assertEqual(Salary(1000000, 2000000, "GEL", "False").Format(), '1 000 000 - 2 000 000 (Грузинский лари) (С вычетом налогов)')
+
+    def test_ChangeCurrency(self):
+        self.assertEqual(Salary.ChangeCurrencyTest(999, "EUR"), 59840.1)
@@ -0,0 +1,37 @@
+import os
+import tempfile
+from unittest import TestCase, mock
+from PdfTask import DataSet, InputConnect
+from VacanciesStatistics import StreamingDataSet
+from DatasetCache import DatasetCache
+from Benchmarks.SyntheticData import WriteStatisticsCSV
+
+
+class StatisticsDataSetTests(TestCase):
+    def setUp(self):
+        self.fileName = os.path.join(tempfile.mkdtemp(), "vacancies.csv")
+        WriteStatisticsCSV(self.fileName, 2000)
+
+    def GetListData(self, dataSet):
+        return [list(response(dataSet).items()) for response in InputConnect._responses.values()]
+
+    def test_StreamingSameAsObjectModel(self):
+        for vacancyName in ["Программист", "Нет такой профессии"]:
+            self.assertEqual(self.GetListData(StreamingDataSet(self.fileName, vacancyName, useCache=False)),
+                             self.GetListData(DataSet(self.fileName, vacancyName)))
+
+    def test_CachedStreamingSameAsObjectModel(self):
+        with mock.patch.dict(os.environ, {"VACANCIES_CACHE_DIR": tempfile.mkdtemp()}):
+            for i in range(2):
+                self.assertEqual(self.GetListData(StreamingDataSet(self.fileName, "Программист", useCache=True)),
+                                 self.GetListData(DataSet(self.fileName, "Программист")))
+
+    def test_LargeFileStreamedPastCache(self):
+        cacheDir = tempfile.mkdtemp()
+        environ = {"VACANCIES_CACHE_DIR": cacheDir, "VACANCIES_CACHE_MAX_BYTES": str(os.path.getsize(self.fileName) - 1)}
+        with mock.patch.dict(os.environ, environ), mock.patch.object(DatasetCache, "Store") as store:
+            dataSet = StreamingDataSet(self.fileName, "Программист", useCache=True)
+            self.assertNotIsInstance(dataSet._CsvRows(self.fileName), list)
+        self.assertEqual(self.GetListData(dataSet), self.GetListData(DataSet(self.fileName, "Программист")))
+        store.assert_not_called()
+        self.assertEqual(os.listdir(cacheDir), [])
@@ -0,0 +1,83 @@
+import os
+import csv
+import pandas as pd
+import tempfile
+from unittest import TestCase, mock
+from currenciesParser import CurrenciesParser
+from ratesStore import RatesStore
+from responseCache import ResponseCache
+from Benchmarks.CbrServer import CbrServer, GetRandomRates
+
+
+class CurrenciesParserTests(TestCase):
+    def setUp(self):
+        currentDir = os.getcwd()
+        os.chdir(tempfile.mkdtemp())
+        self.addCleanup(os.chdir, currentDir)
+        self.fileName = "vacancies.csv"
+        months = [f'2003-{month:02d}' for month in range(1, 7)]
+        with open(self.fileName, "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["name", "salary_from", "salary_to", "salary_currency", "area_name", "published_at"])
+            for i in range(15003):
+                writer.writerow(["Программист", 1000, 2000, ["RUR", "USD", "KZT"][i % 3], "Москва",
+                                 f'{months[i % 6]}-15T10:00:00+0300'])
+        self.ratesByDate = GetRandomRates(months)
+    def test_ConversionTableFromStandInServer(self):
+        with CbrServer(self.ratesByDate) as server:
+            conversionTable = CurrenciesParser(self.fileName, cbrUrl=server.url, ratesStore=RatesStore("concurrent.db"),
+                                               responseCache=ResponseCache("concurrentResponses.db")).conversionTable
+            sequentialTable = CurrenciesParser(self.fileName, fetchThreadsCount=1, cbrUrl=server.url,
+                                               ratesStore=RatesStore("sequential.db"),
+                                               responseCache=ResponseCache("sequentialResponses.db")).conversionTable
+        self.assertEqual(server.requestsCount, 12)
+        self.assertTrue(conversionTable.equals(sequentialTable))
+        nominal, value = self.ratesByDate["01/03/2003"]["KZT"]
+        self.assertEqual(conversionTable.at["2003-03", "KZT"], value / nominal)
+
+    def test_VectorizedConversionSameAsDataBase(self):
+        months = ["2003-01", "2003-02", "2003-04", "2003-06"]
+        with open(self.fileName, "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["name", "salary_from", "salary_to", "salary_currency", "area_name", "published_at"])
+            for i in range(18000):
+                writer.writerow(["Программист", 1000 + i if i % 7 else "", 2000 + i % 11 if i % 5 else "",
+                                 ["RUR", "USD", "KZT"][i % 3], "Москва", f'{months[i % 4]}-15T10:00:00+0300'])
+        del self.ratesByDate["01/04/2003"]
+        del self.ratesByDate["01/02/2003"]["USD"]
+        convertedFiles = []
+        with CbrServer(self.ratesByDate) as server:
+            for useDataBase in [False, True]:
+                CurrenciesParser(self.fileName, useDataBase=useDataBase, cbrUrl=server.url).ConvertToRub("df")
+                self.assertTrue(os.path.exists("ConversionTable.db"))
+                convertedFiles.append(f'converted{useDataBase}.csv')
+                os.replace("ConvertedVacancies.csv", convertedFiles[-1])
+        with open(convertedFiles[0], "rb") as vectorized, open(convertedFiles[1], "rb") as dataBase:
+            vectorizedBytes = vectorized.read()
+            self.assertEqual(vectorizedBytes, dataBase.read())
+        source = pd.read_csv(self.fileName).dropna(how="all", subset=["salary_from", "salary_to"])
+        isNotConverted = (source["published_at"].str.startswith("2003-04") & (source["salary_currency"] != "RUR")) | \
+                         (source["published_at"].str.startswith("2003-02") & (source["salary_currency"] == "USD"))
+        self.assertEqual(len(pd.read_csv(convertedFiles[0])), len(source[~isNotConverted]))
+
+    def test_RatesStoreSkipsNetwork(self):
+        del self.ratesByDate["01/02/2003"]["USD"]
+        with CbrServer(self.ratesByDate) as server:
+            conversionTable = CurrenciesParser(self.fileName, cbrUrl=server.url).conversionTable
+            self.assertEqual(server.requestsCount, 6)
+            os.remove("ResponseCache.db")
+            self.assertTrue(conversionTable.equals(CurrenciesParser(self.fileName, cbrUrl=server.url).conversionTable))
+        self.assertEqual(server.requestsCount, 6)
+        self.assertFalse(os.path.exists("ResponseCache.db"))
+
+    def test_ResponseCacheRevalidates(self):
+        with CbrServer(self.ratesByDate) as server:
+            conversionTable = CurrenciesParser(self.fileName, cbrUrl=server.url).conversionTable
+            cachedTable = CurrenciesParser(self.fileName, cbrUrl=server.url,
+                                           ratesStore=RatesStore("cached.db")).conversionTable
+            self.assertEqual(server.requestsCount, 6)
+            with mock.patch.object(CurrenciesParser, "ratesTTL", 0):
+                revalidatedTable = CurrenciesParser(self.fileName, cbrUrl=server.url,
+                                                    ratesStore=RatesStore("revalidated.db")).conversionTable
+        self.assertEqual((server.requestsCount, server.notModifiedCount), (12, 6))
+        self.assertTrue(conversionTable.equals(cachedTable) and conversionTable.equals(revalidatedTable))
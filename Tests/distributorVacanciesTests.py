@@ -0,0 +1,194 @@
+import io
+import os
+import csv
+import sqlite3
+import pandas as pd
+import tempfile
+import time
+import requests
+from types import SimpleNamespace
+from datetime import datetime, timedelta
+from contextlib import redirect_stdout, closing
+from unittest import TestCase, mock
+from TableTask import DataSet
+from responseCache import ResponseCache
+from distributorVacancies import DistributorVacancies
+from harvestPolicy import TokenBucket, RetryPolicy
+from Benchmarks.HHServer import HHServer, GetRandomVacancies, GetVacancyDetails, GetEmptyCache
+
+class DistributorVacanciesTests(TestCase):
+    def setUp(self):
+        currentDir = os.getcwd()
+        os.chdir(tempfile.mkdtemp())
+        self.addCleanup(os.chdir, currentDir)
+        self.date = datetime(2022, 12, 2)
+
+    def Harvest(self, url, concurrency, daysCount=1, adaptive=False, withDetails=False, responseCache=None):
+        self.distributor = DistributorVacancies(concurrency, url, TokenBucket(1000, 1000), RetryPolicy(baseDelay=0.01),
+                                                responseCache or GetEmptyCache())
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            self.distributor.GetVacanciesCSV(pd.Timestamp(self.date), 4, daysCount, adaptive, withDetails=withDetails)
+        with open("DistributorVacancies.csv", encoding="utf-8") as file:
+            return file.read()
+
+    def test_ConcurrentSameAsSequential(self):
+        with HHServer(GetRandomVacancies(self.date, 1500)) as server:
+            sequential = self.Harvest(server.url, 1)
+            self.assertEqual(sequential.count("\n"), 1501)
+            self.assertEqual(self.Harvest(server.url, 4), sequential)
+
+    def test_SeveralDaysStreamed(self):
+        vacancies = GetRandomVacancies(self.date, 1000) + GetRandomVacancies(self.date + timedelta(days=1), 1000, 1)
+        with HHServer(vacancies) as server:
+            rows = list(csv.reader(io.StringIO(self.Harvest(server.url, 4, 2))))
+        self.assertEqual(len(rows), 2001)
+        self.assertEqual(rows[0], DistributorVacancies.fieldNames)
+
+    def test_IntegerSalariesKeptAsIntegers(self):
+        vacancies = GetRandomVacancies(self.date, 300)
+        with HHServer(vacancies) as server:
+            rows = list(csv.DictReader(io.StringIO(self.Harvest(server.url, 2))))
+        salaries = [(vacancy["salary"] or {}).get("from") for vacancy in vacancies]
+        self.assertEqual(sorted(row["salary_from"] for row in rows),
+                         sorted("" if salary is None else str(salary) for salary in salaries))
+
+    def test_AdaptiveWindowsComplete(self):
+        vacancies = GetRandomVacancies(self.date, 500) + GetRandomVacancies(self.date, 4500, 1, hours=(9, 12))
+        with HHServer(vacancies) as server:
+            self.assertLess(self.Harvest(server.url, 4).count("\n"), 5001)
+            rows = list(csv.reader(io.StringIO(self.Harvest(server.url, 4, adaptive=True))))
+        self.assertEqual(len(rows), 5001)
+        self.assertEqual(sorted(row[5] for row in rows[1:]), sorted(vacancy["published_at"] for vacancy in vacancies))
+
+    def test_RetriesServerErrors(self):
+        vacancies = GetRandomVacancies(self.date, 1500)
+        with HHServer(vacancies) as server:
+            expected = self.Harvest(server.url, 1)
+        with HHServer(vacancies, failEvery=3) as server:
+            self.assertEqual(self.Harvest(server.url, 4), expected)
+        self.assertEqual(self.distributor.stats.retriesCount, server.rejectedCount)
+
+    def test_StatsCountOnlyHarvestTime(self):
+        with HHServer(GetRandomVacancies(self.date, 300)) as server:
+            distributor = DistributorVacancies(2, server.url, TokenBucket(1000, 1000), responseCache=GetEmptyCache())
+            distributor.stats.Add(requestsCount=5)
+            distributor.stats.startedAt -= 3600
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                distributor.GetVacanciesCSV(pd.Timestamp(self.date), 4)
+        self.assertLess(time.monotonic() - distributor.stats.startedAt, 60)
+        self.assertEqual(distributor.stats.requestsCount, server.requestsCount)
+
+    def test_ResumeAfterFailure(self):
+        vacancies = GetRandomVacancies(self.date, 1500) + GetRandomVacancies(self.date, 3000, 1, hours=(9, 12))
+        with HHServer(vacancies) as server:
+            expected = self.Harvest(server.url, 4, adaptive=True)
+            fullRequestsCount = server.requestsCount
+        distributor = DistributorVacancies(4, server.url, TokenBucket(1000, 1000), RetryPolicy(maxRetries=0),
+                                           GetEmptyCache())
+        with HHServer(vacancies, failEvery=30) as server, open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            distributor.baseURL = server.url
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                distributor.GetVacanciesCSV(pd.Timestamp(self.date), 4, adaptive=True)
+        with closing(sqlite3.connect("HarvestCheckpoint.db")) as db:
+            pagesDone, partialWindowsCount = db.execute(
+                "SELECT SUM(pagesDone), SUM(pagesDone < MAX(pages, 1)) FROM Windows").fetchone()
+        self.assertGreaterEqual(pagesDone, 15)
+        with HHServer(vacancies) as server:
+            self.assertEqual(self.Harvest(server.url, 4, adaptive=True), expected)
+            self.assertLessEqual(server.requestsCount, fullRequestsCount - pagesDone + partialWindowsCount)
+        self.assertFalse(os.path.exists("HarvestCheckpoint.db"))
+
+    def test_ResumeKeepsSplitWindows(self):
+        vacancies = GetRandomVacancies(self.date, 1500) + GetRandomVacancies(self.date, 3000, 1, hours=(9, 12))
+        with HHServer(vacancies) as server:
+            expected = self.Harvest(server.url, 4, adaptive=True)
+        distributor = DistributorVacancies(4, server.url, TokenBucket(1000, 1000), RetryPolicy(maxRetries=0),
+                                           GetEmptyCache())
+        with HHServer(vacancies, failEvery=30) as server, open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            distributor.baseURL = server.url
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                distributor.GetVacanciesCSV(pd.Timestamp(self.date), 4, adaptive=True)
+        with HHServer(vacancies) as server, mock.patch.object(DistributorVacancies, "maxFound", 700):
+            resumed = self.Harvest(server.url, 4, adaptive=True)
+        self.assertEqual(sorted(resumed.splitlines()), sorted(expected.splitlines()))
+
+    def test_CheckpointPathAndOptOut(self):
+        vacancies = GetRandomVacancies(self.date, 1500)
+        distributor = DistributorVacancies(4, "", TokenBucket(1000, 1000), RetryPolicy(maxRetries=0), GetEmptyCache())
+        for checkpoint, environ in [(False, {}), (None, {"HARVEST_CHECKPOINT_DB": "checkpoints.db"})]:
+            with HHServer(vacancies, failEvery=5) as server, open(os.devnull, "w") as devnull, \
+                    redirect_stdout(devnull), mock.patch.dict(os.environ, environ):
+                distributor.baseURL = server.url
+                with self.assertRaises(requests.exceptions.ConnectionError):
+                    distributor.GetVacanciesCSV(pd.Timestamp(self.date), 4, checkpoint=checkpoint)
+            self.assertFalse(os.path.exists("HarvestCheckpoint.db"))
+        self.assertTrue(os.path.exists("checkpoints.db"))
+
+    def test_WatchAppendsOnlyNewVacancies(self):
+        def Watch():
+            distributor = DistributorVacancies(4, server.url, TokenBucket(1000, 1000), responseCache=GetEmptyCache())
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                distributor.Watch(pd.Timestamp(self.date), overlap=pd.Timedelta(days=10 ** 4), pollsCount=2,
+                                  interval=0)
+
+        nextDate = self.date + timedelta(days=1)
+        with HHServer(GetRandomVacancies(self.date, 500)) as server:
+            Watch()
+            server.vacancies += GetRandomVacancies(self.date, 100, 1) + GetRandomVacancies(nextDate, 300, 2)
+            Watch()
+        for date, rowsCount in [(self.date, 600), (nextDate, 300)]:
+            with open(os.path.join("Vacancies", f'{date:%Y-%m-%d}.csv'), encoding="utf-8") as file:
+                rows = list(csv.reader(file))
+            self.assertEqual(len(rows), rowsCount + 1)
+            self.assertEqual(len(set(map(tuple, rows))), rowsCount + 1)
+
+    def test_WatchKeepsExistingDayFile(self):
+        os.makedirs("Vacancies")
+        dayFileName = os.path.join("Vacancies", f'{self.date:%Y-%m-%d}.csv')
+        with open(dayFileName, "w", encoding="utf-8", newline="") as file:
+            csv.writer(file).writerows([DistributorVacancies.fieldNames, ["Старая вакансия", "", "", "", "Москва",
+                                                                          "2022-12-02T08:00:00+0300"]])
+        with HHServer(GetRandomVacancies(self.date, 300)) as server, open(os.devnull, "w") as devnull, \
+                redirect_stdout(devnull):
+            distributor = DistributorVacancies(4, server.url, TokenBucket(1000, 1000), responseCache=GetEmptyCache())
+            distributor.Watch(pd.Timestamp(self.date), pollsCount=1)
+        with open(dayFileName, encoding="utf-8") as file:
+            rows = list(csv.reader(file))
+        self.assertEqual(rows[1][0], "Старая вакансия")
+        self.assertEqual(len(rows), 302)
+        self.assertEqual(rows.count(DistributorVacancies.fieldNames), 1)
+
+    def test_WatchSkipsRepublishedVacancies(self):
+        def Watch():
+            distributor = DistributorVacancies(4, server.url, TokenBucket(1000, 1000), responseCache=GetEmptyCache())
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                distributor.Watch(pd.Timestamp(self.date), overlap=pd.Timedelta(minutes=10), pollsCount=1)
+
+        vacancies = GetRandomVacancies(self.date, 300)
+        moscowNow = datetime.now(DistributorVacancies.moscowTimeZone)
+        with HHServer(vacancies) as server:
+            Watch()
+            for vacancy, minutesAgo in [(dict(vacancies[0]), 1), (dict(vacancies[1], id="999"), 2)]:
+                vacancy["published_at"] = (moscowNow - timedelta(minutes=minutesAgo)).strftime("%Y-%m-%dT%H:%M:%S%z")
+                server.vacancies.append(vacancy)
+            Watch()
+        rowsCount = {}
+        for fileName in os.listdir("Vacancies"):
+            with open(os.path.join("Vacancies", fileName), encoding="utf-8") as file:
+                rowsCount[fileName] = len(list(csv.reader(file))) - 1
+        self.assertEqual(rowsCount.pop(f'{self.date:%Y-%m-%d}.csv'), 300)
+        self.assertEqual(sum(rowsCount.values()), 1)
+
+    def test_DetailsReadableByTableTask(self):
+        vacancies = GetRandomVacancies(self.date, 300)
+        responseCache = ResponseCache()
+        with HHServer(vacancies) as server:
+            self.Harvest(server.url, 4, withDetails=True, responseCache=responseCache)
+            self.assertEqual(server.requestsCount, 4 + 300)
+            self.Harvest(server.url, 4, withDetails=True, responseCache=responseCache)
+            self.assertEqual(server.requestsCount, 4 + 300)
+        inputData = SimpleNamespace(fileName="DistributorVacancies.csv", filterParameter="", sortParameter="",
+                                    isReverseSort=False, Initialize=lambda vacancies: None, topCount=None)
+        expectedCount = sum(1 for vacancy in vacancies if vacancy["salary"] and vacancy["salary"]["from"] and
+                            vacancy["salary"]["to"] and GetVacancyDetails(vacancy)["key_skills"])
+        self.assertEqual(len(DataSet(inputData, useCache=False).vacanciesObjects), expectedCount)
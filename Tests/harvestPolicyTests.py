@@ -0,0 +1,13 @@
+from types import SimpleNamespace
+from unittest import TestCase
+from harvestPolicy import TokenBucket, RetryPolicy
+
+
+class HarvestPolicyTests(TestCase):
+    def test_RetryAfterAndRateDecrease(self):
+        response = SimpleNamespace(status_code=429, headers={"Retry-After": "3"})
+        self.assertEqual(RetryPolicy().GetDelay(5, response), 3)
+        self.assertTrue(0.25 <= RetryPolicy().GetDelay(0, None) <= 0.5)
+        rateLimiter = TokenBucket(8)
+        rateLimiter.Decrease()
+        self.assertEqual(rateLimiter.rate, 4)
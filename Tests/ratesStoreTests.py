@@ -0,0 +1,20 @@
+import os
+import tempfile
+from unittest import TestCase
+from ratesStore import RatesStore
+
+
+class RatesStoreTests(TestCase):
+    def setUp(self):
+        currentDir = os.getcwd()
+        os.chdir(tempfile.mkdtemp())
+        self.addCleanup(os.chdir, currentDir)
+
+    def test_GetRequestedRatesOnly(self):
+        ratesStore = RatesStore()
+        months = [f'{year}-{month:02d}' for year in range(2003, 2023) for month in range(1, 13)]
+        ratesStore.SaveRates([(month, [("USD", i), ("EUR", i * 2)]) for i, month in enumerate(months)],
+                             ["USD", "EUR", "KZT"])
+        self.assertEqual(ratesStore.GetRates(months[::2], ["USD", "KZT", "BYR"], chunkSize=50),
+                         {(month, currency): rate for i, month in enumerate(months[::2])
+                          for currency, rate in [("USD", i * 2), ("KZT", None)]})
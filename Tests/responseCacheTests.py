@@ -0,0 +1,29 @@
+import os
+import tempfile
+from unittest import TestCase
+from responseCache import ResponseCache
+
+
+class ResponseCacheTests(TestCase):
+    def setUp(self):
+        currentDir = os.getcwd()
+        os.chdir(tempfile.mkdtemp())
+        self.addCleanup(os.chdir, currentDir)
+
+    def test_ResponseCacheEvictsLeastRecentlyUsed(self):
+        responseCache = ResponseCache(maxBytes=3500, touchInterval=0)
+        for i in range(3):
+            responseCache.Store(f'http://example.com/{i}', bytes(1000), {})
+        responseCache.Load("http://example.com/0")
+        responseCache.Store("http://example.com/3", bytes(1000), {})
+        self.assertEqual([responseCache.Load(f'http://example.com/{i}') is not None for i in range(4)],
+                         [True, False, True, True])
+
+    def test_ResponseCacheReplaceKeepsSize(self):
+        responseCache = ResponseCache(maxBytes=3500)
+        for i in range(3):
+            responseCache.Store(f'http://example.com/{i}', bytes(1000), {})
+        for i in range(5):
+            responseCache.Store("http://example.com/0", bytes(1000), {})
+        self.assertEqual(responseCache.totalBytes, 3000)
+        self.assertTrue(all(responseCache.Load(f'http://example.com/{i}') is not None for i in range(3)))
@@ -0,0 +1,37 @@
+import os
+import sqlite3
+import tempfile
+from contextlib import closing
+from unittest import TestCase
+from watchState import WatchState
+
+
+class WatchStateTests(TestCase):
+    def setUp(self):
+        currentDir = os.getcwd()
+        os.chdir(tempfile.mkdtemp())
+        self.addCleanup(os.chdir, currentDir)
+
+    def test_SeenIdsPrunedAfterRetention(self):
+        watchState = WatchState()
+        watchState.Save("2023-01-10T00:00:00", [(1, "2023-01-09T12:00:00"), (2, "2023-01-09T13:00:00")], {},
+                        "2022-12-01T00:00:00")
+        watchState.Save("2023-02-05T00:00:00", [(2, "2023-02-04T10:00:00"), (3, "2023-02-04T11:00:00")], {},
+                        "2023-01-01T00:00:00")
+        self.assertEqual(watchState.GetSeenIds([1, 2, 3]), {1, 2, 3})
+        watchState.Save("2023-03-01T00:00:00", [], {}, "2023-02-01T00:00:00")
+        self.assertEqual(watchState.GetSeenIds([1, 2, 3]), {2, 3})
+        with closing(sqlite3.connect(watchState.dbName)) as db:
+            self.assertEqual(db.execute("SELECT COUNT(*) FROM SeenIds").fetchone()[0], 2)
+
+    def test_SeenIdsTableMigrated(self):
+        with closing(sqlite3.connect("WatchState.db")) as db, db:
+            db.execute("CREATE TABLE State (key text PRIMARY KEY, value text)")
+            db.execute("CREATE TABLE SeenIds (id integer PRIMARY KEY, publishedAt text)")
+            db.execute("INSERT INTO State (key, value) VALUES ('highWaterMark', '2023-01-10T00:00:00')")
+            db.execute("INSERT INTO SeenIds (id, publishedAt) VALUES (1, '2022-06-01T00:00:00')")
+        watchState = WatchState()
+        watchState.Save("2023-01-20T00:00:00", [], {}, "2023-01-05T00:00:00")
+        self.assertEqual(watchState.GetSeenIds([1]), {1})
+        watchState.Save("2023-01-30T00:00:00", [], {}, "2023-01-15T00:00:00")
+        self.assertEqual(watchState.GetSeenIds([1]), set())
@@ -0,0 +1,265 @@
+import sys
+import csv
+import os
+from DatasetCache import DatasetCache
+
+
+class StatisticsDataSet:
+    """
+    Базовый класс статистики вакансий, который считает динамики по накопленным суммам и количествам,
+    не храня объекты вакансий.
+
+    Attributes:
+        correctFields (list[str]): Поля необходимые для подсчета статистики
+        currencyToRub (dict): Курс обмена валют
+        fileName (str): Название файла
+        vacancyNameParameter (str): Название выбранной профессии
+        citiesLimit (int): Количество выводимых городов (None - все города)
+        useCache (bool): Брать ли корректные строки файла из дискового кэша DatasetCache
+        vacanciesCount (int): Общее количество вакансий
+        salariesByYear (dict): Сумма и количество зарплат по годам
+        salariesByYearAtVacancy (dict): Сумма и количество зарплат по годам для выбранной профессии
+        salariesByArea (dict): Сумма и количество зарплат по городам
+    """
+    correctFields = ["name", "salary_from", "salary_to", "salary_currency", "area_name", "published_at"]
+
+    currencyToRub = {
+        "AZN": 35.68,
+        "BYR": 23.91,
+        "EUR": 59.90,
+        "GEL": 21.74,
+        "KGS": 0.76,
+        "KZT": 0.13,
+        "RUR": 1,
+        "UAH": 1.64,
+        "USD": 60.66,
+        "UZS": 0.0055,
+    }
+
+    def __init__(self, fileName, vacancyNameParameter, citiesLimit=None, useCache=False):
+        """
+        Инициализирует объект StatisticsDataSet
+
+        Args:
+            fileName (str): Название файла
+            vacancyNameParameter (str): Название выбранной профессии
+            citiesLimit (int): Количество выводимых городов (None - все города)
+            useCache (bool): Брать ли корректные строки файла из дискового кэша DatasetCache
+        """
+        self.fileName = fileName
+        self.vacancyNameParameter = vacancyNameParameter
+        self.citiesLimit = citiesLimit
+        self.useCache = useCache
+        self.vacanciesCount = 0
+        self.salariesByYear, self.salariesByYearAtVacancy, self.salariesByArea = {}, {}, {}
+
+    def _CsvRows(self, fileName):
+        """
+        Считывает CSV файл и возвращает только корректные строки (все поля заполнены).
+        Файл читается потоково. Если включен кэш и файл помещается в него, строки берутся из DatasetCache,
+        а при промахе они по мере чтения копятся в списке и сохраняются в кэш после последней строки.
+        Если файл пустой - выводит строку "Пустой файл" и прерывает работу программы
+
+        Args:
+            fileName (str): Название файла
+
+        Returns:
+            iterable: Строки файла в виде списков значений полей correctFields
+        """
+        if os.stat(fileName).st_size == 0:
+            print("Пустой файл")
+            sys.exit()
+        cache = DatasetCache()
+        if not self.useCache or not cache.IsCacheable(fileName):
+            return self.__ReadRows(fileName)
+        kind = f'statistics:{",".join(self.correctFields)}'
+        entry = cache.Load(fileName, kind)
+        if entry is None:
+            return self.__StoredRows(cache, kind, fileName)
+        return entry[0]
+
+    def __StoredRows(self, cache, kind, fileName):
+        """
+        Отдает корректные строки CSV файла по мере чтения и после последней строки сохраняет их в кэш
+
+        Args:
+            cache (DatasetCache): Дисковый кэш
+            kind (str): Вид данных в кэше
+            fileName (str): Название файла
+
+        Returns:
+            generator: Строки файла в виде списков значений полей correctFields
+        """
+        rows = []
+        for row in self.__ReadRows(fileName):
+            rows.append(row)
+            yield row
+        cache.Store(fileName, kind, rows)
+
+    def __ReadRows(self, fileName):
+        """
+        Читает корректные строки CSV файла
+
+        Args:
+            fileName (str): Название файла
+
+        Returns:
+            generator: Строки файла в виде списков значений полей correctFields
+        """
+        with open(fileName, encoding='utf-8-sig', newline='') as file:
+            fileReader = csv.DictReader(file)
+            columnsCount = len(fileReader.fieldnames)
+            for row in fileReader:
+                if all(row.values()) and columnsCount == len(row):
+                    yield [row[key] for key in self.correctFields]
+
+    def _GetAverage(self, salaryFrom, salaryTo, salaryCurrency):
+        """
+        Считает среднюю зарплату в рублях по формуле (salaryFrom + salaryTo) / 2
+
+        Args:
+            salaryFrom (str): Зарплата от
+            salaryTo (str): Зарплата до
+            salaryCurrency (str): Название валюты
+
+        Returns:
+            float: Средняя зарплата в рублях
+        """
+        return (int(float(salaryFrom)) + int(float(salaryTo))) / 2 * self.currencyToRub[salaryCurrency]
+
+    def DynamicsSalaries(self):
+        """
+        Возвращает динамику уровня зарплат по годам
+
+        Returns:
+            dict: Динамика уровня зарплат по годам
+        """
+        return {year: int(total / count) for year, (total, count) in self.salariesByYear.items()}
+
+    def DynamicsCountVacancies(self):
+        """
+        Возвращает динамику количества вакансий по годам
+
+        Returns:
+            dict: Динамика количества вакансий по годам
+        """
+        return {year: count for year, (total, count) in self.salariesByYear.items()}
+
+    def DynamicsSalariesAtVacancy(self):
+        """
+        Возвращает динамику уровня зарплат по годам для выбранной профессии
+
+        Returns:
+            dict: Динамика уровня зарплат по годам для выбранной профессии
+        """
+        if not self.salariesByYearAtVacancy:
+            return {year: 0 for year in self.salariesByYear}
+        return {year: int(total / count) for year, (total, count) in self.salariesByYearAtVacancy.items()}
+
+    def DynamicsCountVacanciesAtVacancy(self):
+        """
+        Возвращает динамику количества вакансий по годам для выбранной профессии
+
+        Returns:
+            dict: Динамика количества вакансий по годам для выбранной профессии
+        """
+        if not self.salariesByYearAtVacancy:
+            return {year: 0 for year in self.salariesByYear}
+        return {year: count for year, (total, count) in self.salariesByYearAtVacancy.items()}
+
+    def CitiesSalaryLevel(self):
+        """
+        Возвращает динамику уровня зарплат по городам (в порядке убывания)
+
+        Returns:
+            dict: Динамика уровня зарплат по городам
+        """
+        salariesByArea = {area: int(total / count) for area, (total, count) in self.__ClearByArea().items()}
+        return self.__SortByValue(salariesByArea)
+
+    def CitiesRatioVacancies(self):
+        """
+        Возвращает динамику доли вакансий по городам (в порядке убывания)
+
+        Returns:
+            dict: Доля вакансий по городам (в порядке убывания)
+        """
+        ratioByArea = {area: round(count / self.vacanciesCount, 4)
+                       for area, (total, count) in self.__ClearByArea().items()}
+        return self.__SortByValue(ratioByArea)
+
+    def __ClearByArea(self):
+        """
+        Возваращает суммы зарплат только тех городов,
+        в которых кол-во вакансий больше или равно 1% от общего числа вакансий
+
+        Returns:
+            dict: Сумма и количество зарплат по городам
+        """
+        return {area: data for area, data in self.salariesByArea.items()
+                if data[1] / self.vacanciesCount >= 0.01}
+
+    def __SortByValue(self, dataByArea):
+        """
+        Сортирует данные по городам в порядке убывания значений и оставляет первые citiesLimit городов
+
+        Args:
+            dataByArea (dict): Данные по городам
+
+        Returns:
+            dict: Отсортированные данные по городам
+        """
+        items = sorted(dataByArea.items(), key=lambda item: item[1], reverse=True)
+        return dict(items[:self.citiesLimit])
+
+
+class StreamingDataSet(StatisticsDataSet):
+    """
+    Потоковый агрегатор статистики: читает CSV файл за один проход и хранит только накопленные суммы
+    и количества зарплат по годам, по годам для выбранной профессии и по городам,
+    поэтому без кэша (по умолчанию) занимаемая память зависит от количества годов и городов,
+    а не от количества строк
+    """
+
+    def __init__(self, fileName, vacancyNameParameter, citiesLimit=None, useCache=False):
+        """
+        Инициализирует объект StreamingDataSet
+
+        Args:
+            fileName (str): Название файла
+            vacancyNameParameter (str): Название выбранной профессии
+            citiesLimit (int): Количество выводимых городов (None - все города)
+            useCache (bool): Брать ли корректные строки файла из дискового кэша DatasetCache
+        """
+        super().__init__(fileName, vacancyNameParameter, citiesLimit, useCache)
+        self.__Aggregate(fileName)
+
+    def __Aggregate(self, fileName):
+        """
+        Накапливает суммы и количества зарплат по строкам CSV файла
+
+        Args:
+            fileName (str): Название файла
+        """
+        for name, salaryFrom, salaryTo, salaryCurrency, areaName, publishedAt in self._CsvRows(fileName):
+            salary = self._GetAverage(salaryFrom, salaryTo, salaryCurrency)
+            year = int(publishedAt[0:4])
+            self.__Add(self.salariesByYear, year, salary)
+            if self.vacancyNameParameter in name:
+                self.__Add(self.salariesByYearAtVacancy, year, salary)
+            self.__Add(self.salariesByArea, areaName, salary)
+            self.vacanciesCount += 1
+
+    @staticmethod
+    def __Add(salariesByKey, key, salary):
+        """
+        Добавляет зарплату к сумме и количеству зарплат по ключу
+
+        Args:
+            salariesByKey (dict): Сумма и количество зарплат по ключам
+            key: Ключ (год или город)
+            salary (float): Зарплата
+        """
+        data = salariesByKey.setdefault(key, [0, 0])
+        data[0] += salary
+        data[1] += 1
@@ -1,6 +1,7 @@
+import sys
 import pandas as pd
 from distributorVacancies import DistributorVacancies
-d = DistributorVacancies()
+d = DistributorVacancies(8)
 BDayCurrentMonth = pd.Timestamp.now().replace(day = 1) + pd.offsets.BDay()
 
-d.GetVacanciesCSV(BDayCurrentMonth, 4)
\ No newline at end of file
+d.GetVacanciesCSV(BDayCurrentMonth, 4, checkpoint=False if "--no-checkpoint" in sys.argv else None)
\ No newline at end of file
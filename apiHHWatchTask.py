@@ -0,0 +1,4 @@
+from distributorVacancies import DistributorVacancies
+d = DistributorVacancies(8)
+
+d.Watch()
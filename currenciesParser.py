@@ -1,20 +1,35 @@
+import numpy as np
 import pandas as pd
 import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from xml.etree import ElementTree as ET
 from dataBase import DataBase as DB
+from ratesStore import RatesStore
+from responseCache import ResponseCache
 
 
 class CurrenciesParser:
+    ratesTTL = 30 * 24 * 60 * 60
 
-    def __init__(self, fileName):
+    def __init__(self, fileName, useDataBase=False, fetchThreadsCount=8,
+                 cbrUrl="http://www.cbr.ru/scripts/XML_daily.asp", ratesStore=None, responseCache=None):
         self.fileName = fileName
+        self.useDataBase = useDataBase
+        self.fetchThreadsCount = fetchThreadsCount
+        self.cbrUrl = cbrUrl
+        self.ratesStore = ratesStore or RatesStore()
+        self.responseCache = responseCache
+        self.responseCacheLock = threading.Lock()
         df = pd.read_csv(self.fileName)
         self.df = self.ApplyPreselection(df)
         self.conversionTable = self.CreateConversionTable(self.df)
         self.dbController = DB("ConversionTable")
         self.dbController.CreateDataBase(self.conversionTable,
                                          "date text, USD float, EUR float, KZT float, UAH float, BYR float", True)
-        self.dbCursor = self.dbController.OpenDB()
+        if self.useDataBase:
+            self.dbCursor = self.dbController.OpenDB()
 
     def GetCurrenciesRatio(self, df):
         df = df.copy()
@@ -26,9 +41,7 @@ class CurrenciesParser:
     def GetRangePublications(self, df):
         firstPublication = df['published_at'].min()
         lastPublication = df['published_at'].max()
-        dateRange = [f'{str(date)[0:7]}' for date in
-                     pd.date_range(firstPublication, pd.Timestamp(lastPublication) + pd.offsets.MonthEnd(0), freq="M",
-                                   normalize=True)]
+        dateRange = [str(month) for month in pd.period_range(firstPublication[0:7], lastPublication[0:7], freq="M")]
         return dateRange
 
     def CreateConversionTable(self, df):
@@ -36,26 +49,56 @@ class CurrenciesParser:
         currenciesNames = [curr for curr in df['salary_currency'].unique() if curr != "RUR"]
         currencyDf = pd.DataFrame(index=dateRange, columns=currenciesNames)
         currencyDf.index.names = ["date"]
-        for date in dateRange:
-            y, m = date[0:4], date[5:7]
-            response = requests.get(f'http://www.cbr.ru/scripts/XML_daily.asp?date_req=01/{m}/{y}d1')
-            tree = ET.fromstring(response.content)
-            for curr in tree.iter("Valute"):
-                currName = curr.find("CharCode").text
-                if currName in currenciesNames:
-                    currencyDf.at[date, currName] = float(curr.find('Value').text.replace(',', '.')) / float(
-                        curr.find('Nominal').text)
+        rates = self.ratesStore.GetRates(dateRange, currenciesNames)
+        missingMonths = self.ratesStore.GetMissingMonths(rates, dateRange, currenciesNames)
+        monthsRates = list(zip(missingMonths, self.FetchMonthsRates(missingMonths, currenciesNames)))
+        self.ratesStore.SaveRates(monthsRates, currenciesNames)
+        for date, monthRates in monthsRates:
+            rates.update({(date, currName): None for currName in currenciesNames})
+            rates.update({(date, currName): rate for currName, rate in monthRates})
+        for (date, currName), rate in rates.items():
+            if rate is not None:
+                currencyDf.at[date, currName] = rate
 
         currencyDf.to_csv("ConversionTable.csv")
         return currencyDf
 
+    def FetchMonthsRates(self, months, currenciesNames):
+        if not months:
+            return []
+        with requests.Session() as session, ThreadPoolExecutor(self.fetchThreadsCount) as executor:
+            adapter = HTTPAdapter(pool_maxsize=self.fetchThreadsCount)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            return list(executor.map(lambda date: self.FetchMonthRates(session, date, currenciesNames), months))
+
+    def GetResponseCache(self):
+        with self.responseCacheLock:
+            if self.responseCache is None:
+                self.responseCache = ResponseCache()
+            return self.responseCache
+
+    def FetchMonthRates(self, session, date, currenciesNames):
+        y, m = date[0:4], date[5:7]
+        url = f'{self.cbrUrl}?date_req=01/{m}/{y}d1'
+        content = self.GetResponseCache().Fetch(url, self.ratesTTL,
+                                                lambda headers: session.get(url, headers=headers, timeout=60))
+        tree = ET.fromstring(content)
+        monthRates = []
+        for curr in tree.iter("Valute"):
+            currName = curr.find("CharCode").text
+            if currName in currenciesNames:
+                monthRates.append((currName, float(curr.find('Value').text.replace(',', '.')) / float(
+                    curr.find('Nominal').text)))
+        return monthRates
+
     def ApplyPreselection(self, df):
         df = self.GetCurrenciesRatio(df)
         df = df[df['CurrenciesRatio'] > 5000]
         df.drop(columns="CurrenciesRatio")
         return df
 
-    def ConvertToRub(self, returnFormat):
+    def ConvertToRub(self, returnFormat, saveFile=True):
         # df = pd.read_csv(self.fileName)
         # df = self.ApplyPreselection(df)
         # conversionTable = self.CreateConversionTable(df)
@@ -82,13 +125,18 @@ class CurrenciesParser:
         # df.loc[:,["name", "salary", "area_name","published_at"]].to_csv("ConvertedVacancies.csv", index=False)
         # return df
         df = self.df.copy()
-        df["published_at"] = df["published_at"].transform(lambda x: x[:19])
+        df["published_at"] = df["published_at"].str[:19]
         df["salary"] = df[["salary_from", "salary_to"]].mean(axis=1)
-        df["salary"] = df.apply(lambda x: self.ConvertSalary(x), axis=1)
+        if self.useDataBase:
+            df["salary"] = df.apply(lambda x: self.ConvertSalary(x), axis=1)
+            self.dbController.CloseDB()
+        else:
+            df["salary"] *= self.GetRates(df)
         df = df[df["salary"].notnull()]
         vacanciesDF = df.loc[:, ["name", "salary", "area_name", "published_at"]]
+        if returnFormat == "df" and not saveFile:
+            return vacanciesDF, None
         vacanciesDF.to_csv("ConvertedVacancies.csv", index=False)
-        self.dbController.CloseDB()
         if returnFormat == "df":
             return vacanciesDF, "ConvertedVacancies.csv"
         else:
@@ -96,6 +144,17 @@ class CurrenciesParser:
             vacanciesDB.CreateDataBase(vacanciesDF, "name text, salary float, area_name text, published_at text", False)
             return vacanciesDB
 
+    def GetRates(self, df):
+        rateMatrix = self.conversionTable.to_numpy(dtype=float)
+        monthCodes = self.conversionTable.index.get_indexer(df["published_at"].str[:7])
+        currencyCodes = self.conversionTable.columns.get_indexer(df["salary_currency"])
+        isForeign = (df["salary_currency"] != "RUR").to_numpy()
+        if (monthCodes[isForeign] < 0).any() or (currencyCodes[isForeign] < 0).any():
+            raise KeyError("Нет курса для месяца или валюты вакансии")
+        rates = np.ones(len(df))
+        rates[isForeign] = rateMatrix[monthCodes[isForeign], currencyCodes[isForeign]]
+        return rates
+
     def ConvertSalary(self, row):
         if row["salary_currency"] != "RUR":
             request = f"""SELECT {row['salary_currency']} 
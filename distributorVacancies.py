@@ -1,37 +1,181 @@
+import os
+import csv
+import json
+import math
+import time
 import requests
+import threading
 import pandas as pd
+from collections import deque
+from datetime import timezone, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from harvestPolicy import TokenBucket, RetryPolicy, HarvestStats
+from harvestCheckpoint import HarvestCheckpoint
+from watchState import WatchState
+from responseCache import ResponseCache
 
 class DistributorVacancies:
+    fieldNames = ['name', 'salary_from', 'salary_to', 'salary_currency', 'area_name', 'published_at']
+    tableFieldNames = ['name', 'description', 'key_skills', 'experience_id', 'premium', 'employer_name',
+                       'salary_from', 'salary_to', 'salary_gross', 'salary_currency', 'area_name', 'published_at']
+    maxFound = 2000
+    searchTTL = 10 * 60
+    detailsTTL = 24 * 60 * 60
+    moscowTimeZone = timezone(timedelta(hours=3))
 
-    def GetResponse(self, url):
-        for i in range(1000):
-            response = requests.get(url)
-            if response.ok:
+    def __init__(self, concurrency=1, baseURL="https://api.hh.ru", rateLimiter=None, retryPolicy=None,
+                 responseCache=None):
+        self.concurrency = concurrency
+        self.baseURL = baseURL
+        self.rateLimiter = rateLimiter or TokenBucket()
+        self.retryPolicy = retryPolicy or RetryPolicy()
+        self.responseCache = responseCache
+        self.responseCacheLock = threading.Lock()
+        self.stats = HarvestStats()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=concurrency * 2)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def GetResponseCache(self):
+        with self.responseCacheLock:
+            if self.responseCache is None:
+                self.responseCache = ResponseCache()
+            return self.responseCache
+
+    def GetBody(self, url, ttl):
+        return self.GetResponseCache().Fetch(url, ttl, lambda headers: self.GetResponse(url, headers))
+
+    def GetResponse(self, url, headers=None):
+        for attempt in range(self.retryPolicy.maxRetries + 1):
+            throttleSeconds = self.rateLimiter.Acquire()
+            try:
+                response = self.session.get(url, headers=headers, timeout=30)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                response = None
+            self.stats.Add(requestsCount=1, throttleSeconds=throttleSeconds)
+            if response is not None and response.ok:
+                self.rateLimiter.Increase()
                 print("OK")
                 return response
+            if not self.retryPolicy.IsRetryable(response):
+                response.raise_for_status()
+            if response is not None and response.status_code == 429:
+                self.rateLimiter.Decrease()
+            if attempt < self.retryPolicy.maxRetries:
+                delay = self.retryPolicy.GetDelay(attempt, response)
+                self.stats.Add(retriesCount=1, backoffSeconds=delay)
+                time.sleep(delay)
         raise requests.exceptions.ConnectionError("Сервер не отвечает")
 
-    def GetVacancies(self, timeRange):
+    def GetPageURL(self, timeRange, page=None):
         firstDate, endDate = timeRange
         firstDate, endDate = firstDate.strftime("%Y-%m-%dT%X"), endDate.strftime("%Y-%m-%dT%X")
-        generalURL = f'https://api.hh.ru/vacancies?date_from={firstDate}&date_to={endDate}&specialization=1&per_page=100'
-        generalResponse = self.GetResponse(generalURL)
-        jsonFile = generalResponse.json()
-        pages = jsonFile['pages']
-        vacancies = []
-        for page in range(pages):
-                pageURL = f'https://api.hh.ru/vacancies?date_from={firstDate}&date_to={endDate}&specialization=1&per_page=100&page={page}'
-                vacancies+=self.GetVacanciesByPage(pageURL)
-        print(len(vacancies))
-        return vacancies
+        pageURL = f'{self.baseURL}/vacancies?date_from={firstDate}&date_to={endDate}&specialization=1&per_page=100'
+        return pageURL if page is None else f'{pageURL}&page={page}'
+
+    def GetVacancies(self, timeRange):
+        return [vacancy for *_, vacancies in self.IterPages([timeRange]) for vacancy in vacancies]
+
+    def IterPages(self, timeRanges, adaptive=False, checkpoint=None):
+        with ThreadPoolExecutor(self.concurrency) as executor:
+            if checkpoint:
+                timeRanges = (timeRange for timeRange in timeRanges if not checkpoint.IsDone(timeRange))
+            windows = self.OrderedMap(executor, self.GetFirstPage, timeRanges)
+            if adaptive:
+                windows = (window for timeRange, firstPage in windows
+                           for window in self.SplitWindow(executor, timeRange, firstPage, checkpoint))
+            for timeRange, firstPage in windows:
+                pagesCount = firstPage['pages']
+                pagesDone = checkpoint.GetPagesDone(timeRange) if checkpoint else 0
+                vacanciesCount = 0
+                if pagesDone == 0:
+                    vacancies = self.ParseVacancies(firstPage) if pagesCount else []
+                    vacanciesCount += len(vacancies)
+                    yield timeRange, 0, pagesCount, vacancies
+                pages = range(max(1, pagesDone), pagesCount)
+                pageURLs = (self.GetPageURL(timeRange, page) for page in pages)
+                for page, (pageURL, vacancies) in zip(pages, self.OrderedMap(executor, self.GetVacanciesByPage,
+                                                                             pageURLs)):
+                    vacanciesCount += len(vacancies)
+                    yield timeRange, page, pagesCount, vacancies
+                print(vacanciesCount)
+
+    def GetFirstPage(self, timeRange):
+        return json.loads(self.GetBody(self.GetPageURL(timeRange), self.searchTTL))
+
+    def SplitWindow(self, executor, timeRange, firstPage, checkpoint=None):
+        firstDate, endDate = timeRange
+        partsCount = checkpoint.GetPartsCount(timeRange) if checkpoint else None
+        if partsCount is None:
+            partsCount = 1 if firstPage['found'] <= self.maxFound else \
+                max(2, math.ceil(firstPage['found'] / self.maxFound))
+            if checkpoint:
+                checkpoint.SavePartsCount(timeRange, partsCount)
+        if partsCount == 1:
+            yield timeRange, firstPage
+            return
+        dates = sorted({firstDate + ((endDate - firstDate) * i / partsCount).floor("s") for i in range(partsCount)})
+        parts = list(zip(dates, dates[1:] + [endDate]))
+        if len(parts) < 2:
+            print(f'Окно {firstDate} - {endDate} нельзя разделить, получено {self.maxFound} из {firstPage["found"]}')
+            yield timeRange, firstPage
+            return
+        if checkpoint:
+            parts = [part for part in parts if not checkpoint.IsDone(part)]
+        for part, partFirstPage in zip(parts, executor.map(self.GetFirstPage, parts)):
+            yield from self.SplitWindow(executor, part, partFirstPage, checkpoint)
+
+    def OrderedMap(self, executor, func, items):
+        futures = deque()
+        for item in items:
+            futures.append((item, executor.submit(func, item)))
+            if len(futures) >= self.concurrency * 2:
+                item, future = futures.popleft()
+                yield item, future.result()
+        while futures:
+            item, future = futures.popleft()
+            yield item, future.result()
 
     def GetVacanciesByPage(self, url):
+        return self.ParseVacancies(json.loads(self.GetBody(url, self.searchTTL)))
+
+    def EnrichVacancies(self, executor, vacancies):
+        urls = [f'{self.baseURL}/vacancies/{vacancy["id"]}' for vacancy in vacancies]
+        return [self.ParseDetails(json.loads(body)) for body in executor.map(self.GetDetailsBody, urls)
+                if body is not None]
+
+    def GetDetailsBody(self, url):
+        try:
+            return self.GetBody(url, self.detailsTTL)
+        except requests.exceptions.HTTPError as error:
+            if error.response.status_code == 404:
+                return None
+            raise
+
+    def ParseDetails(self, vacancy):
+        salary = vacancy['salary'] or {}
+        return {'id': vacancy['id'],
+                'name': vacancy['name'],
+                'description': vacancy['description'],
+                'key_skills': "\n".join(skill['name'] for skill in vacancy['key_skills']),
+                'experience_id': vacancy['experience']['id'],
+                'premium': vacancy['premium'],
+                'employer_name': vacancy['employer']['name'],
+                'salary_from': salary.get('from'),
+                'salary_to': salary.get('to'),
+                'salary_gross': salary.get('gross'),
+                'salary_currency': salary.get('currency'),
+                'area_name': vacancy['area']['name'],
+                'published_at': vacancy['published_at']}
+
+    def ParseVacancies(self, pageJson):
         vacanciesByPage = []
-        pageResponse = self.GetResponse(url)
-        pageJson = pageResponse.json()
         for vacancy in pageJson['items']:
             salaryExist = vacancy['salary']
-            tempVacancy = {'name': vacancy['name'],
+            tempVacancy = {'id': vacancy['id'],
+                           'name': vacancy['name'],
                            'salary_from': vacancy['salary']['from'] if salaryExist else None,
                            'salary_to': vacancy['salary']['to'] if salaryExist else None,
                            'salary_currency': vacancy['salary']['currency'] if salaryExist else None,
@@ -40,16 +184,114 @@ class DistributorVacancies:
             vacanciesByPage.append(tempVacancy)
         return vacanciesByPage
 
-    def GetVacanciesCSV(self, date, deltaTimeRange):
-        df = pd.DataFrame()
+    def GetVacanciesCSV(self, date, deltaTimeRange, daysCount=1, adaptive=False, checkpoint=None, withDetails=False):
+        self.stats.Start()
+        if adaptive:
+            deltaTimeRange = 1
+        fileName = "DistributorVacancies.csv"
+        fieldNames = self.tableFieldNames if withDetails else self.fieldNames
+        if checkpoint is None:
+            checkpoint = HarvestCheckpoint()
+        runKey = f'{date.normalize():%Y-%m-%d} {deltaTimeRange} {daysCount} {adaptive} {withDetails}'
+        offset = checkpoint.Start(runKey) if checkpoint else None
+        if offset is None or not os.path.exists(fileName) or os.path.getsize(fileName) < offset:
+            if checkpoint:
+                checkpoint.Reset(runKey)
+            mode = "w"
+        else:
+            print(f'Продолжение прерванной выгрузки с {offset} байта {fileName}')
+            os.truncate(fileName, offset)
+            mode = "a"
+        with open(fileName, mode, encoding="utf-8", newline="") as file, \
+                ThreadPoolExecutor(self.concurrency) as detailsExecutor:
+            writer = csv.writer(file, lineterminator=os.linesep)
+            if mode == "w":
+                writer.writerow(fieldNames)
+            timeRanges = self.GetTimeRanges(date, deltaTimeRange, daysCount)
+            for timeRange, page, pagesCount, vacancies in self.IterPages(timeRanges, adaptive, checkpoint or None):
+                if withDetails:
+                    vacancies = self.EnrichVacancies(detailsExecutor, vacancies)
+                writer.writerows([self.FormatField(vacancy[field]) for field in fieldNames]
+                                 for vacancy in vacancies)
+                file.flush()
+                if checkpoint:
+                    checkpoint.SavePage(timeRange, page, pagesCount, file.tell())
+        if checkpoint:
+            checkpoint.Finish()
+        print(self.stats.Report())
+
+    def Watch(self, since=None, interval=60, overlap=pd.Timedelta(minutes=10), outputDir="Vacancies",
+              watchState=None, pollsCount=None, seenRetention=pd.Timedelta(days=30)):
+        watchState = watchState or WatchState()
+        highWaterMark, offsets = watchState.Load()
+        dateFrom = pd.Timestamp(highWaterMark) - overlap if highWaterMark else \
+            (since or self.GetMoscowNow().normalize())
+        os.makedirs(outputDir, exist_ok=True)
+        for fileName, offset in offsets.items():
+            if os.path.exists(fileName) and os.path.getsize(fileName) > offset:
+                os.truncate(fileName, offset)
+        poll = 0
+        while pollsCount is None or poll < pollsCount:
+            if poll:
+                time.sleep(interval)
+            poll += 1
+            self.stats.Start()
+            dateTo = self.GetMoscowNow().floor("s")
+            newVacancies, pollIds = [], {}
+            for *_, vacancies in self.IterPages([(dateFrom, dateTo)], adaptive=True):
+                seenIds = watchState.GetSeenIds({int(vacancy['id']) for vacancy in vacancies} - pollIds.keys())
+                for vacancy in vacancies:
+                    vacancyId = int(vacancy['id'])
+                    if vacancyId in pollIds:
+                        continue
+                    pollIds[vacancyId] = self.GetMoscowTime(vacancy['published_at'])
+                    if vacancyId not in seenIds:
+                        newVacancies.append(vacancy)
+            offsets.update(self.AppendPartitions(outputDir, newVacancies, offsets))
+            keepSince = (dateTo - overlap - seenRetention).strftime("%Y-%m-%dT%X")
+            watchState.Save(dateTo.strftime("%Y-%m-%dT%X"), pollIds.items(), offsets, keepSince)
+            print(f'{dateTo}: новых вакансий {len(newVacancies)}')
+            print(self.stats.Report())
+            dateFrom = dateTo - overlap
+
+    def GetMoscowNow(self):
+        return pd.Timestamp.now(tz=self.moscowTimeZone).tz_localize(None)
+
+    def GetMoscowTime(self, publishedAt):
+        return pd.Timestamp(publishedAt).tz_convert(self.moscowTimeZone).strftime("%Y-%m-%dT%X")
+
+    def AppendPartitions(self, outputDir, vacancies, offsets):
+        partitions = {}
+        for vacancy in vacancies:
+            partitions.setdefault(self.GetMoscowTime(vacancy['published_at'])[0:10], []).append(vacancy)
+        newOffsets = {}
+        for day, dayVacancies in sorted(partitions.items()):
+            fileName = os.path.join(outputDir, f'{day}.csv')
+            with open(fileName, "a", encoding="utf-8", newline="") as file:
+                writer = csv.writer(file, lineterminator=os.linesep)
+                if file.tell() == 0:
+                    writer.writerow(self.fieldNames)
+                writer.writerows([self.FormatField(vacancy[field]) for field in self.fieldNames]
+                                 for vacancy in dayVacancies)
+                newOffsets[fileName] = file.tell()
+        return newOffsets
+
+    def FormatField(self, value):
+        if value is None:
+            return ""
+        if isinstance(value, float):
+            return repr(value)
+        if isinstance(value, int) and not isinstance(value, bool):
+            return str(value)
+        return value
+
+    def GetTimeRanges(self, date, deltaTimeRange, daysCount=1):
         date = date.normalize()
         multiplyHour = int(24 / deltaTimeRange)
-        for i in range(deltaTimeRange):
+        for i in range(deltaTimeRange * daysCount):
             timeRange = self.GetTimeRange(date, multiplyHour)
             date = timeRange[1]
-            df = pd.concat([df, pd.DataFrame(self.GetVacancies(timeRange))])
-
-        df.to_csv("DistributorVacancies.csv", index=False)
+            yield timeRange
 
     def GetTimeRange(self, date, multiplyHour):
-        return pd.date_range(date, periods=2, freq=f'{multiplyHour}H')
+        return pd.date_range(date, periods=2, freq=pd.Timedelta(hours=multiplyHour))
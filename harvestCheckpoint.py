@@ -0,0 +1,78 @@
+import os
+import sqlite3
+from contextlib import closing
+
+
+class HarvestCheckpoint:
+
+    def __init__(self, dbName=None):
+        self.dbName = dbName or os.environ.get("HARVEST_CHECKPOINT_DB", "HarvestCheckpoint.db")
+
+    def Connect(self):
+        db = sqlite3.connect(self.dbName)
+        db.execute("CREATE TABLE IF NOT EXISTS State (key text PRIMARY KEY, value text)")
+        db.execute("""CREATE TABLE
+            IF NOT EXISTS Windows
+            (dateFrom text, dateTo text, pagesDone integer, pages integer, PRIMARY KEY (dateFrom, dateTo))
+            """)
+        db.execute("""CREATE TABLE
+            IF NOT EXISTS Splits
+            (dateFrom text, dateTo text, partsCount integer, PRIMARY KEY (dateFrom, dateTo))
+            """)
+        return db
+
+    def Start(self, runKey):
+        with closing(self.Connect()) as db, db:
+            state = dict(db.execute("SELECT key, value FROM State").fetchall())
+        if state.get("run") != runKey or "offset" not in state:
+            return None
+        return int(state["offset"])
+
+    def Reset(self, runKey):
+        with closing(self.Connect()) as db, db:
+            db.execute("DELETE FROM Windows")
+            db.execute("DELETE FROM Splits")
+            db.execute("DELETE FROM State")
+            db.execute("INSERT INTO State (key, value) VALUES ('run', ?)", (runKey,))
+
+    def Finish(self):
+        if os.path.exists(self.dbName):
+            os.remove(self.dbName)
+
+    def GetPagesDone(self, timeRange):
+        with closing(self.Connect()) as db:
+            row = db.execute("SELECT pagesDone FROM Windows WHERE dateFrom = ? AND dateTo = ?",
+                             self.GetKey(timeRange)).fetchone()
+        return row[0] if row else 0
+
+    def IsDone(self, timeRange):
+        dateFrom, dateTo = self.GetKey(timeRange)
+        with closing(self.Connect()) as db:
+            rows = db.execute("""SELECT dateFrom, dateTo FROM Windows
+                WHERE pagesDone >= MAX(pages, 1) AND dateFrom >= ? AND dateTo <= ? ORDER BY dateFrom
+                """, (dateFrom, dateTo)).fetchall()
+        position = dateFrom
+        for windowFrom, windowTo in rows:
+            if windowFrom <= position:
+                position = max(position, windowTo)
+        return position >= dateTo
+
+    def GetPartsCount(self, timeRange):
+        with closing(self.Connect()) as db:
+            row = db.execute("SELECT partsCount FROM Splits WHERE dateFrom = ? AND dateTo = ?",
+                             self.GetKey(timeRange)).fetchone()
+        return row[0] if row else None
+
+    def SavePartsCount(self, timeRange, partsCount):
+        with closing(self.Connect()) as db, db:
+            db.execute("INSERT OR REPLACE INTO Splits (dateFrom, dateTo, partsCount) VALUES (?, ?, ?)",
+                       (*self.GetKey(timeRange), partsCount))
+
+    def SavePage(self, timeRange, page, pages, offset):
+        with closing(self.Connect()) as db, db:
+            db.execute("INSERT OR REPLACE INTO Windows (dateFrom, dateTo, pagesDone, pages) VALUES (?, ?, ?, ?)",
+                       (*self.GetKey(timeRange), page + 1, pages))
+            db.execute("INSERT OR REPLACE INTO State (key, value) VALUES ('offset', ?)", (str(offset),))
+
+    def GetKey(self, timeRange):
+        return tuple(date.strftime("%Y-%m-%dT%X") for date in timeRange)
@@ -0,0 +1,99 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+
+class TokenBucket:
+
+    def __init__(self, rate=10, maxRate=100, minRate=0.5, increaseStep=0.05, decreaseInterval=1):
+        self.rate = rate
+        self.maxRate = maxRate
+        self.minRate = minRate
+        self.increaseStep = increaseStep
+        self.decreaseInterval = decreaseInterval
+        self.nextAt = time.monotonic()
+        self.decreasedAt = self.nextAt - decreaseInterval
+        self.lock = threading.Lock()
+
+    def Acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            startAt = max(now, self.nextAt)
+            self.nextAt = startAt + 1 / self.rate
+        wait = startAt - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def Increase(self):
+        with self.lock:
+            self.rate = min(self.maxRate, self.rate * (1 + self.increaseStep))
+
+    def Decrease(self):
+        with self.lock:
+            now = time.monotonic()
+            if now - self.decreasedAt >= self.decreaseInterval:
+                self.rate = max(self.minRate, self.rate / 2)
+                self.decreasedAt = now
+
+
+class RetryPolicy:
+
+    def __init__(self, maxRetries=10, baseDelay=0.5, maxDelay=60, seed=None):
+        self.maxRetries = maxRetries
+        self.baseDelay = baseDelay
+        self.maxDelay = maxDelay
+        self.random = random.Random(seed)
+
+    def IsRetryable(self, response):
+        return response is None or response.status_code == 429 or response.status_code >= 500
+
+    def GetDelay(self, attempt, response=None):
+        retryAfter = self.GetRetryAfter(response)
+        if retryAfter is not None:
+            return min(self.maxDelay, retryAfter)
+        delay = min(self.maxDelay, self.baseDelay * 2 ** attempt)
+        return delay / 2 + self.random.uniform(0, delay / 2)
+
+    def GetRetryAfter(self, response):
+        retryAfter = response.headers.get("Retry-After") if response is not None else None
+        if not retryAfter:
+            return None
+        try:
+            return max(0.0, float(retryAfter))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(retryAfter) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+
+class HarvestStats:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.Start()
+
+    def Start(self):
+        with self.lock:
+            self.requestsCount = 0
+            self.retriesCount = 0
+            self.backoffSeconds = 0.0
+            self.throttleSeconds = 0.0
+            self.startedAt = time.monotonic()
+
+    def Add(self, requestsCount=0, retriesCount=0, backoffSeconds=0.0, throttleSeconds=0.0):
+        with self.lock:
+            self.requestsCount += requestsCount
+            self.retriesCount += retriesCount
+            self.backoffSeconds += backoffSeconds
+            self.throttleSeconds += throttleSeconds
+
+    def Report(self):
+        seconds = time.monotonic() - self.startedAt
+        return f'Запросов: {self.requestsCount}, повторов: {self.retriesCount}, ' \
+               f'ожидание после ошибок: {self.backoffSeconds:.1f} с, ожидание лимита: {self.throttleSeconds:.1f} с, ' \
+               f'скорость: {self.requestsCount / seconds if seconds else 0:.1f} запросов/с за {seconds:.1f} с'
@@ -0,0 +1,37 @@
+import sqlite3
+from contextlib import closing
+from datetime import date
+
+
+class RatesStore:
+
+    def __init__(self, dbName="RatesStore.db"):
+        self.dbName = dbName
+        with closing(sqlite3.connect(self.dbName)) as db, db:
+            db.execute("""CREATE TABLE
+                IF NOT EXISTS Rates
+                (month text, currency text, rate float, PRIMARY KEY (month, currency))
+                """)
+
+    def GetRates(self, months, currenciesNames, chunkSize=500):
+        months, currenciesNames = list(dict.fromkeys(months)), list(dict.fromkeys(currenciesNames))
+        rates = {}
+        if not currenciesNames:
+            return rates
+        with closing(sqlite3.connect(self.dbName)) as db:
+            for start in range(0, len(months), chunkSize):
+                chunk = months[start:start + chunkSize]
+                rates.update(((month, currency), rate) for month, currency, rate in db.execute(
+                    f'SELECT month, currency, rate FROM Rates WHERE month IN ({",".join("?" * len(chunk))}) '
+                    f'AND currency IN ({",".join("?" * len(currenciesNames))})', chunk + currenciesNames))
+        return rates
+
+    def GetMissingMonths(self, rates, months, currenciesNames):
+        return [month for month in months if any((month, currency) not in rates for currency in currenciesNames)]
+
+    def SaveRates(self, monthsRates, currenciesNames):
+        today = date.today().isoformat()
+        rows = [(month, currency, dict(monthRates).get(currency)) for month, monthRates in monthsRates
+                if f'{month}-01' <= today for currency in currenciesNames]
+        with closing(sqlite3.connect(self.dbName)) as db, db:
+            db.executemany("INSERT OR REPLACE INTO Rates (month, currency, rate) VALUES (?, ?, ?)", rows)
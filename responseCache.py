@@ -0,0 +1,108 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+CachedResponse = namedtuple("CachedResponse", ["body", "etag", "lastModified", "storedAt", "usedAt"])
+
+
+class ResponseCache:
+
+    def __init__(self, dbName="ResponseCache.db", maxBytes=None, touchInterval=60):
+        self.dbName = dbName
+        self.maxBytes = maxBytes or int(os.environ.get("RESPONSE_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+        self.touchInterval = touchInterval
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        db = self.Connect()
+        with db:
+            db.execute("""CREATE TABLE
+                IF NOT EXISTS CachedResponses
+                (key text PRIMARY KEY, url text, body blob, etag text, lastModified text,
+                storedAt float, usedAt float, size integer)
+                """)
+            db.execute("CREATE INDEX IF NOT EXISTS CachedResponsesUsedAt ON CachedResponses (usedAt)")
+        self.totalBytes = db.execute("SELECT COALESCE(SUM(size), 0) FROM CachedResponses").fetchone()[0]
+
+    def Connect(self):
+        db = getattr(self.local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.dbName, timeout=60)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self.local.db = db
+        return db
+
+    def Fetch(self, url, ttl, get):
+        cached = self.Load(url)
+        if cached and time.time() - cached.storedAt < ttl:
+            return cached.body
+        response = get(self.GetValidators(cached))
+        if cached and response.status_code == 304:
+            self.Refresh(url)
+            return cached.body
+        if response.status_code == 200:
+            self.Store(url, response.content, response.headers)
+        return response.content
+
+    def Load(self, url):
+        db = self.Connect()
+        row = db.execute("SELECT body, etag, lastModified, storedAt, usedAt FROM CachedResponses WHERE key = ?",
+                         (self.GetKey(url),)).fetchone()
+        if row is None:
+            return None
+        cached = CachedResponse(*row)
+        now = time.time()
+        if now - cached.usedAt >= self.touchInterval:
+            with db:
+                db.execute("UPDATE CachedResponses SET usedAt = ? WHERE key = ?", (now, self.GetKey(url)))
+        return cached
+
+    def GetValidators(self, cached):
+        headers = {}
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached and cached.lastModified:
+            headers["If-Modified-Since"] = cached.lastModified
+        return headers
+
+    def Store(self, url, body, headers):
+        now = time.time()
+        db = self.Connect()
+        with self.lock:
+            with db:
+                replaced = db.execute("SELECT size FROM CachedResponses WHERE key = ?",
+                                      (self.GetKey(url),)).fetchone()
+                db.execute("""INSERT OR REPLACE INTO CachedResponses
+                    (key, url, body, etag, lastModified, storedAt, usedAt, size) VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                           (self.GetKey(url), url, body, headers.get("ETag"), headers.get("Last-Modified"), now, now,
+                            len(body)))
+            self.totalBytes += len(body) - (replaced[0] if replaced else 0)
+            if self.totalBytes > self.maxBytes:
+                self.Evict(db)
+
+    def Refresh(self, url):
+        now = time.time()
+        db = self.Connect()
+        with db:
+            db.execute("UPDATE CachedResponses SET storedAt = ?, usedAt = ? WHERE key = ?", (now, now, self.GetKey(url)))
+
+    def Evict(self, db):
+        totalBytes = db.execute("SELECT COALESCE(SUM(size), 0) FROM CachedResponses").fetchone()[0]
+        if totalBytes <= self.maxBytes:
+            self.totalBytes = totalBytes
+            return
+        evictedKeys = []
+        for key, size in db.execute("SELECT key, size FROM CachedResponses ORDER BY usedAt"):
+            if totalBytes <= self.maxBytes * 0.9:
+                break
+            evictedKeys.append((key,))
+            totalBytes -= size
+        with db:
+            db.executemany("DELETE FROM CachedResponses WHERE key = ?", evictedKeys)
+        self.totalBytes = totalBytes
+
+    def GetKey(self, url):
+        return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
@@ -0,0 +1,41 @@
+import sqlite3
+from contextlib import closing
+
+
+class WatchState:
+
+    def __init__(self, dbName="WatchState.db"):
+        self.dbName = dbName
+        with closing(sqlite3.connect(self.dbName)) as db, db:
+            db.execute("CREATE TABLE IF NOT EXISTS State (key text PRIMARY KEY, value text)")
+            db.execute("CREATE TABLE IF NOT EXISTS SeenIds (id integer PRIMARY KEY, publishedAt text, seenAt text)")
+            db.execute("CREATE TABLE IF NOT EXISTS Partitions (fileName text PRIMARY KEY, offset integer)")
+            if "seenAt" not in [column for _, column, *_ in db.execute("PRAGMA table_info(SeenIds)")]:
+                db.execute("ALTER TABLE SeenIds ADD COLUMN seenAt text")
+                db.execute("UPDATE SeenIds SET seenAt = (SELECT value FROM State WHERE key = 'highWaterMark')")
+            db.execute("CREATE INDEX IF NOT EXISTS SeenIdsBySeenAt ON SeenIds (seenAt)")
+
+    def Load(self):
+        with closing(sqlite3.connect(self.dbName)) as db:
+            state = dict(db.execute("SELECT key, value FROM State").fetchall())
+            offsets = dict(db.execute("SELECT fileName, offset FROM Partitions").fetchall())
+        return state.get("highWaterMark"), offsets
+
+    def GetSeenIds(self, ids, chunkSize=500):
+        ids = list(ids)
+        seenIds = set()
+        with closing(sqlite3.connect(self.dbName)) as db:
+            for start in range(0, len(ids), chunkSize):
+                chunk = ids[start:start + chunkSize]
+                seenIds.update(vacancyId for vacancyId, in db.execute(
+                    f'SELECT id FROM SeenIds WHERE id IN ({",".join("?" * len(chunk))})', chunk))
+        return seenIds
+
+    def Save(self, highWaterMark, ids, offsets, keepSince):
+        with closing(sqlite3.connect(self.dbName)) as db, db:
+            db.execute("INSERT OR REPLACE INTO State (key, value) VALUES ('highWaterMark', ?)", (highWaterMark,))
+            db.executemany("""INSERT INTO SeenIds (id, publishedAt, seenAt) VALUES (?, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET publishedAt = excluded.publishedAt, seenAt = excluded.seenAt
+                """, ((vacancyId, publishedAt, highWaterMark) for vacancyId, publishedAt in ids))
+            db.execute("DELETE FROM SeenIds WHERE seenAt < ?", (keepSince,))
+            db.executemany("INSERT OR REPLACE INTO Partitions (fileName, offset) VALUES (?, ?)", offsets.items())